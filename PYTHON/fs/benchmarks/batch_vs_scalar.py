@@ -0,0 +1,79 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# The benchmark of the batch functions of the module fareybatch.py against a loop over the scalar functions
+# of the module fareypairs.py.
+#
+# For every batch size (see the option --sizes) the benchmark takes random members of the sequence Fm of the order --order
+# (other than 1/1), and it times
+#    the loop: [fareypairs.successor_in_Fm(m, x) for x in batch];
+#    the batch: fareybatch.successor_in_Fm(m, numerators, denominators), on the NumPy arrays of the same fractions;
+# and it does the same for the functions predecessor_in_Fm (on the members other than 0/1).
+# The results of the two are compared element by element before they are timed. Requires NumPy.
+#
+# Run for instance (from this directory):
+#    python batch_vs_scalar.py --order 1000000 --sizes 1000 100000
+
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from math import gcd
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'fs'))
+
+import fareybatch
+import fareypairs
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="The batch functions against a loop over the scalar functions")
+    parser.add_argument('--order', type=int, default=10 ** 6)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    m = args.order
+    generator = random.Random(args.seed)
+    print('%20s %10s %14s %14s %10s' % ('function', 'size', 'loop, s', 'batch, s', 'speedup'))
+    for size in args.sizes:
+        batch = __random_members_of_Fm(m, size, generator)
+        numerators = np.array([h for h, _ in batch], dtype=np.int64)
+        denominators = np.array([k for _, k in batch], dtype=np.int64)
+        for name in ('successor_in_Fm', 'predecessor_in_Fm'):
+            scalar = getattr(fareypairs, name)
+            vectorized = getattr(fareybatch, name)
+            h, k, status = vectorized(m, numerators, denominators)
+            assert not status.any() and list(zip(h.tolist(), k.tolist())) == [scalar(m, x) for x in batch]
+            loop = __time(lambda: [scalar(m, x) for x in batch], args.repeat)
+            vector = __time(lambda: vectorized(m, numerators, denominators), args.repeat)
+            print('%20s %10d %14.3g %14.3g %10.1f' % (name, size, loop, vector, loop / vector))
+    return 0
+
+
+def __random_members_of_Fm(m: int, size: int, generator: random.Random) -> list[tuple[int, int]]:
+    # Random reduced fractions of Fm strictly between 0/1 and 1/1, so that both functions accept all of them
+    batch = []
+    while len(batch) < size:
+        k = generator.randrange(2, m + 1)
+        h = generator.randrange(1, k)
+        if gcd(h, k) == 1:
+            batch.append((h, k))
+    return batch
+
+
+def __time(call, repeat: int) -> float:
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < 0.05:
+        number *= 4
+    return min(timer.repeat(repeat, number)) / number
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# The benchmark of the reference points ceil((a * m + 2) / b) of the seed functions: the former float round-trip
+# math.ceil((a * m + 2) / b) against the exact integer division -(-(a * m + 2) // b) now used by the modules
+# fareysequences.py and fareypairs.py.
+#
+# For every order m == 10^3, 10^6, 10^9, 10^12, 10^15, 10^18 (see the option --orders) the benchmark takes --count random
+# reduced fractions a/b with 0 < a < b <= m, and it reports
+#    the time per reference point of the float round-trip, and of the exact division;
+#    the share of the reference points where the float round-trip differs from the exact value.
+#
+# Run for instance (from this directory):
+#    python ceil_division.py --orders 1000000 1000000000000000000
+
+
+import argparse
+import random
+import sys
+import timeit
+from math import ceil, gcd
+
+
+def float_ceil(a: int, b: int, m: int) -> int:
+    return ceil((a * m + 2) / b)
+
+
+def exact_ceil(a: int, b: int, m: int) -> int:
+    return -(-(a * m + 2) // b)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="The float round-trip against the exact integer ceiling division")
+    parser.add_argument('--orders', type=int, nargs='+', default=[10 ** e for e in range(3, 19, 3)])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    generator = random.Random(args.seed)
+    print('%22s %16s %16s %14s' % ('m', 'float, ns', 'exact, ns', 'float wrong'))
+    for m in args.orders:
+        sample = __random_fractions(m, args.count, generator)
+        wrong = sum(float_ceil(a, b, m) != exact_ceil(a, b, m) for a, b in sample)
+        float_time = __time(lambda: [float_ceil(a, b, m) for a, b in sample], args.repeat) / len(sample)
+        exact_time = __time(lambda: [exact_ceil(a, b, m) for a, b in sample], args.repeat) / len(sample)
+        print('%22d %16.1f %16.1f %13.1f%%' % (m, float_time * 1e9, exact_time * 1e9, 100 * wrong / len(sample)))
+    return 0
+
+
+def __random_fractions(m: int, count: int, generator: random.Random) -> list[tuple[int, int]]:
+    sample = []
+    while len(sample) < count:
+        b = generator.randrange(2, m + 1)
+        a = generator.randrange(1, b)
+        if gcd(a, b) == 1:
+            sample.append((a, b))
+    return sample
+
+
+def __time(call, repeat: int) -> float:
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < 0.05:
+        number *= 4
+    return min(timer.repeat(repeat, number)) / number
+
+
+if __name__ == '__main__':
+    sys.exit(main())
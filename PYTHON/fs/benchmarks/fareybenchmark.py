@@ -0,0 +1,183 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# An offline benchmark harness for the sixteen exported functions of the module fareysequences.py (or, with the option
+# --module fareypairs, of the module fareypairs.py).
+#
+# For every order m == 10, 10^2, ..., 10^9 (see the option --orders) and for every personage Fm, Fml, Gml, FBnm
+# and FB2mm (with the parameters (m), (m, m // 2), (m, m // 2), (m, m // 3) and (m, m // 2), respectively),
+# the harness times
+#    the functions of the form `predecessor_in_personage' and `successor_in_personage', at a fraction x
+#    of the sequence with a large denominator (the predecessor of 1/2 in the sequence);
+#    the functions of the form `predecessor_of_pair_of_neighbors_in_personage' and
+#    `successor_of_pair_of_neighbors_in_personage' at the pairs of neighbors around x, with check_pair == True
+#    and check_pair == False.
+# For the orders whose sequences have at most --max-terms fractions, it also times the enumeration of the whole
+# sequence by the generators of the module fareyiterators.py, and measures its peak memory by tracemalloc: the generators
+# of the form `iter_personage', that yield instances of the class Fraction, for the module fareysequences.py, and
+# the generators of the form `iter_pairs_personage', that yield the pairs (h, k), for the module fareypairs.py.
+# The inputs are fixed, so two runs on the same machine time the same work.
+#
+# Every timing is the least, over --repeat runs, of the mean time of a call in a run of about 0.05 seconds.
+# The results are written in JSON:
+#    {"meta": {...}, "results": {"successor_in_Fm[m=1000000]": {"seconds": ...}, ...}},
+# and the command `compare' reports the benchmarks that have become slower (or more memory-hungry)
+# than in a baseline by more than --threshold (a relative tolerance), and exits with the status 1 if there are any.
+#
+# Run for instance (from this directory):
+#    python fareybenchmark.py run --output baseline.json
+#    python fareybenchmark.py run --output current.json
+#    python fareybenchmark.py compare baseline.json current.json --threshold 0.25
+
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'fs'))
+
+import fareycounting
+import fareyiterators
+import fareypairs
+
+
+def run(module_name: str = 'fareysequences', orders: tuple = tuple(10 ** e for e in range(1, 10)),
+        repeat: int = 5, max_terms: int = 10 ** 6) -> dict:
+    module = importlib.import_module(module_name)
+    as_input = __as_pair if module_name == 'fareypairs' else __as_fraction
+    results = {}
+    for m in orders:
+        for personage, name, params in __personages(m):
+            label = '[' + ','.join(k + '=' + str(v) for k, v in zip(__parameter_names[personage], params)) + ']'
+            x, left, right = __neighbors_of_test_fraction(personage, params)
+            predecessor_in = getattr(module, 'predecessor_in_' + personage)
+            successor_in = getattr(module, 'successor_in_' + personage)
+            predecessor_of_pair = getattr(module, 'predecessor_of_pair_of_neighbors_in_' + personage)
+            successor_of_pair = getattr(module, 'successor_of_pair_of_neighbors_in_' + personage)
+            x, left, right = as_input(x), as_input(left), as_input(right)
+            calls = {'predecessor_in_' + name: lambda: predecessor_in(*params, x),
+                     'successor_in_' + name: lambda: successor_in(*params, x)}
+            for check_pair in (True, False):
+                suffix = '(check_pair=' + str(check_pair) + ')'
+                calls['predecessor_of_pair_of_neighbors_in_' + name + suffix] = \
+                    lambda check_pair=check_pair: predecessor_of_pair(*params, x, right, check_pair)
+                calls['successor_of_pair_of_neighbors_in_' + name + suffix] = \
+                    lambda check_pair=check_pair: successor_of_pair(*params, left, x, check_pair)
+            for key, call in calls.items():
+                results[key + label] = {'seconds': __time_call(call, repeat)}
+            if __lengths[personage](*params) <= max_terms:
+                iterate = getattr(fareyiterators, ('iter_pairs_' if module_name == 'fareypairs' else 'iter_') + personage)
+                results['iterate_' + name + label] = __time_iteration(iterate, params, repeat)
+    return {'meta': {'module': module_name, 'python': sys.version, 'platform': platform.platform(),
+                     'repeat': repeat, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25) -> list[tuple[str, str, float, float]]:
+    # Returns the list of the regressions (benchmark, metric, baseline value, current value)
+    regressions = []
+    for key, old in baseline['results'].items():
+        new = current['results'].get(key)
+        if new is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if (metric in old) and (metric in new) and (new[metric] > old[metric] * (1 + threshold)):
+                regressions.append((key, metric, old[metric], new[metric]))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the Farey sequence functions")
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help="time the functions and write the results in JSON")
+    run_parser.add_argument('--module', default='fareysequences', choices=('fareysequences', 'fareypairs'))
+    run_parser.add_argument('--orders', type=int, nargs='+', default=[10 ** e for e in range(1, 10)])
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--max-terms', type=int, default=10 ** 6)
+    run_parser.add_argument('--output', default='-', help="a file name, or - for the standard output")
+    compare_parser = commands.add_parser('compare', help="flag the regressions against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.25)
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        results = run(args.module, tuple(args.orders), args.repeat, args.max_terms)
+        text = json.dumps(results, indent=1, sort_keys=True)
+        if args.output == '-':
+            print(text)
+        else:
+            with open(args.output, 'w') as output:
+                output.write(text + '\n')
+        return 0
+    with open(args.baseline) as baseline, open(args.current) as current:
+        regressions = compare(json.load(baseline), json.load(current), args.threshold)
+    for key, metric, old, new in regressions:
+        print('REGRESSION ' + key + ' ' + metric + ': ' + format(old, '.4g') + ' -> ' + format(new, '.4g') +
+              ' (x' + format(new / old, '.2f') + ')')
+    if not regressions:
+        print('No regressions beyond the threshold ' + str(args.threshold))
+    return 1 if regressions else 0
+
+
+__parameter_names = {'Fm': ('m',), 'Fml': ('m', 'l'), 'Gml': ('m', 'l'), 'FBnm': ('n', 'm')}
+
+__lengths = {'Fm': fareycounting.length_of_Fm,
+             'Fml': fareycounting.length_of_Fml,
+             'Gml': fareycounting.length_of_Gml,
+             'FBnm': fareycounting.length_of_FBnm}
+
+
+def __personages(m: int) -> list[tuple[str, str, tuple]]:
+    # (the suffix of the function names, the name of the benchmark, the parameters of the sequence)
+    return [('Fm', 'Fm', (m,)),
+            ('Fml', 'Fml', (m, m // 2)),
+            ('Gml', 'Gml', (m, m // 2)),
+            ('FBnm', 'FBnm', (m, m // 3)),
+            ('FBnm', 'FB2mm', (2 * (m // 2), m // 2))]
+
+
+def __neighbors_of_test_fraction(personage: str, params: tuple) -> tuple:
+    # The predecessor x of 1/2 in the sequence, and the left and right neighbors of x
+    predecessor_in = getattr(fareypairs, 'predecessor_in_' + personage)
+    x = predecessor_in(*params, (1, 2))
+    left = predecessor_in(*params, x)
+    return x, left, (1, 2)
+
+
+def __as_pair(pair: tuple) -> tuple:
+    return pair
+
+
+def __as_fraction(pair: tuple) -> Fraction:
+    return Fraction(*pair)
+
+
+def __time_call(call, repeat: int) -> float:
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < 0.05:
+        number *= 4
+    return min(timer.repeat(repeat, number)) / number
+
+
+def __time_iteration(iterate, params: tuple, repeat: int) -> dict:
+    seconds = __time_call(lambda: sum(1 for _ in iterate(*params)), repeat)
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iterate(*params))
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'terms': count, 'peak_bytes': peak_bytes}
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# The benchmark of the search for the numerator of a neighboring fraction: the former linear scan of the search interval
+# against the modular inversion now used by the functions of the modules fareysequences.py and fareypairs.py.
+#
+# For every order m == 10^2, 10^3, ..., 10^6 (see the option --orders) the benchmark takes the fraction x = a/b
+# of the sequence Fm, among the 64 fractions preceding 1/3, whose numerator is the farthest from the beginning
+# of its search interval (so the scan has the most candidates to inspect), and it times
+#    the scan: the first x' of the search interval [lower, lower + a - 1] such that (b * x' - 1) is divisible by a,
+#    found by the generator expression that the module fareysequences.py used to have;
+#    the inversion: the representative of the residue class of b^(-1) (mod a) in the same interval;
+#    the whole call successor_in_Fm(m, x) of the module fareysequences.py.
+# The scan inspects up to a candidates, so its time grows linearly with m, while the inversion takes O(log m) operations.
+#
+# Run for instance (from this directory):
+#    python numerator_search.py --orders 1000 1000000
+
+
+import argparse
+import os
+import sys
+import timeit
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'fs'))
+
+import fareypairs
+import fareysequences
+
+
+def scan(lower: int, a: int, b: int) -> int:
+    return next(filter(lambda x: (b * x - 1) % a == 0, range(lower, lower + a)))
+
+
+def inversion(lower: int, a: int, b: int) -> int:
+    return lower + (pow(b, -1, a) - lower) % a
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="The linear scan against the modular inversion")
+    parser.add_argument('--orders', type=int, nargs='+', default=[10 ** e for e in range(2, 7)])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+    print('%10s %16s %14s %14s %18s' % ('m', 'x', 'scan, s', 'inversion, s', 'successor_in_Fm, s'))
+    for m in args.orders:
+        a, b, lower = __slowest_fraction_to_scan(m)
+        assert scan(lower, a, b) == inversion(lower, a, b)
+        x = Fraction(a, b)
+        print('%10d %16s %14.3g %14.3g %18.3g' % (m, str(x), __time(lambda: scan(lower, a, b), args.repeat),
+                                               __time(lambda: inversion(lower, a, b), args.repeat),
+                                               __time(lambda: fareysequences.successor_in_Fm(m, x), args.repeat)))
+    return 0
+
+
+def __slowest_fraction_to_scan(m: int) -> tuple[int, int, int]:
+    # (a, b, the beginning of the search interval of the numerator of the successor of a/b in Fm)
+    candidates = []
+    fraction = (1, 3)
+    for _ in range(64):
+        fraction = fareypairs.predecessor_in_Fm(m, fraction)
+        a, b = fraction
+        if a == 0:
+            break
+        lower = -(-(a * m + 2) // b) - a
+        candidates.append((inversion(lower, a, b) - lower, a, b, lower))
+    _, a, b, lower = max(candidates)
+    return a, b, lower
+
+
+def __time(call, repeat: int) -> float:
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < 0.05:
+        number *= 4
+    return min(timer.repeat(repeat, number)) / number
+
+
+if __name__ == '__main__':
+    sys.exit(main())
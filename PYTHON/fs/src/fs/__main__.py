@@ -1,79 +1,318 @@
-from fractions import Fraction
-from fareysequences import (predecessor_in_Fm,
-                            successor_in_Fm,
-                            predecessor_in_Fml,
-                            successor_in_Fml,
-                            predecessor_in_Gml,
-                            successor_in_Gml,
-                            predecessor_in_FBnm,
-                            successor_in_FBnm,
-                            predecessor_of_pair_of_neighbors_in_Fm,
-                            successor_of_pair_of_neighbors_in_Fm,
-                            predecessor_of_pair_of_neighbors_in_Fml,
-                            successor_of_pair_of_neighbors_in_Fml,
-                            predecessor_of_pair_of_neighbors_in_Gml,
-                            successor_of_pair_of_neighbors_in_Gml,
-                            predecessor_of_pair_of_neighbors_in_FBnm,
-                            successor_of_pair_of_neighbors_in_FBnm)
-
-
-def main():
-    print("predecessor_in_Fm(6, Fraction(2, 3))      returns:     ",
-          predecessor_in_Fm(6, Fraction(2, 3)))
-    print("successor_in_Fm(6, Fraction(1, 3))      returns:     ",
-          successor_in_Fm(6, Fraction(1, 3)), "\n")
-#
-    print("predecessor_in_Fml(6, 4, Fraction(1, 1))      returns:     ",
-          predecessor_in_Fml(6, 4, Fraction(1, 1)))
-    print("successor_in_Fml(6, 4, Fraction(4, 5))      returns:     ",
-          successor_in_Fml(6, 4, Fraction(4, 5)), "\n")
-#
-    print("predecessor_in_Gml(6, 4, Fraction(1, 3))      returns:     ",
-          predecessor_in_Gml(6, 4, Fraction(1, 3)))
-    print("successor_in_Gml(6, 4, Fraction(1, 3))      returns:     ",
-          successor_in_Gml(6, 4, Fraction(1, 3)), "\n")
-#
-    print("predecessor_in_FBnm(6, 4, Fraction(3, 4))      returns:     ",
-          predecessor_in_FBnm(6, 4, Fraction(3, 4)))
-    print("successor_in_FBnm(6, 4, Fraction(4, 5))      returns:     ",
-          successor_in_FBnm(6, 4, Fraction(4, 5)), "\n")
-#
-    print("predecessor_of_pair_of_neighbors_in_Fm (6, Fraction(1, 3),  Fraction(2, 5), True)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Fm(6, Fraction(1, 3),  Fraction(2, 5), True))
-    print("predecessor_of_pair_of_neighbors_in_Fm (6, predecessor_in_Fm(6, Fraction(2, 5)), Fraction(2, 5), False)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Fm(6, predecessor_in_Fm(6, Fraction(2, 5)), Fraction(2, 5), False))
-    print("successor_of_pair_of_neighbors_in_Fm (6, Fraction(3, 5),  Fraction(2, 3), True)      returns:     ",
-          successor_of_pair_of_neighbors_in_Fm(6, Fraction(3, 5),  Fraction(2, 3), True))
-    print("successor_of_pair_of_neighbors_in_Fm (6, Fraction(3, 5), successor_in_Fm(6, Fraction(3, 5)),  False)      returns:     ",
-          successor_of_pair_of_neighbors_in_Fm(6, Fraction(3, 5), successor_in_Fm(6, Fraction(3, 5)),  False), "\n")
-#
-    print("predecessor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(4, 5),  Fraction(1, 1), True)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(4, 5),  Fraction(1, 1), True))
-    print("predecessor_of_pair_of_neighbors_in_Fml (6, 4, predecessor_in_Fml(6, 4, Fraction(1, 1)), Fraction(1, 1), False)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Fml(6, 4, predecessor_in_Fml(6, 4, Fraction(1, 1)), Fraction(1, 1), False))
-    print("successor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(3, 4),  Fraction(4, 5), True)      returns:     ",
-          successor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(3, 4),  Fraction(4, 5), True))
-    print("successor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(3, 4), successor_in_Fml(6, 4, Fraction(3, 4)),  False)      returns:     ",
-          successor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(3, 4), successor_in_Fml(6, 4, Fraction(3, 4)),  False), "\n")
-#
-    print("predecessor_of_pair_of_neighbors_in_Gml (6, 4, Fraction(1, 2),  Fraction(3, 5), True)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 2),  Fraction(3, 5), True))
-    print("predecessor_of_pair_of_neighbors_in_Gml (6, 4, predecessor_in_Gml(6, 4, Fraction(3, 5)), Fraction(3, 5), False)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_Gml(6, 4, predecessor_in_Gml(6, 4, Fraction(3, 5)), Fraction(3, 5), False))
-    print("successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3),  Fraction(1, 2), True)      returns:     ",
-          successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3),  Fraction(1, 2), True))
-    print("successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3), successor_in_Gml(6, 4, Fraction(1, 3)),  False)      returns:     ",
-          successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3), successor_in_Gml(6, 4, Fraction(1, 3)),  False), "\n")
-#
-    print("predecessor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(4, 5),  Fraction(1, 1), True)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(4, 5),  Fraction(1, 1), True))
-    print("predecessor_of_pair_of_neighbors_in_FBnm(6, 4, predecessor_in_FBnm(6, 4, Fraction(1, 1)), Fraction(1, 1), False)      returns:     ",
-          predecessor_of_pair_of_neighbors_in_FBnm(6, 4, predecessor_in_FBnm(6, 4, Fraction(1, 1)), Fraction(1, 1), False))
-    print("successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3),  Fraction(1, 2), True)      returns:     ",
-          successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3),  Fraction(1, 2), True))
-    print("successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3), successor_in_FBnm(6, 4, Fraction(1, 3)),  False)      returns:     ",
-          successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3), successor_in_FBnm(6, 4, Fraction(1, 3)),  False), "\n")
-
-
-if __name__ == "__main__":
-    main()
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# The command line interface: python -m fs COMMAND ...
+#
+# enumerate PERSONAGE PARAMS... [--start a] [--stop b] [--reverse]
+#    writes the fractions of the personage ('Fm', 'Fml', 'Gml', 'FBnm', or 'FB2mm' with the single parameter m)
+#    that lie in the segment [a, b] (by default, [0/1, 1/1]; a and b are arbitrary fractions, not necessarily members
+#    of the sequence) to the standard output, in ascending or (with --reverse) descending order.
+#    The first member of the segment is found by the functions rank_in_personage and select_in_personage of the module
+#    fareycounting.py, without enumeration, and then the fractions are streamed by the generators of the module
+#    fareyiterators.py, so the command runs in constant memory whatever the length of the sequence is.
+# predecessor PERSONAGE PARAMS...
+# successor PERSONAGE PARAMS...
+#    read fractions h/k from the standard input, one per non-empty line, and write their neighbors in the personage,
+#    computed by the functions of the module fareypairs.py, in the same order, one record per query; as everywhere
+#    in the package, a NEGATIVE fraction reports a problem (for instance, a query that is not a member of the sequence).
+# demo
+#    prints the results of a fixed set of calls of the sixteen functions of the module fareysequences.py.
+#
+# The option --format selects the format of the records:
+#    text    h/k
+#    csv     h,k (after the header line numerator,denominator)
+#    ndjson  {"numerator": h, "denominator": k}
+#    binary  the pairs h, k of little-endian integers, without a header: unsigned 32-bit integers (or unsigned 64-bit
+#            integers, if the parameters of the personage are >= 2^32) for the command enumerate, and signed 64-bit
+#            integers for the commands predecessor and successor (whose results may be negative).
+# The records are written to sys.stdout.buffer in blocks of --chunk records (65536, by default), and with --progress
+# the number of records written (and, for enumerate, the percentage of the total) is shown on the standard error.
+# The output may be piped into a command that exits early (say, head): the command then stops quietly.
+#
+# Run for instance:
+#    python -m fs enumerate Fm 6 --start 1/3 --stop 3/5
+# to get the output:
+#    1/3
+#    2/5
+#    1/2
+#    3/5
+# and run:
+#    printf '1/3\n2/7\n' | python -m fs successor Fm 6 --format csv
+# to get the output:
+#    numerator,denominator
+#    2,5
+#    -1,3
+
+
+import argparse
+import os
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+from itertools import chain, islice
+
+# The modules of the package import each other by their plain names, so their directory should be on the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fareycounting
+import fareyiterators
+import fareypairs
+from fareyarray import _typecode_for
+from fareypairs import Pair
+from fareysequences import (predecessor_in_Fm,
+                            successor_in_Fm,
+                            predecessor_in_Fml,
+                            successor_in_Fml,
+                            predecessor_in_Gml,
+                            successor_in_Gml,
+                            predecessor_in_FBnm,
+                            successor_in_FBnm,
+                            predecessor_of_pair_of_neighbors_in_Fm,
+                            successor_of_pair_of_neighbors_in_Fm,
+                            predecessor_of_pair_of_neighbors_in_Fml,
+                            successor_of_pair_of_neighbors_in_Fml,
+                            predecessor_of_pair_of_neighbors_in_Gml,
+                            successor_of_pair_of_neighbors_in_Gml,
+                            predecessor_of_pair_of_neighbors_in_FBnm,
+                            successor_of_pair_of_neighbors_in_FBnm)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m fs', description="Farey (sub)sequences on the command line")
+    commands = parser.add_subparsers(dest='command', required=True)
+    enumerate_parser = commands.add_parser('enumerate', help="write the fractions of a personage in a segment")
+    __add_personage_arguments(enumerate_parser)
+    enumerate_parser.add_argument('--start', type=Fraction, default=Fraction(0, 1), help="a fraction a, 0 <= a <= 1")
+    enumerate_parser.add_argument('--stop', type=Fraction, default=Fraction(1, 1), help="a fraction b, a <= b <= 1")
+    enumerate_parser.add_argument('--reverse', action='store_true', help="write the fractions in descending order")
+    __add_output_arguments(enumerate_parser)
+    for name in ('predecessor', 'successor'):
+        query_parser = commands.add_parser(name, help="write the " + name + "s of the fractions read from stdin")
+        __add_personage_arguments(query_parser)
+        __add_output_arguments(query_parser)
+    commands.add_parser('demo', help="print the results of a fixed set of calls")
+    args = parser.parse_args(argv)
+    if args.command != 'demo':
+        personage, params = __personage(parser, args.personage, args.params)
+        if args.chunk < 1:
+            parser.error("the chunk should contain at least one record")
+    try:
+        if args.command == 'demo':
+            __demo()
+        elif args.command == 'enumerate':
+            __enumerate(parser, personage, params, args)
+        else:
+            __query(parser, args.command + '_in_' + personage, params, args)
+    except BrokenPipeError:
+        # The reader has gone away: the rest of the output is discarded, and the interpreter should not
+        # complain about it when it flushes the standard output at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+__parameter_names = {'Fm': ('m',), 'Fml': ('m', 'l'), 'Gml': ('m', 'l'), 'FBnm': ('n', 'm'), 'FB2mm': ('m',)}
+
+__iterators = {'Fm': fareyiterators.iter_pairs_Fm,
+               'Fml': fareyiterators.iter_pairs_Fml,
+               'Gml': fareyiterators.iter_pairs_Gml,
+               'FBnm': fareyiterators.iter_pairs_FBnm}
+
+__ranks = {'Fm': fareycounting.rank_in_Fm,
+           'Fml': fareycounting.rank_in_Fml,
+           'Gml': fareycounting.rank_in_Gml,
+           'FBnm': fareycounting.rank_in_FBnm}
+
+__selects = {'Fm': fareycounting.select_in_Fm,
+             'Fml': fareycounting.select_in_Fml,
+             'Gml': fareycounting.select_in_Gml,
+             'FBnm': fareycounting.select_in_FBnm}
+
+__headers = {'text': b'', 'csv': b'numerator,denominator\n', 'ndjson': b'', 'binary': b''}
+
+__text_records = {'text': '%d/%d\n', 'csv': '%d,%d\n', 'ndjson': '{"numerator": %d, "denominator": %d}\n'}
+
+
+def __add_personage_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('personage', choices=tuple(__parameter_names))
+    parser.add_argument('params', type=int, nargs='+', metavar='PARAM',
+                        help="m for Fm and FB2mm; m, l for Fml and Gml; n, m for FBnm")
+
+
+def __add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--format', default='text', choices=tuple(__headers))
+    parser.add_argument('--chunk', type=int, default=1 << 16, help="the number of records per write")
+    parser.add_argument('--progress', action='store_true', help="show the progress on stderr")
+
+
+def __personage(parser: argparse.ArgumentParser, personage: str, params: list[int]) -> tuple[str, tuple]:
+    names = __parameter_names[personage]
+    if len(params) != len(names):
+        parser.error(personage + " takes the parameters " + ', '.join(names))
+    if personage == 'FB2mm':
+        # As in the module fareysequences.py, the subsequence FB2mm is the subsequence FBnm with n == 2*m
+        return 'FBnm', (2 * params[0], params[0])
+    return personage, tuple(params)
+
+
+def __enumerate(parser: argparse.ArgumentParser, personage: str, params: tuple, args: argparse.Namespace) -> None:
+    a, b = args.start, args.stop
+    if not (0 <= a <= b <= 1):
+        parser.error("the segment [a, b] should satisfy 0 <= a <= b <= 1")
+    rank = __ranks[personage]
+    length = rank(*params, Fraction(1, 1))
+    if length < 0:
+        parser.error("invalid parameters of the sequence, the rank function returned " + str(length))
+    # The ranks (from 1) of the first and the last members of the sequence in the segment
+    first = rank(*params, a)
+    if __selects[personage](*params, first) != a:
+        first += 1
+    last = rank(*params, b)
+    total = max(0, last - first + 1)
+    pairs = iter(())
+    if total > 0:
+        low, high = __pair(__selects[personage](*params, first)), __pair(__selects[personage](*params, last))
+        pairs = __iterators[personage](*params, low, high, args.reverse)
+    typecode = _typecode_for(max(params))
+    __write(pairs, __encoder(args.format, typecode), __headers[args.format], args.chunk,
+            __progress(args.progress, total))
+
+
+def __query(parser: argparse.ArgumentParser, name: str, params: tuple, args: argparse.Namespace) -> None:
+    function = getattr(fareypairs, name)
+    results = (__normalized(function(*params, x)) for x in __read_fractions(parser, sys.stdin))
+    __write(results, __encoder(args.format, 'q'), __headers[args.format], args.chunk, __progress(args.progress, None))
+
+
+def __read_fractions(parser: argparse.ArgumentParser, lines: Iterable[str]) -> Iterator[Pair]:
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            x = Fraction(line)
+        except (ValueError, ZeroDivisionError):
+            parser.error("line " + str(number) + " of the standard input is not a fraction: " + repr(line))
+        yield x.numerator, x.denominator
+
+
+def __pair(fraction: Fraction) -> Pair:
+    return fraction.numerator, fraction.denominator
+
+
+def __normalized(pair: Pair) -> Pair:
+    # The functions of the module fareypairs.py report problems by negative denominators; the records carry
+    # the sign in the numerator, as instances of the class Fraction do
+    h, k = pair
+    return (-h, -k) if k < 0 else (h, k)
+
+
+def __encoder(output_format: str, typecode: str) -> Callable[[list[Pair]], bytes]:
+    if output_format == 'binary':
+        def encode(block: list[Pair]) -> bytes:
+            values = array(typecode, chain.from_iterable(block))
+            if sys.byteorder != 'little':
+                values.byteswap()
+            return values.tobytes()
+    else:
+        record = __text_records[output_format]
+
+        def encode(block: list[Pair]) -> bytes:
+            return ''.join([record % pair for pair in block]).encode('ascii')
+    return encode
+
+
+def __progress(enabled: bool, total: int | None) -> Callable[[int, bool], None]:
+    started = time.monotonic()
+    shown = [started]
+
+    def show(written: int, final: bool) -> None:
+        now = time.monotonic()
+        if not enabled or (not final and now - shown[0] < 0.5):
+            return
+        shown[0] = now
+        message = '\r' + format(written, ',') + (' of ' + format(total, ',') + ' (' +
+                                                  format(100 * written / total if total else 100.0, '.1f') + '%)'
+                                                  if total is not None else '')
+        message += ', ' + format(written / max(now - started, 1e-9), ',.0f') + ' records/s'
+        sys.stderr.write(message + ('\n' if final else ''))
+        sys.stderr.flush()
+    return show
+
+
+def __write(pairs: Iterator[Pair], encode: Callable[[list[Pair]], bytes], header: bytes, chunk: int,
+            progress: Callable[[int, bool], None]) -> None:
+    output = sys.stdout.buffer
+    output.write(header)
+    written = 0
+    while block := list(islice(pairs, chunk)):
+        output.write(encode(block))
+        written += len(block)
+        progress(written, False)
+    output.flush()
+    progress(written, True)
+
+
+def __demo() -> None:
+    print("predecessor_in_Fm(6, Fraction(2, 3))      returns:     ",
+          predecessor_in_Fm(6, Fraction(2, 3)))
+    print("successor_in_Fm(6, Fraction(1, 3))      returns:     ",
+          successor_in_Fm(6, Fraction(1, 3)), "\n")
+#
+    print("predecessor_in_Fml(6, 4, Fraction(1, 1))      returns:     ",
+          predecessor_in_Fml(6, 4, Fraction(1, 1)))
+    print("successor_in_Fml(6, 4, Fraction(4, 5))      returns:     ",
+          successor_in_Fml(6, 4, Fraction(4, 5)), "\n")
+#
+    print("predecessor_in_Gml(6, 4, Fraction(1, 3))      returns:     ",
+          predecessor_in_Gml(6, 4, Fraction(1, 3)))
+    print("successor_in_Gml(6, 4, Fraction(1, 3))      returns:     ",
+          successor_in_Gml(6, 4, Fraction(1, 3)), "\n")
+#
+    print("predecessor_in_FBnm(6, 4, Fraction(3, 4))      returns:     ",
+          predecessor_in_FBnm(6, 4, Fraction(3, 4)))
+    print("successor_in_FBnm(6, 4, Fraction(4, 5))      returns:     ",
+          successor_in_FBnm(6, 4, Fraction(4, 5)), "\n")
+#
+    print("predecessor_of_pair_of_neighbors_in_Fm (6, Fraction(1, 3),  Fraction(2, 5), True)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Fm(6, Fraction(1, 3),  Fraction(2, 5), True))
+    print("predecessor_of_pair_of_neighbors_in_Fm (6, predecessor_in_Fm(6, Fraction(2, 5)), Fraction(2, 5), False)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Fm(6, predecessor_in_Fm(6, Fraction(2, 5)), Fraction(2, 5), False))
+    print("successor_of_pair_of_neighbors_in_Fm (6, Fraction(3, 5),  Fraction(2, 3), True)      returns:     ",
+          successor_of_pair_of_neighbors_in_Fm(6, Fraction(3, 5),  Fraction(2, 3), True))
+    print("successor_of_pair_of_neighbors_in_Fm (6, Fraction(3, 5), successor_in_Fm(6, Fraction(3, 5)),  False)      returns:     ",
+          successor_of_pair_of_neighbors_in_Fm(6, Fraction(3, 5), successor_in_Fm(6, Fraction(3, 5)),  False), "\n")
+#
+    print("predecessor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(4, 5),  Fraction(1, 1), True)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(4, 5),  Fraction(1, 1), True))
+    print("predecessor_of_pair_of_neighbors_in_Fml (6, 4, predecessor_in_Fml(6, 4, Fraction(1, 1)), Fraction(1, 1), False)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Fml(6, 4, predecessor_in_Fml(6, 4, Fraction(1, 1)), Fraction(1, 1), False))
+    print("successor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(3, 4),  Fraction(4, 5), True)      returns:     ",
+          successor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(3, 4),  Fraction(4, 5), True))
+    print("successor_of_pair_of_neighbors_in_Fml (6, 4, Fraction(3, 4), successor_in_Fml(6, 4, Fraction(3, 4)),  False)      returns:     ",
+          successor_of_pair_of_neighbors_in_Fml(6, 4, Fraction(3, 4), successor_in_Fml(6, 4, Fraction(3, 4)),  False), "\n")
+#
+    print("predecessor_of_pair_of_neighbors_in_Gml (6, 4, Fraction(1, 2),  Fraction(3, 5), True)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 2),  Fraction(3, 5), True))
+    print("predecessor_of_pair_of_neighbors_in_Gml (6, 4, predecessor_in_Gml(6, 4, Fraction(3, 5)), Fraction(3, 5), False)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_Gml(6, 4, predecessor_in_Gml(6, 4, Fraction(3, 5)), Fraction(3, 5), False))
+    print("successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3),  Fraction(1, 2), True)      returns:     ",
+          successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3),  Fraction(1, 2), True))
+    print("successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3), successor_in_Gml(6, 4, Fraction(1, 3)),  False)      returns:     ",
+          successor_of_pair_of_neighbors_in_Gml(6, 4, Fraction(1, 3), successor_in_Gml(6, 4, Fraction(1, 3)),  False), "\n")
+#
+    print("predecessor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(4, 5),  Fraction(1, 1), True)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(4, 5),  Fraction(1, 1), True))
+    print("predecessor_of_pair_of_neighbors_in_FBnm(6, 4, predecessor_in_FBnm(6, 4, Fraction(1, 1)), Fraction(1, 1), False)      returns:     ",
+          predecessor_of_pair_of_neighbors_in_FBnm(6, 4, predecessor_in_FBnm(6, 4, Fraction(1, 1)), Fraction(1, 1), False))
+    print("successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3),  Fraction(1, 2), True)      returns:     ",
+          successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3),  Fraction(1, 2), True))
+    print("successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3), successor_in_FBnm(6, 4, Fraction(1, 3)),  False)      returns:     ",
+          successor_of_pair_of_neighbors_in_FBnm(6, 4, Fraction(1, 3), successor_in_FBnm(6, 4, Fraction(1, 3)),  False), "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# A compact container for materialized Farey (sub)sequences.
+#
+# A list of instances of the class Fraction costs roughly 150 bytes per fraction. An instance of the class FareyArray
+# keeps the numerators and the denominators of its fractions in two typed buffers of the standard module array,
+# so a fraction costs 8 bytes if all of the denominators are less than 2^32, and 16 bytes otherwise.
+#
+# An instance of the class FareyArray supports len(), indexing (that returns an instance of the class Fraction),
+# slicing (that returns a new FareyArray), iteration, and binary search: bisect_left, bisect_right, index and the operator `in'
+# accept both instances of the class Fraction and pairs (h, k) of integers, and compare fractions by cross-multiplying.
+# The properties numerators and denominators are memoryviews of the underlying buffers, so they can be passed
+# without copying to anything that supports the buffer protocol, for instance:
+#    >>> numpy.frombuffer(array.denominators, dtype=numpy.uint32)
+#
+# Fill an array from one of our Dramatis Personae by calling the class methods from_Fm, from_Fml, from_Gml and from_FBnm,
+# that enumerate the sequence by the recurrent functions of the form `successor_of_pair_of_neighbors_in_personage'.
+# Call for instance:
+#    >>> FareyArray.from_Fm(5)[3:6]
+# to get the result:
+#    FareyArray([Fraction(1, 3), Fraction(2, 5), Fraction(1, 2)])
+
+
+from array import array
+from collections.abc import Iterable, Iterator
+from fractions import Fraction
+
+import fareyiterators
+from fareypairs import Pair
+
+
+class FareyArray:
+    __slots__ = ('__numerators', '__denominators')
+
+    def __init__(self, pairs: Iterable[Pair] = (), typecode: str = 'I'):
+        # The typecode should be 'I' (if all of the numerators and denominators are less than 2^32) or 'Q'
+        self.__numerators = array(typecode)
+        self.__denominators = array(typecode)
+        append_numerator = self.__numerators.append
+        append_denominator = self.__denominators.append
+        for h, k in pairs:
+            append_numerator(h)
+            append_denominator(k)
+
+    @classmethod
+    def from_Fm(cls, m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1)) -> 'FareyArray':
+        return cls(fareyiterators.iter_pairs_Fm(m, _pair(start), _pair(stop)), _typecode_for(m))
+
+    @classmethod
+    def from_Fml(cls, m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1)) -> 'FareyArray':
+        return cls(fareyiterators.iter_pairs_Fml(m, l, _pair(start), _pair(stop)), _typecode_for(m))
+
+    @classmethod
+    def from_Gml(cls, m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1)) -> 'FareyArray':
+        return cls(fareyiterators.iter_pairs_Gml(m, l, _pair(start), _pair(stop)), _typecode_for(m))
+
+    @classmethod
+    def from_FBnm(cls, n: int, m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1)) -> 'FareyArray':
+        return cls(fareyiterators.iter_pairs_FBnm(n, m, _pair(start), _pair(stop)), _typecode_for(n))
+
+    @classmethod
+    def from_buffers(cls, numerators: array | memoryview, denominators: array | memoryview) -> 'FareyArray':
+        # Wraps two arrays (or two one-dimensional memoryviews, say, of a memory-mapped file) of the same typecode
+        # and length, without copying; the fractions should be sorted. An array over memoryviews cannot be appended to
+        typecode = _typecode_of(numerators)
+        if (typecode != _typecode_of(denominators)) or (len(numerators) != len(denominators)):
+            raise ValueError("N/A: the buffers should have the same typecode and the same length")
+        result = cls(typecode=typecode)
+        result.__numerators = numerators
+        result.__denominators = denominators
+        return result
+
+    @property
+    def numerators(self) -> memoryview:
+        return memoryview(self.__numerators)
+
+    @property
+    def denominators(self) -> memoryview:
+        return memoryview(self.__denominators)
+
+    @property
+    def typecode(self) -> str:
+        return _typecode_of(self.__numerators)
+
+    @property
+    def nbytes(self) -> int:
+        return 2 * self.__numerators.itemsize * len(self.__numerators)
+
+    def __len__(self) -> int:
+        return len(self.__numerators)
+
+    def __getitem__(self, index: int | slice) -> 'Fraction | FareyArray':
+        if isinstance(index, slice):
+            result = FareyArray(typecode=self.typecode)
+            result.__numerators = self.__numerators[index]
+            result.__denominators = self.__denominators[index]
+            return result
+        return Fraction(self.__numerators[index], self.__denominators[index])
+
+    def pair(self, index: int) -> Pair:
+        return self.__numerators[index], self.__denominators[index]
+
+    def pairs(self) -> Iterator[Pair]:
+        return zip(self.__numerators, self.__denominators)
+
+    def __iter__(self) -> Iterator[Fraction]:
+        for h, k in zip(self.__numerators, self.__denominators):
+            yield Fraction(h, k)
+
+    def append(self, fraction: Fraction | Pair) -> None:
+        h, k = _pair(fraction)
+        self.__numerators.append(h)
+        self.__denominators.append(k)
+
+    def bisect_left(self, fraction: Fraction | Pair, lo: int = 0, hi: int | None = None) -> int:
+        # The index of the first fraction of the array that is >= the given fraction
+        p, q = _pair(fraction)
+        numerators, denominators = self.__numerators, self.__denominators
+        if hi is None:
+            hi = len(numerators)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if numerators[mid] * q < p * denominators[mid]:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def bisect_right(self, fraction: Fraction | Pair, lo: int = 0, hi: int | None = None) -> int:
+        # The index of the first fraction of the array that is > the given fraction
+        p, q = _pair(fraction)
+        numerators, denominators = self.__numerators, self.__denominators
+        if hi is None:
+            hi = len(numerators)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if p * denominators[mid] < numerators[mid] * q:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def index(self, fraction: Fraction | Pair) -> int:
+        i = self.bisect_left(fraction)
+        if (i < len(self.__numerators)) and (self.pair(i) == _pair(fraction)):
+            return i
+        raise ValueError(str(Fraction(*_pair(fraction))) + " is not in the array")
+
+    def __contains__(self, fraction: Fraction | Pair) -> bool:
+        i = self.bisect_left(fraction)
+        return (i < len(self.__numerators)) and (self.pair(i) == _pair(fraction))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FareyArray):
+            return NotImplemented
+        return (self.__numerators == other.__numerators) and (self.__denominators == other.__denominators)
+
+    def __repr__(self) -> str:
+        return 'FareyArray([' + ', '.join(repr(x) for x in self) + '])'
+
+
+def _pair(fraction: Fraction | Pair) -> Pair:
+    if isinstance(fraction, tuple):
+        return fraction
+    return fraction.numerator, fraction.denominator
+
+
+def _typecode_of(buffer: array | memoryview) -> str:
+    if isinstance(buffer, memoryview):
+        return buffer.format
+    return buffer.typecode
+
+
+def _typecode_for(bound: int) -> str:
+    # The numerators and the denominators of the fractions in our sequences never exceed their parameters m or n
+    if bound < 2 ** (8 * array('I').itemsize):
+        return 'I'
+    return 'Q'
@@ -0,0 +1,167 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Asynchronous generators of our Dramatis Personae, for use inside an asyncio event loop:
+#
+# aiter_Fm(m, start, stop, reverse, chunk, executor)      yields the fractions of the sequence Fm that lie between start and stop;
+# aiter_Fml(m, l, start, stop, reverse, chunk, executor)  yields the fractions of the subsequence Fml that lie between start and stop;
+# aiter_Gml(m, l, start, stop, reverse, chunk, executor)  yields the fractions of the subsequence Gml that lie between start and stop;
+# aiter_FBnm(n, m, start, stop, reverse, chunk, executor) yields the fractions of the subsequence FBnm that lie between start and stop.
+#
+# The asynchronous generators aiter_pairs_Fm, aiter_pairs_Fml, aiter_pairs_Gml and aiter_pairs_FBnm do the same,
+# but they take and yield plain pairs (h, k) of integers, as the generators iter_pairs_* of the module fareyiterators.py do.
+#
+# The fractions are computed by the generators of the module fareyiterators.py in chunks of the given number of fractions
+# (1024, by default), and the control is given back to the event loop after every chunk, so no other task waits
+# for longer than the computation of one chunk takes.
+# If an executor (a concurrent.futures.ThreadPoolExecutor or ProcessPoolExecutor) is given, then the chunks are computed
+# by the executor, each one starting from the last fraction of the previous chunk, and the event loop is not blocked
+# at all. The next chunk is computed while the consumer takes the fractions of the current one, and nothing more:
+# the computation never runs ahead of the consumer by more than one chunk (backpressure).
+#
+# The computation stops as soon as the consumer stops: when the consuming task is cancelled (say, on a client
+# disconnect), or when the asynchronous generator is closed by aclose() or finalized by the event loop, the chunk
+# that is not yet started by the executor is cancelled; a chunk already being computed by a thread or a process
+# cannot be interrupted, and its result is dropped.
+#
+# As in the module fareyiterators.py, an invalid request raises a ValueError at the call site, before the first
+# `async for' step.
+#
+# Call for instance:
+#    >>> async def main():
+#    ...     return [x async for x in aiter_Fm(5, Fraction(1, 3), Fraction(3, 5), chunk=2)]
+#    >>> asyncio.run(main())
+# to get the result:
+#    [Fraction(1, 3), Fraction(2, 5), Fraction(1, 2), Fraction(3, 5)]
+
+
+import asyncio
+from array import array
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor
+from fractions import Fraction
+from itertools import islice
+
+import fareyiterators
+from fareyarray import _typecode_for
+from fareypairs import Pair
+
+
+def aiter_Fm(m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1), reverse: bool = False,
+             chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Fraction]:
+    return __afractions(aiter_pairs_Fm(m, __pair(start), __pair(stop), reverse, chunk, executor))
+
+
+def aiter_Fml(m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1), reverse: bool = False,
+              chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Fraction]:
+    return __afractions(aiter_pairs_Fml(m, l, __pair(start), __pair(stop), reverse, chunk, executor))
+
+
+def aiter_Gml(m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1), reverse: bool = False,
+              chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Fraction]:
+    return __afractions(aiter_pairs_Gml(m, l, __pair(start), __pair(stop), reverse, chunk, executor))
+
+
+def aiter_FBnm(n: int, m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1), reverse: bool = False,
+               chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Fraction]:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    return __afractions(aiter_pairs_FBnm(n, m, __pair(start), __pair(stop), reverse, chunk, executor))
+
+
+def aiter_pairs_Fm(m: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False,
+                   chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Pair]:
+    return __aiterate('Fm', (m,), start, stop, reverse, chunk, executor)
+
+
+def aiter_pairs_Fml(m: int, l: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False,
+                    chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Pair]:
+    return __aiterate('Fml', (m, l), start, stop, reverse, chunk, executor)
+
+
+def aiter_pairs_Gml(m: int, l: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False,
+                    chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Pair]:
+    return __aiterate('Gml', (m, l), start, stop, reverse, chunk, executor)
+
+
+def aiter_pairs_FBnm(n: int, m: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False,
+                     chunk: int = 1024, executor: Executor | None = None) -> AsyncIterator[Pair]:
+    return __aiterate('FBnm', (n, m), start, stop, reverse, chunk, executor)
+
+
+__iterators = {'Fm': fareyiterators.iter_pairs_Fm,
+               'Fml': fareyiterators.iter_pairs_Fml,
+               'Gml': fareyiterators.iter_pairs_Gml,
+               'FBnm': fareyiterators.iter_pairs_FBnm}
+
+
+def __pair(fraction: Fraction) -> Pair:
+    return fraction.numerator, fraction.denominator
+
+
+async def __afractions(pairs: AsyncIterator[Pair]) -> AsyncIterator[Fraction]:
+    try:
+        async for h, k in pairs:
+            yield Fraction(h, k)
+    finally:
+        await pairs.aclose()
+
+
+def __aiterate(personage: str, params: tuple, start: Pair, stop: Pair, reverse: bool,
+               chunk: int, executor: Executor | None) -> AsyncIterator[Pair]:
+    # The seed function is called eagerly by the generator of the module fareyiterators.py,
+    # so that an invalid request is reported at the call site
+    if chunk < 1:
+        raise ValueError("N/A: the chunk should contain at least one fraction")
+    pairs = __iterators[personage](*params, start, stop, reverse)
+    if executor is None:
+        return __astream_inline(pairs, chunk)
+    return __astream_offloaded(personage, params, start, stop, reverse, chunk, executor)
+
+
+async def __astream_inline(pairs: Iterator[Pair], chunk: int) -> AsyncIterator[Pair]:
+    while True:
+        block = list(islice(pairs, chunk))
+        for pair in block:
+            yield pair
+        if len(block) < chunk:
+            return
+        # Let the other tasks run between the chunks
+        await asyncio.sleep(0)
+
+
+async def __astream_offloaded(personage: str, params: tuple, start: Pair, stop: Pair, reverse: bool,
+                              chunk: int, executor: Executor) -> AsyncIterator[Pair]:
+    loop = asyncio.get_running_loop()
+    typecode = _typecode_for(max(params))
+    pending = loop.run_in_executor(executor, __compute_chunk, personage, params, start, stop, reverse,
+                                   chunk, False, typecode)
+    try:
+        while pending is not None:
+            numerators, denominators = await pending
+            pending = None
+            if len(numerators) == chunk:
+                # The next chunk starts from the last fraction of this one, which is skipped
+                last = (numerators[-1], denominators[-1])
+                lower, upper = (start, last) if reverse else (last, stop)
+                pending = loop.run_in_executor(executor, __compute_chunk, personage, params, lower, upper, reverse,
+                                               chunk, True, typecode)
+            for pair in zip(numerators, denominators):
+                yield pair
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def __compute_chunk(personage: str, params: tuple, start: Pair, stop: Pair, reverse: bool,
+                    chunk: int, skip_first: bool, typecode: str) -> tuple[array, array]:
+    # Runs in the executor, so the result is returned in two compact arrays, that are cheap to pickle
+    numerators = array(typecode)
+    denominators = array(typecode)
+    pairs = __iterators[personage](*params, start, stop, reverse)
+    if skip_first:
+        next(pairs, None)
+    for h, k in islice(pairs, chunk):
+        numerators.append(h)
+        denominators.append(k)
+    return numerators, denominators
@@ -0,0 +1,401 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# This module is a batch version of the functions predecessor_in_personage and successor_in_personage
+# of the modules fareysequences.py and fareypairs.py: it requires NumPy, and every function accepts
+# two arrays of numerators and denominators (of any shape) and returns the three arrays
+#
+#    (numerators, denominators, status)
+#
+# of the same shape. If status[i] == 0, then numerators[i] / denominators[i] is the predecessor (or successor)
+# of the i-th input fraction; otherwise, status[i] is the code that the corresponding scalar function would report
+# in the denominator of its negative result, and numerators[i] == denominators[i] == 0.
+#
+# The input fractions are supposed to be REDUCED, with positive denominators.
+# The computations are carried out in the NumPy int64 arithmetic while the parameters of the sequences are less
+# than BOUND == 2^31 (then all of the products in the formulas below fit in 64 bits). For larger parameters, or for inputs
+# that do not fit in int64, every element of the batch is given to the scalar function of the module fareypairs.py,
+# that works with Python's arbitrary-precision integers: the results are exact, but they come at the speed of a loop.
+#
+# The numerators of the neighboring fractions are found, as in the scalar functions, as representatives of residue classes;
+# the modular inverses are computed by the extended Euclidean algorithm run simultaneously for all elements of the batch.
+#
+# The functions are_neighbors_in_Fm, are_neighbors_in_Fml, are_neighbors_in_Gml and are_neighbors_in_FBnm are the batch
+# versions of the O(1) checks of the module fareypairs.py: they accept four arrays, the numerators and the denominators
+# of the left and of the right fractions, and return a boolean array. To check a whole materialized sequence at once,
+# give them the arrays without their last element and without their first element, respectively.
+#
+# Call for instance:
+#    >>> successor_in_Fm(6, [0, 1, 3], [1, 3, 5])
+# to get the result:
+#    (array([1, 2, 2]), array([6, 5, 3]), array([0, 0, 0]))
+
+
+import numpy as np
+
+import fareypairs
+
+
+BOUND = 2 ** 31
+
+
+def predecessor_in_Fm(m: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.9(i) and Table 2.1 of the monograph
+    if __exceeds_bound((m,), numerators, denominators):
+        return __exactly(fareypairs.predecessor_in_Fm, (m,), numerators, denominators)
+    c, d, status = __prepare(numerators, denominators)
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return __all_failed(status, 1)
+    __flag(status, (c <= 0) | (c > d), 2)
+    __flag(status, d > m, 3)
+    c, d = __sanitize(c, d, status)
+    lower = __ceil_div(c * m, d) - c
+    return __predecessors(lower, c, d, status, [((1, 1), fareypairs.predecessor_in_Fm(m, (1, 1)))])
+
+
+def successor_in_Fm(m: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.9(ii) and Table 2.3 of the monograph
+    if __exceeds_bound((m,), numerators, denominators):
+        return __exactly(fareypairs.successor_in_Fm, (m,), numerators, denominators)
+    a, b, status = __prepare(numerators, denominators)
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return __all_failed(status, 1)
+    __flag(status, (a < 0) | (a >= b), 2)
+    __flag(status, b > m, 3)
+    a, b = __sanitize(a, b, status)
+    lower = __ceil_div(a * m + 2, b) - a
+    return __successors(lower, a, b, status, [((0, 1), fareypairs.successor_in_Fm(m, (0, 1)))])
+
+
+def predecessor_in_Fml(m: int, l: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.13(i)(a)-(b) and Table 2.1 of the monograph
+    if __exceeds_bound((m, l), numerators, denominators):
+        return __exactly(fareypairs.predecessor_in_Fml, (m, l), numerators, denominators)
+    c, d, status = __prepare(numerators, denominators)
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return __all_failed(status, 1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return __all_failed(status, 2)
+    __flag(status, (c <= 0) | (c > d), 3)
+    __flag(status, d > m, 4)
+    __flag(status, l < c, 5)
+    c, d = __sanitize(c, d, status)
+    lower = np.where(c * m - d * l >= 1, l - c + 1, __ceil_div(c * m, d) - c)
+    return __predecessors(lower, c, d, status, [((1, 1), fareypairs.predecessor_in_Fml(m, l, (1, 1)))])
+
+
+def successor_in_Fml(m: int, l: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.13(ii)(a)-(b) and Table 2.3 of the monograph
+    if __exceeds_bound((m, l), numerators, denominators):
+        return __exactly(fareypairs.successor_in_Fml, (m, l), numerators, denominators)
+    a, b, status = __prepare(numerators, denominators)
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return __all_failed(status, 1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return __all_failed(status, 2)
+    __flag(status, (a < 0) | (a >= b), 3)
+    __flag(status, b > m, 4)
+    __flag(status, l < a, 5)
+    a, b = __sanitize(a, b, status)
+    lower = np.where(b * l - a * m >= 1, __ceil_div(a * m + 2, b) - a, l - a + 1)
+    return __successors(lower, a, b, status, [((0, 1), fareypairs.successor_in_Fml(m, l, (0, 1)))])
+
+
+def predecessor_in_Gml(m: int, l: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.15(i)(a)-(b) and Table 2.1 of the monograph
+    if __exceeds_bound((m, l), numerators, denominators):
+        return __exactly(fareypairs.predecessor_in_Gml, (m, l), numerators, denominators)
+    c, d, status = __prepare(numerators, denominators)
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return __all_failed(status, 1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return __all_failed(status, 2)
+    __flag(status, (c <= 0) | (c > d), 3)
+    __flag(status, d > m, 4)
+    __flag(status, l + d - m > c, 5)
+    c, d = __sanitize(c, d, status)
+    lower = np.where(c * m - d * l >= 1, __ceil_div(c * m, d) - c,
+                     __ceil_div(c * (m - l), np.maximum(d - c, 1)) - c)
+    return __predecessors(lower, c, d, status, [((1, 1), fareypairs.predecessor_in_Gml(m, l, (1, 1)))])
+
+
+def successor_in_Gml(m: int, l: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Lemma 2.15(ii)(a)-(b) and Table 2.3 of the monograph
+    if __exceeds_bound((m, l), numerators, denominators):
+        return __exactly(fareypairs.successor_in_Gml, (m, l), numerators, denominators)
+    a, b, status = __prepare(numerators, denominators)
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return __all_failed(status, 1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return __all_failed(status, 2)
+    __flag(status, (a < 0) | (a >= b), 3)
+    __flag(status, b > m, 4)
+    __flag(status, l + b - m > a, 5)
+    a, b = __sanitize(a, b, status)
+    lower = np.where(b * l - a * m >= 1, __ceil_div(a * (m - l) + 2, b - a) - a,
+                     __ceil_div(a * m + 2, b) - a)
+    return __successors(lower, a, b, status, [((0, 1), fareypairs.successor_in_Gml(m, l, (0, 1)))])
+
+
+def predecessor_in_FBnm(n: int, m: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Proposition 2.12 (i) (a) and Proposition 2.12 (ii) (a) (if n == 2 * m),
+    # and Propositions 2.18(i)(a), 2.18(ii)(a), 2.19(i)(a) and 2.19(ii)(a) (if n != 2 * m) of the monograph.
+    # The predecessors of the fractions 1/3, 1/2, 2/3 and 1/1 are given by the scalar function
+    if __exceeds_bound((n, m), numerators, denominators):
+        return __exactly(fareypairs.predecessor_in_FBnm, (n, m), numerators, denominators)
+    c, d, status = __prepare(numerators, denominators)
+    if n == 2 * m:
+        if m < 1:
+            # "N/A: Parameter m of the sequence should be > 0"
+            return __all_failed(status, 1)
+        __flag(status, (c <= 0) | (c > d), 2)
+        __flag(status, d > 2 * m, 3)
+        __flag(status, (d - m > c) | (c > m), 4)
+        c, d = __sanitize(c, d, status)
+        generic = 2 * c > d
+        lower = np.where(generic, m - c + 1, __ceil_div(c * m, np.maximum(d - c, 1)) - c)
+    else:
+        if n < 2:
+            # "N/A: Parameter n of the sequence should be > 1"
+            return __all_failed(status, 1)
+        if (m < 1) or (m >= n):
+            # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+            return __all_failed(status, 2)
+        __flag(status, (c <= 0) | (c > d), 3)
+        __flag(status, d > n, 4)
+        __flag(status, (m + d - n > c) | (c > m), 5)
+        c, d = __sanitize(c, d, status)
+        if n < 2 * m:
+            generic = (2 * c > d) & (c * n - d * m >= 1)
+        else:
+            generic = (2 * c > d) | (c * n - d * m >= 1)
+        lower = np.where(generic, m - c + 1, __ceil_div(c * (n - m), np.maximum(d - c, 1)) - c)
+    return __predecessors(lower, c, d, status,
+                          [(x, fareypairs.predecessor_in_FBnm(n, m, x)) for x in ((1, 1), (2, 3), (1, 2), (1, 3))])
+
+
+def successor_in_FBnm(n: int, m: int, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # See Proposition 2.12 (i) (b) and Proposition 2.12 (ii) (b) (if n == 2 * m),
+    # and Propositions 2.18(i)(b), 2.18(ii)(b), 2.19(i)(b) and 2.19(ii)(b) (if n != 2 * m) of the monograph.
+    # The successors of the fractions 0/1, 1/3, 1/2 and 2/3 are given by the scalar function
+    if __exceeds_bound((n, m), numerators, denominators):
+        return __exactly(fareypairs.successor_in_FBnm, (n, m), numerators, denominators)
+    a, b, status = __prepare(numerators, denominators)
+    if n == 2 * m:
+        if m < 1:
+            # "N/A: Parameter m of the sequence should be > 0"
+            return __all_failed(status, 1)
+        __flag(status, (a < 0) | (a >= b), 2)
+        __flag(status, b > 2 * m, 3)
+        __flag(status, (b - m > a) | (a > m), 4)
+        a, b = __sanitize(a, b, status)
+        generic = 2 * a >= b
+        lower = np.where(generic, m - a + 1, __ceil_div(a * m + 2, b - a) - a)
+    else:
+        if n < 2:
+            # "N/A: Parameter n of the sequence should be > 1"
+            return __all_failed(status, 1)
+        if (m < 1) or (m >= n):
+            # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+            return __all_failed(status, 2)
+        __flag(status, (a < 0) | (a >= b), 3)
+        __flag(status, b > n, 4)
+        __flag(status, (m + b - n > a) | (a > m), 5)
+        a, b = __sanitize(a, b, status)
+        if n < 2 * m:
+            generic = (2 * a > b) & (b * m - a * n <= 1)
+        else:
+            generic = (2 * a > b) | (b * m - a * n <= 1)
+        lower = np.where(generic, m - a + 1, __ceil_div(a * (n - m) + 2, b - a) - a)
+    return __successors(lower, a, b, status,
+                        [(x, fareypairs.successor_in_FBnm(n, m, x)) for x in ((0, 1), (1, 3), (1, 2), (2, 3))])
+
+
+def are_neighbors_in_Fm(m: int, left_numerators, left_denominators, right_numerators, right_denominators) -> np.ndarray:
+    arrays = (left_numerators, left_denominators, right_numerators, right_denominators)
+    if __exceeds_bound((m,), *arrays):
+        return __neighbors_exactly(fareypairs.are_neighbors_in_Fm, (m,), arrays)
+    a, b, c, d = __prepare_pairs(*arrays)
+    # The rows with an input of 2^31 or more in absolute value may overflow here, so they are recomputed exactly
+    result = ((m >= 1) & (a >= 0) & (a <= b) & (c <= d) & (b <= m) & (d <= m)
+              & (b * c - a * d == 1) & (b + d > m))
+    return __fix_large_pairs(result, fareypairs.are_neighbors_in_Fm, (m,), a, b, c, d)
+
+
+def are_neighbors_in_Fml(m: int, l: int, left_numerators, left_denominators,
+                         right_numerators, right_denominators) -> np.ndarray:
+    arrays = (left_numerators, left_denominators, right_numerators, right_denominators)
+    if __exceeds_bound((m, l), *arrays):
+        return __neighbors_exactly(fareypairs.are_neighbors_in_Fml, (m, l), arrays)
+    a, b, c, d = __prepare_pairs(*arrays)
+    result = ((m >= 2) & (0 < l < m) & (a >= 0) & (a <= b) & (c <= d) & (b <= m) & (d <= m) & (a <= l) & (c <= l)
+              & (b * c - a * d == 1) & ((b + d > m) | (a + c > l)))
+    return __fix_large_pairs(result, fareypairs.are_neighbors_in_Fml, (m, l), a, b, c, d)
+
+
+def are_neighbors_in_Gml(m: int, l: int, left_numerators, left_denominators,
+                         right_numerators, right_denominators) -> np.ndarray:
+    arrays = (left_numerators, left_denominators, right_numerators, right_denominators)
+    if __exceeds_bound((m, l), *arrays):
+        return __neighbors_exactly(fareypairs.are_neighbors_in_Gml, (m, l), arrays)
+    a, b, c, d = __prepare_pairs(*arrays)
+    result = ((m >= 2) & (0 < l < m) & (a >= 0) & (a <= b) & (c <= d) & (b <= m) & (d <= m)
+              & (b - a <= m - l) & (d - c <= m - l)
+              & (b * c - a * d == 1) & ((b + d > m) | (b + d - a - c > m - l)))
+    return __fix_large_pairs(result, fareypairs.are_neighbors_in_Gml, (m, l), a, b, c, d)
+
+
+def are_neighbors_in_FBnm(n: int, m: int, left_numerators, left_denominators,
+                          right_numerators, right_denominators) -> np.ndarray:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> terms = numpy.array(list(fareyiterators.iter_pairs_FBnm(6, 4)))
+    #    >>> are_neighbors_in_FBnm(6, 4, terms[:-1, 0], terms[:-1, 1], terms[1:, 0], terms[1:, 1]).all()
+    # to get the result:
+    #    True
+    arrays = (left_numerators, left_denominators, right_numerators, right_denominators)
+    if __exceeds_bound((n, m), *arrays):
+        return __neighbors_exactly(fareypairs.are_neighbors_in_FBnm, (n, m), arrays)
+    a, b, c, d = __prepare_pairs(*arrays)
+    result = ((0 < m < n) & (a >= 0) & (a <= b) & (c <= d) & (a <= m) & (c <= m)
+              & (b - a <= n - m) & (d - c <= n - m)
+              & (b * c - a * d == 1) & ((a + c > m) | (b + d - a - c > n - m)))
+    return __fix_large_pairs(result, fareypairs.are_neighbors_in_FBnm, (n, m), a, b, c, d)
+
+
+def __prepare_pairs(left_numerators, left_denominators, right_numerators, right_denominators) -> tuple:
+    return np.broadcast_arrays(*(np.asarray(x, dtype=np.int64)
+                                 for x in (left_numerators, left_denominators, right_numerators, right_denominators)))
+
+
+def __prepare(numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    h = np.asarray(numerators, dtype=np.int64)
+    k = np.asarray(denominators, dtype=np.int64)
+    h, k = np.broadcast_arrays(h, k)
+    return h, k, np.zeros(h.shape, dtype=np.int64)
+
+
+def __exceeds_bound(params: tuple, *arrays) -> bool:
+    # True if a parameter is not less than 2^31 in absolute value, or an input does not fit in int64
+    if any(abs(param) >= BOUND for param in params):
+        return True
+    try:
+        for x in arrays:
+            np.asarray(x, dtype=np.int64)
+    except OverflowError:
+        return True
+    return False
+
+
+def __exactly(function, params: tuple, numerators, denominators) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The scalar function of the module fareypairs.py is called for every element of the batch, in Python's integers;
+    # the results are as large as the parameters, so they are kept in int64 while the parameters fit in it
+    h, k = np.broadcast_arrays(np.asarray(numerators, dtype=object), np.asarray(denominators, dtype=object))
+    dtype = np.int64 if all(abs(param) < 2 ** 63 for param in params) else object
+    result_h = np.zeros(h.shape, dtype=dtype)
+    result_k = np.zeros(h.shape, dtype=dtype)
+    status = np.zeros(h.shape, dtype=np.int64)
+    for index in np.ndindex(h.shape):
+        x, y = function(*params, (int(h[index]), int(k[index])))
+        if y < 0:
+            status[index] = -y
+        else:
+            result_h[index], result_k[index] = x, y
+    return result_h, result_k, status
+
+
+def __neighbors_exactly(function, params: tuple, arrays: tuple) -> np.ndarray:
+    # The scalar check of the module fareypairs.py is called for every element of the batch, in Python's integers
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(x, dtype=object) for x in arrays))
+    result = np.zeros(a.shape, dtype=bool)
+    for index in np.ndindex(a.shape):
+        result[index] = function(*params, (int(a[index]), int(b[index])), (int(c[index]), int(d[index])))
+    return result
+
+
+def __fix_large_pairs(result: np.ndarray, function, params: tuple,
+                      a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    # The products of the inputs of 2^31 or more in absolute value may overflow int64, so such rows
+    # (they are not pairs of members of the sequence anyway) get the exact result of the scalar check
+    large = np.zeros(result.shape, dtype=bool)
+    for x in (a, b, c, d):
+        large |= (x >= BOUND) | (x <= -BOUND)
+    for index in zip(*np.nonzero(large)):
+        result[index] = function(*params, (int(a[index]), int(b[index])), (int(c[index]), int(d[index])))
+    return result
+
+
+def __flag(status: np.ndarray, condition: np.ndarray, code: int) -> None:
+    # As in the scalar functions, an element gets the code of the FIRST check it fails
+    status[(status == 0) & condition] = code
+
+
+def __all_failed(status: np.ndarray, code: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    status[...] = code
+    return np.zeros_like(status), np.zeros_like(status), status
+
+
+def __sanitize(h: np.ndarray, k: np.ndarray, status: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # The formulas are evaluated for all elements of the batch at once, so we replace the invalid inputs
+    # by the fraction 1/2, just to avoid divisions by zero; their results are discarded anyway
+    ok = status == 0
+    return np.where(ok, h, 1), np.where(ok, k, 2)
+
+
+def __ceil_div(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return -(-a // b)
+
+
+def __modular_inverse(x: np.ndarray, modulus: np.ndarray) -> np.ndarray:
+    # The extended Euclidean algorithm, run simultaneously for all elements; we assume gcd(x, modulus) == 1,
+    # and the number of iterations is logarithmic in the largest modulus of the batch
+    r0, r1 = modulus.copy(), x % modulus
+    t0, t1 = np.zeros_like(x), np.ones_like(x)
+    active = r1 != 0
+    while active.any():
+        q = np.where(active, r0 // np.where(active, r1, 1), 0)
+        r0, r1 = np.where(active, r1, r0), np.where(active, r0 - q * r1, r1)
+        t0, t1 = np.where(active, t1, t0), np.where(active, t0 - q * t1, t1)
+        active = r1 != 0
+    return t0 % modulus
+
+
+def __predecessors(lower: np.ndarray, c: np.ndarray, d: np.ndarray, status: np.ndarray,
+                   special_cases: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The numerator x of the predecessor of c/d is the unique element of the interval [lower, lower + c - 1]
+    # such that (d * x + 1) is divisible by c
+    x = lower + (-__modular_inverse(d, c) - lower) % c
+    return __assemble(x, (d * x + 1) // c, c, d, status, special_cases)
+
+
+def __successors(lower: np.ndarray, a: np.ndarray, b: np.ndarray, status: np.ndarray,
+                 special_cases: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The numerator x of the successor of a/b is the unique element of the interval [lower, lower + a - 1]
+    # such that (b * x - 1) is divisible by a; the numerator a == 0 is always one of the special cases,
+    # so we replace it by 1 here, just to avoid divisions by zero
+    a_or_one = np.maximum(a, 1)
+    x = lower + (__modular_inverse(b, a_or_one) - lower) % a_or_one
+    return __assemble(x, (b * x - 1) // a_or_one, a, b, status, special_cases)
+
+
+def __assemble(h: np.ndarray, k: np.ndarray, x: np.ndarray, y: np.ndarray, status: np.ndarray,
+               special_cases: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # special_cases is a list of pairs (fraction, neighbor) such that the neighbor of the fraction is given
+    # by a separate formula, and it has already been computed by the scalar function
+    ok = status == 0
+    for (p, q), (r, s) in special_cases:
+        special = ok & (x == p) & (y == q)
+        h = np.where(special, r, h)
+        k = np.where(special, s, k)
+    return np.where(ok, h, 0), np.where(ok, k, 0), status
@@ -0,0 +1,194 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Bracketing of arbitrary numbers x, 0 <= x <= 1, by the neighboring fractions of our Dramatis Personae.
+#
+# bracket_in_Fm(m, x), bracket_in_Fml(m, l, x), bracket_in_Gml(m, l, x) and bracket_in_FBnm(n, m, x) return the pair
+# (left, right) of NEIGHBORING fractions of the sequence such that left <= x < right (or left < x == right, for x == 1/1),
+# where x is an instance of the class Fraction, an integer or a float (a float is taken with its exact binary value),
+# not necessarily a member of the sequence. So, if x is a member of the sequence, then left == x (unless x == 1/1),
+# and the pair (left, right) can be given as it is to the functions of the form `successor_of_pair_of_neighbors_in_personage'
+# and `predecessor_of_pair_of_neighbors_in_personage', and to the generators of the module fareyiterators.py.
+# The functions bracket_pairs_in_Fm, bracket_pairs_in_Fml, bracket_pairs_in_Gml and bracket_pairs_in_FBnm do the same,
+# but they take a pair (p, q) of integers for the fraction x == p/q, and return the pairs (h, k), as the functions
+# of the module fareypairs.py do.
+# If you get a pair of NEGATIVE fractions (or of pairs with negative denominators), it means that something went wrong,
+# and the denominator of each of them reports a reason of the problem, just as in the module fareysequences.py.
+#
+# Let us write the fractions as h/(h + j), where j == k - h. Then the Stern--Brocot tree of the ratios h/j is the tree
+# of the mediants of our fractions, and every one of our sequences is defined by linear constraints a*h + b*j <= c with
+# a, b >= 0:
+#    Fm   by h + j <= m;
+#    Fml  by h + j <= m and h <= l;
+#    Gml  by h + j <= m and j <= m - l;
+#    FBnm by h <= m and j <= n - m.
+# The children of a node of the tree have greater h and j than the node itself, so the members of a sequence form
+# a subtree, and the bracket of x is the last interval (left, right) of the descent towards x in the subtree, that stops
+# at the first mediant which violates a constraint. The descent goes in runs of moves in the same direction, that are
+# done at once: a run changes left (or right) to left + t * right (or right + t * left), where t is the least of the length
+# of the run towards x (a partial quotient of the continued fraction of x) and of the largest t allowed by the constraints.
+# The runs of the descent stop as soon as the denominators reach the bound on the denominators of the sequence,
+# so it takes O(log m) arithmetic operations on integers, for any x.
+#
+# Call for instance:
+#    >>> bracket_in_Fm(6, 0.3)
+# to get the result:
+#    (Fraction(1, 4), Fraction(1, 3))
+# and call:
+#    >>> bracket_pairs_in_Fml(6, 4, (4, 5))
+# to get the result:
+#    ((4, 5), (1, 1))
+
+
+from fractions import Fraction
+
+from fareypairs import Pair
+
+
+def bracket_in_Fm(m: int, x: Fraction | float) -> tuple[Fraction, Fraction]:
+    # Call for instance:
+    #    >>> bracket_in_Fm(6, Fraction(2, 3))
+    # to get the result:
+    #    (Fraction(2, 3), Fraction(3, 4))
+    return __fractions(bracket_pairs_in_Fm(m, __pair(x)))
+
+
+def bracket_in_Fml(m: int, l: int, x: Fraction | float) -> tuple[Fraction, Fraction]:
+    # Call for instance:
+    #    >>> bracket_in_Fml(6, 4, Fraction(7, 10))
+    # to get the result:
+    #    (Fraction(2, 3), Fraction(3, 4))
+    return __fractions(bracket_pairs_in_Fml(m, l, __pair(x)))
+
+
+def bracket_in_Gml(m: int, l: int, x: Fraction | float) -> tuple[Fraction, Fraction]:
+    # Call for instance:
+    #    >>> bracket_in_Gml(6, 4, Fraction(2, 5))
+    # to get the result:
+    #    (Fraction(1, 3), Fraction(1, 2))
+    return __fractions(bracket_pairs_in_Gml(m, l, __pair(x)))
+
+
+def bracket_in_FBnm(n: int, m: int, x: Fraction | float) -> tuple[Fraction, Fraction]:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> bracket_in_FBnm(6, 4, 0.7)
+    # to get the result:
+    #    (Fraction(2, 3), Fraction(3, 4))
+    return __fractions(bracket_pairs_in_FBnm(n, m, __pair(x)))
+
+
+def bracket_pairs_in_Fm(m: int, x: Pair) -> tuple[Pair, Pair]:
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return (1, -1), (1, -1)
+    if not __is_in_segment(x):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return (1, -2), (1, -2)
+    return __descend(((1, 1, m), (1, 1, m)), x)
+
+
+def bracket_pairs_in_Fml(m: int, l: int, x: Pair) -> tuple[Pair, Pair]:
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return (1, -1), (1, -1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return (1, -2), (1, -2)
+    if not __is_in_segment(x):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return (1, -3), (1, -3)
+    return __descend(((1, 1, m), (1, 0, l)), x)
+
+
+def bracket_pairs_in_Gml(m: int, l: int, x: Pair) -> tuple[Pair, Pair]:
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return (1, -1), (1, -1)
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return (1, -2), (1, -2)
+    if not __is_in_segment(x):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return (1, -3), (1, -3)
+    return __descend(((1, 1, m), (0, 1, m - l)), x)
+
+
+def bracket_pairs_in_FBnm(n: int, m: int, x: Pair) -> tuple[Pair, Pair]:
+    # As in the module fareysequences.py, the subsequence FB2mm reports its problems by its own codes
+    if n == 2 * m:
+        if m < 1:
+            # "N/A: Parameter m of the sequence should be > 0"
+            return (1, -1), (1, -1)
+        if not __is_in_segment(x):
+            # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+            return (1, -2), (1, -2)
+        return __descend(((1, 0, m), (0, 1, m)), x)
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return (1, -1), (1, -1)
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return (1, -2), (1, -2)
+    if not __is_in_segment(x):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return (1, -3), (1, -3)
+    return __descend(((1, 0, m), (0, 1, n - m)), x)
+
+
+def __pair(x: Fraction | float) -> Pair:
+    x = Fraction(x)
+    return x.numerator, x.denominator
+
+
+def __fractions(bracket: tuple[Pair, Pair]) -> tuple[Fraction, Fraction]:
+    (h, k), (h_, k_) = bracket
+    return Fraction(h, k), Fraction(h_, k_)
+
+
+def __is_in_segment(x: Pair) -> bool:
+    p, q = x
+    return (q > 0) and (0 <= p <= q)
+
+
+def __descend(constraints: tuple, x: Pair) -> tuple[Pair, Pair]:
+    # The nodes are kept as pairs (h, j), and the fractions are compared as the ratios h/j and p/r;
+    # left <= x < right (or right == x == 1/1) holds throughout. There are exactly two constraints
+    # a*h + b*j <= c and d*h + e*j <= f (the sequence Fm gives its single constraint twice), written out inline
+    (a, b, c), (d, e, f) = constraints
+    p, q = x
+    r = q - p
+    left_h, left_j = 0, 1
+    right_h, right_j = 1, 0
+    while True:
+        h, j = left_h + right_h, left_j + right_j
+        if (a * h + b * j > c) or (d * h + e * j > f):
+            # The mediant of left and right is not a member, so left and right are neighbors
+            return (left_h, left_h + left_j), (right_h, right_h + right_j)
+        left_gap = p * left_j - r * left_h
+        right_gap = right_h * r - p * right_j
+        if h * r <= p * j:
+            # The mediant is <= x: a run of moves to the right, while left + t * right <= x
+            steps = __allowed_steps(a, b, c, d, e, f, left_h, left_j, right_h, right_j)
+            if right_gap > 0:
+                steps = min(steps, left_gap // right_gap)
+            left_h, left_j = left_h + steps * right_h, left_j + steps * right_j
+        else:
+            # The mediant is > x: a run of moves to the left, while right + t * left > x
+            steps = __allowed_steps(a, b, c, d, e, f, right_h, right_j, left_h, left_j)
+            if left_gap > 0:
+                steps = min(steps, (right_gap - 1) // left_gap)
+            right_h, right_j = right_h + steps * left_h, right_j + steps * left_j
+
+
+def __allowed_steps(a: int, b: int, c: int, d: int, e: int, f: int, h: int, j: int, step_h: int, step_j: int) -> int:
+    # The largest t such that the node (h + t * step_h, j + t * step_j) satisfies both constraints; every direction
+    # increases the left-hand side of at least one of them, so t is finite
+    first_weight = a * step_h + b * step_j
+    second_weight = d * step_h + e * step_j
+    if second_weight == 0:
+        return (c - a * h - b * j) // first_weight
+    if first_weight == 0:
+        return (f - d * h - e * j) // second_weight
+    return min((c - a * h - b * j) // first_weight, (f - d * h - e * j) // second_weight)
@@ -0,0 +1,114 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# An opt-in memoization layer for the relatively slow functions of the form `predecessor_in_personage' and
+# `successor_in_personage'.
+#
+# An instance of the class SeedCache exports the eight functions predecessor_in_Fm, successor_in_Fm, ...,
+# successor_in_FBnm as its methods, with the same signatures as in the module it wraps: the module fareysequences.py
+# (by default; then the fractions are instances of the class Fraction) or the module fareypairs.py (then the fractions
+# are pairs (h, k) of integers). The results are kept in a dictionary keyed on the name of the function, the parameters
+# of the sequence and the fraction, and the least recently used result is evicted when there are maxsize results.
+# The NEGATIVE results, that report invalid input, are never cached.
+#
+# An instance of the class SeedCache may be shared by several threads: the dictionary and the counters are guarded by
+# a lock, that is released while a missing result is being computed (so two threads may occasionally compute the same
+# result at the same time, and then the second one just refreshes it).
+# The method stats() returns a dictionary with the numbers of hits, misses and evictions, the current size and maxsize;
+# the method clear() forgets all of the results and resets the counters.
+#
+# Call for instance:
+#    >>> cache = SeedCache(maxsize=1024)
+#    >>> cache.predecessor_in_FBnm(10, 4, Fraction(1, 2)), cache.predecessor_in_FBnm(10, 4, Fraction(1, 2))
+#    >>> cache.stats()
+# to get the results:
+#    (Fraction(4, 9), Fraction(4, 9))
+#    {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 1024}
+
+
+from collections import OrderedDict
+from fractions import Fraction
+from threading import Lock
+from types import ModuleType
+
+import fareysequences
+from fareypairs import Pair
+
+
+class SeedCache:
+    __slots__ = ('__module', '__maxsize', '__results', '__lock', '__hits', '__misses', '__evictions')
+
+    def __init__(self, maxsize: int = 4096, module: ModuleType = fareysequences):
+        if maxsize < 1:
+            raise ValueError("N/A: maxsize should be > 0")
+        self.__module = module
+        self.__maxsize = maxsize
+        self.__results = OrderedDict()
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def predecessor_in_Fm(self, m: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('predecessor_in_Fm', (m,), successor)
+
+    def successor_in_Fm(self, m: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('successor_in_Fm', (m,), predecessor)
+
+    def predecessor_in_Fml(self, m: int, l: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('predecessor_in_Fml', (m, l), successor)
+
+    def successor_in_Fml(self, m: int, l: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('successor_in_Fml', (m, l), predecessor)
+
+    def predecessor_in_Gml(self, m: int, l: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('predecessor_in_Gml', (m, l), successor)
+
+    def successor_in_Gml(self, m: int, l: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('successor_in_Gml', (m, l), predecessor)
+
+    def predecessor_in_FBnm(self, n: int, m: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('predecessor_in_FBnm', (n, m), successor)
+
+    def successor_in_FBnm(self, n: int, m: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__lookup('successor_in_FBnm', (n, m), predecessor)
+
+    def stats(self) -> dict[str, int]:
+        with self.__lock:
+            return {'hits': self.__hits, 'misses': self.__misses, 'evictions': self.__evictions,
+                    'size': len(self.__results), 'maxsize': self.__maxsize}
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__results.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def __lookup(self, name: str, params: tuple, fraction: Fraction | Pair) -> Fraction | Pair:
+        key = (name, params, fraction)
+        results = self.__results
+        with self.__lock:
+            result = results.get(key)
+            if result is not None:
+                results.move_to_end(key)
+                self.__hits += 1
+                return result
+            self.__misses += 1
+        result = getattr(self.__module, name)(*params, fraction)
+        if _is_negative(result):
+            return result
+        with self.__lock:
+            results[key] = result
+            results.move_to_end(key)
+            if len(results) > self.__maxsize:
+                results.popitem(last=False)
+                self.__evictions += 1
+        return result
+
+
+def _is_negative(result: Fraction | Pair) -> bool:
+    if isinstance(result, tuple):
+        return result[1] < 0
+    return result < 0
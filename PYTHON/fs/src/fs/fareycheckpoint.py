@@ -0,0 +1,257 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Enumerations of our Dramatis Personae that survive a restart.
+#
+# An instance of the class Cursor is the whole state of an enumeration of the fractions of a sequence, in ascending
+# (or descending, if reverse == True) order, between start and stop: the personage ('Fm', 'Fml', 'Gml' or 'FBnm'),
+# the parameters, start, stop, reverse, the fraction current that is yielded next, the fraction neighbor that follows it
+# (the neighbor of current in the direction of the enumeration; it is None if current is 1/1, or 0/1, respectively),
+# and the number count of the fractions yielded so far. The cursor is exhausted when current is None.
+# Cursor(personage, params, start, stop, reverse) makes one-time use of a relatively slow function of the form
+# `successor_in_personage' (or `predecessor_in_personage') of the module fareypairs.py, as the generators of the module
+# fareyiterators.py do; the fraction the enumeration starts from should belong to the sequence, otherwise a ValueError
+# is raised.
+# The methods to_json() and from_json(text), save(path) and load(path) serialize the cursor to a small JSON document.
+# save(path) is atomic: the document is written to a temporary file in the same directory, flushed to the disk, and
+# renamed over path, so path always holds either the previous checkpoint or the new one, never a torn one.
+# A loaded cursor is checked by the O(1) functions of the form `are_neighbors_in_personage' of the module fareypairs.py,
+# and then the enumeration goes on by the functions of the form `successor_of_pair_of_neighbors_in_personage'
+# (or `predecessor_of_pair_of_neighbors_in_personage'), so resuming costs O(1), wherever the checkpoint was taken.
+#
+# iter_pairs_with_checkpoints(cursor, path, every, seconds) yields the pairs (h, k) of the fractions of the cursor,
+# and advances the cursor; it saves the cursor to path after every `every' fractions (2^20, by default), after every
+# `seconds' seconds (if seconds is not None; the clock is read once in 1024 fractions), and when the enumeration ends
+# or the generator is closed. iter_with_checkpoints does the same, but it yields instances of the class Fraction.
+# A fraction is counted by the cursor when the consumer asks for the next one, so a checkpoint never skips a fraction
+# that the consumer has not finished with; the fractions yielded after the last checkpoint are yielded once more after
+# a restart (at most `every' of them). A generator that is closed (or dropped) before the first fraction is asked for
+# never saves the cursor, since its body, with the `finally' clause that saves it, has not started yet: save the cursor
+# by cursor.save(path) to checkpoint its initial state.
+#
+# Call for instance:
+#    >>> path = 'F100000.cursor'
+#    >>> cursor = Cursor.load(path) if os.path.exists(path) else Cursor('Fm', (100000,))
+#    >>> for h, k in iter_pairs_with_checkpoints(cursor, path):
+#    ...     process(h, k)
+# and run the same code after a restart: the enumeration resumes from the last checkpoint.
+# Call:
+#    >>> cursor = Cursor('Fml', (6, 4), start=(1, 3))
+#    >>> list(islice(iter_pairs_with_checkpoints(cursor), 3)), cursor.to_json()
+# to get the result:
+#    ([(1, 3), (2, 5), (1, 2)], '{"version": 1, "personage": "Fml", "params": [6, 4], "start": [1, 3], "stop": [1, 1],
+#    "reverse": false, "current": [1, 2], "neighbor": [3, 5], "count": 2}')
+# (the third fraction is not counted yet, since the consumer has not asked for the fourth one).
+
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from fractions import Fraction
+
+import fareypairs
+from fareypairs import Pair
+
+
+VERSION = 1
+
+
+class Cursor:
+    __slots__ = ('personage', 'params', 'start', 'stop', 'reverse', 'current', 'neighbor', 'count')
+
+    def __init__(self, personage: str, params: tuple, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False):
+        # As in the module fareysequences.py, for the subsequence FB2mm give the parameters (2*m, m)
+        if personage not in _successors_in:
+            raise ValueError("N/A: unknown personage " + repr(personage))
+        self.personage = personage
+        self.params = tuple(params)
+        self.start = tuple(start)
+        self.stop = tuple(stop)
+        self.reverse = reverse
+        self.count = 0
+        # The seed function is called eagerly, so that an invalid request is reported here; when we start from
+        # an endpoint (1/1 or 0/1, respectively), the seed function of the opposite direction is called just
+        # to validate the parameters of the sequence
+        first, last = (self.stop, (0, 1)) if reverse else (self.start, (1, 1))
+        seed_in, opposite_in = ((_predecessors_in, _successors_in) if reverse else (_successors_in, _predecessors_in))
+        if first == last:
+            _raise_if_not_applicable(opposite_in[personage](*self.params, first), first)
+            neighbor = None
+        else:
+            neighbor = seed_in[personage](*self.params, first)
+            _raise_if_not_applicable(neighbor, first)
+        self.current = first
+        self.neighbor = neighbor
+        self.__exhaust_if_beyond_bound()
+
+    def to_json(self) -> str:
+        return json.dumps({'version': VERSION, 'personage': self.personage, 'params': list(self.params),
+                           'start': list(self.start), 'stop': list(self.stop), 'reverse': self.reverse,
+                           'current': _list(self.current), 'neighbor': _list(self.neighbor), 'count': self.count})
+
+    @classmethod
+    def from_json(cls, text: str) -> 'Cursor':
+        document = json.loads(text)
+        if document.get('version') != VERSION:
+            raise ValueError("N/A: unsupported version of the cursor " + repr(document.get('version')))
+        if document['personage'] not in _successors_in:
+            raise ValueError("N/A: unknown personage " + repr(document['personage']))
+        cursor = cls.__new__(cls)
+        cursor.personage = document['personage']
+        cursor.params = tuple(document['params'])
+        cursor.start = tuple(document['start'])
+        cursor.stop = tuple(document['stop'])
+        cursor.reverse = bool(document['reverse'])
+        cursor.current = _tuple(document['current'])
+        cursor.neighbor = _tuple(document['neighbor'])
+        cursor.count = document['count']
+        cursor.__check()
+        return cursor
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as output:
+                output.write(self.to_json())
+                output.flush()
+                os.fsync(output.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        _fsync_directory(directory)
+
+    @classmethod
+    def load(cls, path: str) -> 'Cursor':
+        with open(path) as document:
+            return cls.from_json(document.read())
+
+    def __repr__(self) -> str:
+        return 'Cursor(' + self.to_json() + ')'
+
+    def __check(self) -> None:
+        # A checkpoint may come from an old or a damaged file, so the pair (current, neighbor) is checked in O(1)
+        if self.current is None:
+            return
+        if self.neighbor is None:
+            if self.current != ((0, 1) if self.reverse else (1, 1)):
+                raise ValueError("N/A: the checkpoint " + str(Fraction(*self.current)) +
+                                 " should be followed by its neighbor in the sequence")
+            return
+        left, right = (self.neighbor, self.current) if self.reverse else (self.current, self.neighbor)
+        if not _are_neighbors_in[self.personage](*self.params, left, right):
+            raise ValueError("N/A: the fractions " + str(Fraction(*left)) + " and " + str(Fraction(*right)) +
+                             " of the checkpoint are not neighbors in the sequence")
+
+    def __exhaust_if_beyond_bound(self) -> None:
+        (h, k), (p, q) = self.current, (self.start if self.reverse else self.stop)
+        if (h * q < p * k) if self.reverse else (h * q > p * k):
+            self.current = None
+            self.neighbor = None
+
+
+def iter_with_checkpoints(cursor: Cursor, path: str | None = None, every: int = 1 << 20,
+                          seconds: float | None = None) -> Iterator[Fraction]:
+    for h, k in iter_pairs_with_checkpoints(cursor, path, every, seconds):
+        yield Fraction(h, k)
+
+
+def iter_pairs_with_checkpoints(cursor: Cursor, path: str | None = None, every: int = 1 << 20,
+                                seconds: float | None = None) -> Iterator[Pair]:
+    # With path == None, the cursor is only advanced, and it can be saved by the caller
+    if every < 1:
+        raise ValueError("N/A: the interval between the checkpoints should contain at least one fraction")
+    return _advance(cursor, path, every, seconds)
+
+
+_successors_in = {'Fm': fareypairs.successor_in_Fm,
+                  'Fml': fareypairs.successor_in_Fml,
+                  'Gml': fareypairs.successor_in_Gml,
+                  'FBnm': fareypairs.successor_in_FBnm}
+
+_predecessors_in = {'Fm': fareypairs.predecessor_in_Fm,
+                    'Fml': fareypairs.predecessor_in_Fml,
+                    'Gml': fareypairs.predecessor_in_Gml,
+                    'FBnm': fareypairs.predecessor_in_FBnm}
+
+_successors_of_pair = {'Fm': fareypairs.successor_of_pair_of_neighbors_in_Fm,
+                       'Fml': fareypairs.successor_of_pair_of_neighbors_in_Fml,
+                       'Gml': fareypairs.successor_of_pair_of_neighbors_in_Gml,
+                       'FBnm': fareypairs.successor_of_pair_of_neighbors_in_FBnm}
+
+_predecessors_of_pair = {'Fm': fareypairs.predecessor_of_pair_of_neighbors_in_Fm,
+                         'Fml': fareypairs.predecessor_of_pair_of_neighbors_in_Fml,
+                         'Gml': fareypairs.predecessor_of_pair_of_neighbors_in_Gml,
+                         'FBnm': fareypairs.predecessor_of_pair_of_neighbors_in_FBnm}
+
+_are_neighbors_in = {'Fm': fareypairs.are_neighbors_in_Fm,
+                     'Fml': fareypairs.are_neighbors_in_Fml,
+                     'Gml': fareypairs.are_neighbors_in_Gml,
+                     'FBnm': fareypairs.are_neighbors_in_FBnm}
+
+
+def _list(pair: Pair | None) -> list | None:
+    return None if pair is None else list(pair)
+
+
+def _tuple(pair: list | None) -> Pair | None:
+    return None if pair is None else tuple(pair)
+
+
+def _raise_if_not_applicable(seed: Pair, fraction: Pair) -> None:
+    if seed[1] < 0:
+        raise ValueError("N/A: cannot start the enumeration from " + str(Fraction(*fraction)) +
+                         ", the seed function returned " + str(Fraction(*seed)))
+
+
+def _fsync_directory(directory: str) -> None:
+    # Makes the rename durable; directories cannot be opened for fsync on every platform
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def _advance(cursor: Cursor, path: str | None, every: int, seconds: float | None) -> Iterator[Pair]:
+    params = cursor.params
+    reverse = cursor.reverse
+    p, q = cursor.start if reverse else cursor.stop
+    next_of_pair = (_predecessors_of_pair if reverse else _successors_of_pair)[cursor.personage]
+    due = cursor.count + every
+    deadline = None if seconds is None else time.monotonic() + seconds
+    try:
+        while cursor.current is not None:
+            current, neighbor = cursor.current, cursor.neighbor
+            yield current
+            # The consumer has asked for the next fraction, so it is done with the current one
+            if neighbor is None or ((neighbor[0] * q < p * neighbor[1]) if reverse else (neighbor[0] * q > p * neighbor[1])):
+                cursor.current, cursor.neighbor = None, None
+            elif (neighbor[0] == 0) if reverse else (neighbor[0] == neighbor[1]):
+                # The endpoint 0/1 (or 1/1) of the sequence is the last fraction
+                cursor.current, cursor.neighbor = neighbor, None
+            elif reverse:
+                cursor.current, cursor.neighbor = neighbor, next_of_pair(*params, neighbor, current, False)
+            else:
+                cursor.current, cursor.neighbor = neighbor, next_of_pair(*params, current, neighbor, False)
+            cursor.count += 1
+            if path is not None:
+                if cursor.count >= due:
+                    cursor.save(path)
+                    due = cursor.count + every
+                elif (deadline is not None) and (cursor.count & 1023 == 0) and (time.monotonic() >= deadline):
+                    cursor.save(path)
+                    due = cursor.count + every
+                    deadline = time.monotonic() + seconds
+    finally:
+        if path is not None:
+            cursor.save(path)
@@ -0,0 +1,436 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Counting the fractions of our Dramatis Personae without enumerating them.
+#
+# rank_in_Fm(m, x), rank_in_Fml(m, l, x), rank_in_Gml(m, l, x) and rank_in_FBnm(n, m, x) return the number of fractions
+# of the sequence that are <= x, where x is an arbitrary fraction such that 0/1 <= x <= 1/1 (not necessarily a member
+# of the sequence). If you get a NEGATIVE integer, it means that something went wrong, and its absolute value
+# reports a reason of the problem---see the source code of the function you have used.
+#
+# Let us write the fractions of the sequences as h/(h + j), where j == k - h. Then
+#    Fm   consists of the fractions with h + j <= m;
+#    Fml  consists of the fractions with h + j <= m and h <= l;
+#    Gml  consists of the fractions with h + j <= m and j <= m - l, and it is the image of the subsequence F_m^{m-l}
+#         under the map h/k |-> (k - h)/k;
+#    FBnm consists of the fractions with h <= m and j <= n - m.
+# So, apart from the fractions 0/1 and 1/1, we always count the pairs (a, b) of relatively prime positive integers
+# such that b <= N, a <= L and a <= b * p / q, for suitable N, L and p/q. The number of such pairs, not necessarily
+# relatively prime, is a sum of floors computed in O(log q) by the Euclidean-like algorithm __floor_sum,
+# and the Moebius inversion over the common divisor d of a and b, with the values of d giving the same pair
+# (N // d, L // d) grouped together, gives the number of relatively prime pairs in O(N^(3/4)) arithmetic operations.
+#
+# select_in_Fm(m, k), select_in_Fml(m, l, k), select_in_Gml(m, l, k) and select_in_FBnm(n, m, k) return the k-th fraction
+# of the sequence, where k == 1, 2, ..., so that rank_in_personage(..., select_in_personage(..., k)) == k.
+# The functions make a binary search over the fractions t / Q, where Q is the square of the bound for the denominators,
+# for the least t such that the rank of t / Q is >= k; the k-th fraction is then the only fraction with a small
+# denominator in the interval ((t - 1) / Q, t / Q], and we find it by a continued fraction (Stern-Brocot) descent.
+# So it takes O(log m) evaluations of the rank, and no enumeration at all.
+# As in the module fareysequences.py, the select_in_personage functions report problems by returning NEGATIVE fractions.
+#
+# length_of_Fm(m), length_of_Fml(m, l), length_of_Gml(m, l) and length_of_FBnm(n, m) return the numbers of fractions
+# in the sequences. They are built on two summatory functions, that of Euler's totient function, Phi(N), and
+# that of the Moebius function, the Mertens function M(N); both of them are computed in O(N^(2/3)) operations,
+# by sieving their values up to about N^(2/3), and by the recurrences
+#    Phi(N) == N * (N + 1) / 2 - (the sum of Phi(N // d) over d >= 2),
+#    M(N)   == 1 - (the sum of M(N // d) over d >= 2),
+# with the values Phi(N // d) and M(N // d) memoized in dictionaries that are kept between calls. Then
+#    |Fm|   == 1 + Phi(m);
+#    |Fml|  == 1 + R(l, m) - (Phi(l) - 1), where R(a, b) is the number of pairs of relatively prime integers
+#              in the rectangle [1, a] x [1, b], and it is the sum of M(d) - M(d - 1) times (a // d) * (b // d) over d;
+#    |Gml|  == |F_m^{m-l}|;
+#    |FBnm| == 2 + R(m, n - m).
+#
+# count_in_interval(personage, params, a, b) returns the number of fractions of the personage ('Fm', 'Fml', 'Gml'
+# or 'FBnm') that lie in the segment [a, b], for arbitrary fractions a and b such that 0/1 <= a, b <= 1/1 (0, if a > b).
+# It is the difference of the ranks of b and a, plus 1 if a is a member of the sequence, so it takes two evaluations
+# of the rank, in O(m^(3/4)) operations, without enumerating the segment. If the parameters of the sequence,
+# or a, or b, are not valid, then it returns the NEGATIVE integer returned by the rank function.
+#
+# Call for instance:
+#    >>> rank_in_Fm(5, Fraction(1, 2))
+# to get the result:
+#    6
+# and call:
+#    >>> select_in_Fm(5, 6)
+# to get the result:
+#    Fraction(1, 2)
+
+
+from fractions import Fraction
+
+
+def rank_in_Fm(m: int, x: Fraction) -> int:
+    # Call for instance:
+    #    >>> rank_in_Fm(6, Fraction(2, 3))
+    # to get the result:
+    #    9
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return -1
+    if (x < 0) or (x > 1):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return -2
+    return 1 + __count_coprime_pairs(m, m, x.numerator, x.denominator)
+
+
+def rank_in_Fml(m: int, l: int, x: Fraction) -> int:
+    # Call for instance:
+    #    >>> rank_in_Fml(6, 4, Fraction(4, 5))
+    # to get the result:
+    #    11
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return -2
+    if (x < 0) or (x > 1):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return -3
+    return 1 + __count_coprime_pairs(m, l, x.numerator, x.denominator)
+
+
+def rank_in_Gml(m: int, l: int, x: Fraction) -> int:
+    # The fractions of Gml that are <= x are the images of the fractions of F_m^{m-l} that are >= (1 - x).
+    # Call for instance:
+    #    >>> rank_in_Gml(6, 4, Fraction(1, 2))
+    # to get the result:
+    #    3
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return -2
+    if (x < 0) or (x > 1):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return -3
+    y = 1 - x
+    dual_length = length_of_Fml(m, m - l)
+    dual_rank = 1 + __count_coprime_pairs(m, m - l, y.numerator, y.denominator)
+    y_is_dual_member = (y.denominator <= m) and (y.numerator <= m - l)
+    return dual_length - dual_rank + y_is_dual_member
+
+
+def rank_in_FBnm(n: int, m: int, x: Fraction) -> int:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> rank_in_FBnm(6, 4, Fraction(3, 4))
+    # to get the result:
+    #    6
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return -2
+    if (x < 0) or (x > 1):
+        # "N/A: x should be between (0/1) (included) and (1/1) (included)"
+        return -3
+    if x == 1:
+        # All of the pairs (h, j) with h <= m and j <= n - m, and the fractions 0/1 and 1/1
+        return 2 + __count_coprime_pairs(n - m, m, m, 1)
+    # h/(h + j) <= x if and only if h <= j * x.numerator / (x.denominator - x.numerator)
+    return 1 + __count_coprime_pairs(n - m, m, x.numerator, x.denominator - x.numerator)
+
+
+def select_in_Fm(m: int, k: int) -> Fraction:
+    # Call for instance:
+    #    >>> select_in_Fm(6, 9)
+    # to get the result:
+    #    Fraction(2, 3)
+    return __select(rank_in_Fm, (m,), m, k)
+
+
+def select_in_Fml(m: int, l: int, k: int) -> Fraction:
+    # Call for instance:
+    #    >>> select_in_Fml(6, 4, 11)
+    # to get the result:
+    #    Fraction(4, 5)
+    return __select(rank_in_Fml, (m, l), m, k)
+
+
+def select_in_Gml(m: int, l: int, k: int) -> Fraction:
+    # Call for instance:
+    #    >>> select_in_Gml(6, 4, 3)
+    # to get the result:
+    #    Fraction(1, 2)
+    return __select(rank_in_Gml, (m, l), m, k)
+
+
+def select_in_FBnm(n: int, m: int, k: int) -> Fraction:
+    # Call for instance:
+    #    >>> select_in_FBnm(6, 4, 6)
+    # to get the result:
+    #    Fraction(3, 4)
+    return __select(rank_in_FBnm, (n, m), n, k)
+
+
+def __select(rank, params: tuple, bound: int, k: int) -> Fraction:
+    # bound is the largest possible denominator of the fractions of the sequence
+    length = rank(*params, Fraction(1, 1))
+    if length < 0:
+        # The parameters of the sequence are not valid, and we report the same problem as the rank function does
+        return Fraction(1, length)
+    if (k < 1) or (k > length):
+        # "N/A: k should be between 1 (included) and the length of the sequence (included)"
+        return Fraction(1, -(len(params) + 1))
+    # Two distinct fractions with denominators <= bound differ by at least 1 / (bound * (bound - 1)),
+    # so every interval ((t - 1) / q, t / q] contains at most one of them
+    q = bound * bound
+    lo, hi = 0, q
+    while lo < hi:
+        t = (lo + hi) // 2
+        if rank(*params, Fraction(t, q)) >= k:
+            hi = t
+        else:
+            lo = t + 1
+    right_end = Fraction(lo, q)
+    if right_end.denominator <= bound:
+        return right_end
+    return __simplest_fraction_between(Fraction(lo - 1, q), right_end)
+
+
+def __simplest_fraction_between(lo: Fraction, hi: Fraction) -> Fraction:
+    # The fraction with the least denominator in the open interval (lo, hi), where 0 <= lo < hi;
+    # see the continued fraction expansions of lo and hi
+    integer_part = lo.numerator // lo.denominator
+    if integer_part + 1 < hi:
+        return Fraction(integer_part + 1)
+    if lo == integer_part:
+        return integer_part + 1 / Fraction(1 // (hi - integer_part) + 1)
+    return integer_part + 1 / __simplest_fraction_between(1 / (hi - integer_part), 1 / (lo - integer_part))
+
+
+def length_of_Fm(m: int) -> int:
+    # See Remark 1.6 of the monograph. Call for instance:
+    #    >>> length_of_Fm(6)
+    # to get the result:
+    #    13
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return -1
+    __extend_sieve(m)
+    return 1 + __totient_sum(m)
+
+
+def length_of_Fml(m: int, l: int) -> int:
+    # Call for instance:
+    #    >>> length_of_Fml(6, 4)
+    # to get the result:
+    #    12
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return -2
+    __extend_sieve(m)
+    # For every numerator h <= l, the denominators k of the fractions h/k are relatively prime to h, and h <= k <= m
+    return 1 + __coprime_pairs_in_rectangle(l, m) - (__totient_sum(l) - 1)
+
+
+def length_of_Gml(m: int, l: int) -> int:
+    # The map h/k |-> (k - h)/k is a bijection between F_m^{m-l} and Gml. Call for instance:
+    #    >>> length_of_Gml(6, 4)
+    # to get the result:
+    #    9
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return -2
+    return length_of_Fml(m, m - l)
+
+
+def length_of_FBnm(n: int, m: int) -> int:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> length_of_FBnm(6, 4)
+    # to get the result:
+    #    8
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return -2
+    __extend_sieve(n)
+    # The fractions h/(h + j) with h <= m and j <= n - m, and the fractions 0/1 and 1/1
+    return 2 + __coprime_pairs_in_rectangle(m, n - m)
+
+
+__ranks = {'Fm': rank_in_Fm,
+           'Fml': rank_in_Fml,
+           'Gml': rank_in_Gml,
+           'FBnm': rank_in_FBnm}
+
+# The constraints on the numerator h and the denominator k of a reduced fraction h/k of the sequence, 0 <= h <= k;
+# IS_MEMBER[personage](h, k, *params) is True if h/k belongs to the sequence (the module fareysets.py uses it, too)
+IS_MEMBER = {'Fm': lambda h, k, m: k <= m,
+             'Fml': lambda h, k, m, l: (k <= m) and (h <= l),
+             'Gml': lambda h, k, m, l: (k <= m) and (k - h <= m - l),
+             'FBnm': lambda h, k, n, m: (h <= m) and (k - h <= n - m)}
+
+
+def count_in_interval(personage: str, params: tuple, a: Fraction, b: Fraction) -> int:
+    # Call for instance:
+    #    >>> count_in_interval('Fml', (6, 4), Fraction(1, 3), Fraction(3, 4))
+    # to get the result:
+    #    6
+    if personage not in __ranks:
+        raise ValueError("N/A: unknown personage " + repr(personage))
+    rank = __ranks[personage]
+    rank_of_b = rank(*params, b)
+    if rank_of_b < 0:
+        return rank_of_b
+    rank_of_a = rank(*params, a)
+    if rank_of_a < 0:
+        return rank_of_a
+    if a > b:
+        return 0
+    return rank_of_b - rank_of_a + IS_MEMBER[personage](a.numerator, a.denominator, *params)
+
+
+__sieve_limit = 1
+__totient_prefix_sums = [0, 1]
+__mertens_prefix_sums = [0, 1]
+__totient_sums = {}
+__mertens_values = {}
+
+
+def __extend_sieve(n: int) -> None:
+    # We sieve the values of the totient and Moebius functions up to about n^(2/3), but not beyond 10^7
+    global __sieve_limit, __totient_prefix_sums, __mertens_prefix_sums
+    limit = min(max(__integer_cube_root(n * n), 100), 10 ** 7)
+    if limit <= __sieve_limit:
+        return
+    totients = list(range(limit + 1))
+    moebius = [1] * (limit + 1)
+    for p in range(2, limit + 1):
+        if totients[p] == p:
+            for multiple in range(p, limit + 1, p):
+                totients[multiple] -= totients[multiple] // p
+                moebius[multiple] = -moebius[multiple]
+            for multiple in range(p * p, limit + 1, p * p):
+                moebius[multiple] = 0
+    totient_prefix_sums = [0] * (limit + 1)
+    mertens_prefix_sums = [0] * (limit + 1)
+    for i in range(1, limit + 1):
+        totient_prefix_sums[i] = totient_prefix_sums[i - 1] + totients[i]
+        mertens_prefix_sums[i] = mertens_prefix_sums[i - 1] + moebius[i]
+    __sieve_limit, __totient_prefix_sums, __mertens_prefix_sums = limit, totient_prefix_sums, mertens_prefix_sums
+
+
+def __integer_cube_root(n: int) -> int:
+    root = 1 << ((n.bit_length() + 2) // 3)
+    while True:
+        next_root = (2 * root + n // (root * root)) // 3
+        if next_root >= root:
+            return root
+        root = next_root
+
+
+def __totient_sum(n: int) -> int:
+    # Phi(n), the sum of Euler's totient function phi(k) over k = 1, 2, ..., n
+    if n <= __sieve_limit:
+        return __totient_prefix_sums[n]
+    if n in __totient_sums:
+        return __totient_sums[n]
+    result = n * (n + 1) // 2
+    d = 2
+    while d <= n:
+        d_last = n // (n // d)
+        result -= (d_last - d + 1) * __totient_sum(n // d)
+        d = d_last + 1
+    __totient_sums[n] = result
+    return result
+
+
+def __mertens(n: int) -> int:
+    # M(n), the sum of the Moebius function mu(k) over k = 1, 2, ..., n
+    if n <= __sieve_limit:
+        return __mertens_prefix_sums[n]
+    if n in __mertens_values:
+        return __mertens_values[n]
+    result = 1
+    d = 2
+    while d <= n:
+        d_last = n // (n // d)
+        result -= (d_last - d + 1) * __mertens(n // d)
+        d = d_last + 1
+    __mertens_values[n] = result
+    return result
+
+
+def __coprime_pairs_in_rectangle(a: int, b: int) -> int:
+    # The number of pairs (x, y) of relatively prime integers such that 1 <= x <= a and 1 <= y <= b
+    result = 0
+    d, d_max = 1, min(a, b)
+    previous_mertens = 0
+    while d <= d_max:
+        d_last = min(a // (a // d), b // (b // d))
+        current_mertens = __mertens(d_last)
+        result += (current_mertens - previous_mertens) * (a // d) * (b // d)
+        previous_mertens = current_mertens
+        d = d_last + 1
+    return result
+
+
+def __floor_sum(n: int, p: int, q: int) -> int:
+    # The sum of floor(b * p / q) over b = 1, 2, ..., n, for p >= 0 and q > 0, computed in O(log q) steps
+    # (this is the classical Euclidean-like algorithm for the sum of floor((a * i + c) / q) over i = 0, 1, ..., n - 1)
+    result = 0
+    n, a, c = n + 1, p, 0
+    while True:
+        if a >= q:
+            result += (n - 1) * n // 2 * (a // q)
+            a %= q
+        if c >= q:
+            result += n * (c // q)
+            c %= q
+        y_max = a * n + c
+        if y_max < q:
+            return result
+        n, c = divmod(y_max, q)
+        q, a = a, q
+
+
+def __count_pairs(n: int, l: int, p: int, q: int) -> int:
+    # The number of pairs (a, b) of positive integers (not necessarily relatively prime)
+    # such that b <= n, a <= l and a <= b * p / q, that is, the sum of min(l, floor(b * p / q)) over b = 1, 2, ..., n
+    if (n <= 0) or (l <= 0) or (p == 0):
+        return 0
+    # For b <= b_max, we have floor(b * p / q) <= l
+    b_max = min(n, ((l + 1) * q - 1) // p)
+    return __floor_sum(b_max, p, q) + l * (n - b_max)
+
+
+def __count_coprime_pairs(n: int, l: int, p: int, q: int) -> int:
+    # The number of pairs (a, b) of relatively prime positive integers such that b <= n, a <= l and a <= b * p / q.
+    # If C(n, l) denotes this number, then the number of all such pairs is the sum of C(n // d, l // d) over d >= 1;
+    # we invert this relation, and memoize the values C(n // d, l // d)
+    memo = {}
+
+    def count(n: int, l: int) -> int:
+        if (n <= 0) or (l <= 0):
+            return 0
+        if (n, l) in memo:
+            return memo[(n, l)]
+        result = __count_pairs(n, l, p, q)
+        d = 2
+        while d <= n:
+            n_d, l_d = n // d, l // d
+            if l_d == 0:
+                break
+            # All of the divisors d, d + 1, ..., d_last give the same pair (n // d, l // d)
+            d_last = min(n // n_d, l // l_d)
+            result -= (d_last - d + 1) * count(n_d, l_d)
+            d = d_last + 1
+        memo[(n, l)] = result
+        return result
+
+    return count(n, l)
@@ -0,0 +1,207 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# A binary file format for precomputed Farey (sub)sequences, and its memory-mapped reader.
+#
+# A file consists of
+#    a header of 64 bytes: the magic string b'FAREYSEQ', the version of the format (an unsigned 16-bit integer),
+#    the width w of the integers in bytes (an unsigned 16-bit integer, 4 or 8), the name of the personage
+#    ('Fm', 'Fml', 'Gml' or 'FBnm', an ASCII string padded by zero bytes to 8 bytes), the two parameters
+#    of the sequence (the second one is 0 for the sequence Fm) and the number N of the fractions in the sequence
+#    (unsigned 64-bit integers), padded by zero bytes;
+#    the numerators of the fractions in ascending order (N unsigned w-byte integers);
+#    the denominators of the fractions in the same order (N unsigned w-byte integers).
+# All of the integers are little-endian.
+#
+# The functions write_Fm(path, m), write_Fml(path, m, l), write_Gml(path, m, l) and write_FBnm(path, n, m) get the number
+# of the fractions in advance from the module fareycounting.py, and then they stream the sequence from the generators
+# of the module fareyiterators.py into the two arrays of the file chunk by chunk, so they use a constant amount of memory;
+# they return the number of the fractions written.
+#
+# An instance of the class FareyFile maps a file into memory (read-only), so there is no parsing at startup, and
+# all of the processes that open the same file share one copy of it in the page cache. It supports len(), indexing,
+# slicing, iteration and the binary search of the class FareyArray, by a FareyArray that views the mapped memory
+# without copying it (see the property array). Close the file (or leave the `with' block) only after dropping
+# all of the slices taken from it, since they view the same memory.
+#
+# Call for instance:
+#    >>> write_Fm('F1000.farey', 1000)
+#    >>> with FareyFile('F1000.farey') as sequence:
+#    ...     sequence.personage, sequence.params, len(sequence), sequence.bisect_left(Fraction(1, 2))
+# to get the results:
+#    304193
+#    ('Fm', (1000,), 304193, 152096)
+
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from fractions import Fraction
+
+import fareycounting
+import fareyiterators
+from fareyarray import FareyArray, _typecode_for
+from fareypairs import Pair
+
+
+MAGIC = b'FAREYSEQ'
+VERSION = 1
+HEADER = struct.Struct('<8sHH8sQQQ20x')
+HEADER_SIZE = HEADER.size
+
+
+def write_Fm(path: str, m: int, chunk: int = 1 << 16) -> int:
+    return __write(path, 'Fm', (m,), chunk)
+
+
+def write_Fml(path: str, m: int, l: int, chunk: int = 1 << 16) -> int:
+    return __write(path, 'Fml', (m, l), chunk)
+
+
+def write_Gml(path: str, m: int, l: int, chunk: int = 1 << 16) -> int:
+    return __write(path, 'Gml', (m, l), chunk)
+
+
+def write_FBnm(path: str, n: int, m: int, chunk: int = 1 << 16) -> int:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    return __write(path, 'FBnm', (n, m), chunk)
+
+
+class FareyFile:
+    __slots__ = ('__file', '__map', '__numerators', '__denominators', '__array', '__personage', '__params')
+
+    def __init__(self, path: str):
+        self.__file = open(path, 'rb')
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError("N/A: " + path + " is empty") from None
+        try:
+            magic, version, width, personage, first, second, count = HEADER.unpack_from(self.__map)
+            if (magic != MAGIC) or (version != VERSION) or (width not in (4, 8)):
+                raise ValueError("N/A: " + path + " is not a file of Farey fractions of version " + str(VERSION))
+            if len(self.__map) != HEADER_SIZE + 2 * width * count:
+                raise ValueError("N/A: " + path + " is truncated")
+            if sys.byteorder != 'little':
+                raise ValueError("N/A: the files are little-endian, and they can be mapped on little-endian machines only")
+            typecode = 'I' if array('I').itemsize == width else 'Q'
+            view = memoryview(self.__map)
+            self.__numerators = view[HEADER_SIZE:HEADER_SIZE + width * count].cast(typecode)
+            self.__denominators = view[HEADER_SIZE + width * count:].cast(typecode)
+            view.release()
+        except BaseException:
+            self.__map.close()
+            self.__file.close()
+            raise
+        self.__personage = personage.rstrip(b'\0').decode('ascii')
+        self.__params = (first,) if self.__personage == 'Fm' else (first, second)
+        self.__array = FareyArray.from_buffers(self.__numerators, self.__denominators)
+
+    @property
+    def personage(self) -> str:
+        return self.__personage
+
+    @property
+    def params(self) -> tuple:
+        return self.__params
+
+    @property
+    def array(self) -> FareyArray:
+        return self.__array
+
+    def __len__(self) -> int:
+        return len(self.__array)
+
+    def __getitem__(self, index: int | slice) -> 'Fraction | FareyArray':
+        return self.__array[index]
+
+    def pair(self, index: int) -> Pair:
+        return self.__array.pair(index)
+
+    def pairs(self) -> Iterator[Pair]:
+        return self.__array.pairs()
+
+    def __iter__(self) -> Iterator[Fraction]:
+        return iter(self.__array)
+
+    def bisect_left(self, fraction: Fraction | Pair, lo: int = 0, hi: int | None = None) -> int:
+        return self.__array.bisect_left(fraction, lo, hi)
+
+    def bisect_right(self, fraction: Fraction | Pair, lo: int = 0, hi: int | None = None) -> int:
+        return self.__array.bisect_right(fraction, lo, hi)
+
+    def index(self, fraction: Fraction | Pair) -> int:
+        return self.__array.index(fraction)
+
+    def __contains__(self, fraction: Fraction | Pair) -> bool:
+        return fraction in self.__array
+
+    def close(self) -> None:
+        self.__array = None
+        self.__numerators.release()
+        self.__denominators.release()
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self) -> 'FareyFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return ('FareyFile(' + repr(self.__file.name) + ': ' + self.__personage + str(self.__params) + ', ' +
+                str(len(self.__numerators)) + ' fractions)')
+
+
+__iterators = {'Fm': fareyiterators.iter_pairs_Fm,
+               'Fml': fareyiterators.iter_pairs_Fml,
+               'Gml': fareyiterators.iter_pairs_Gml,
+               'FBnm': fareyiterators.iter_pairs_FBnm}
+
+__lengths = {'Fm': fareycounting.length_of_Fm,
+             'Fml': fareycounting.length_of_Fml,
+             'Gml': fareycounting.length_of_Gml,
+             'FBnm': fareycounting.length_of_FBnm}
+
+
+def __write(path: str, personage: str, params: tuple, chunk: int) -> int:
+    count = __lengths[personage](*params)
+    if count < 0:
+        raise ValueError("N/A: cannot write the sequence, the length function returned " + str(count))
+    typecode = _typecode_for(max(params))
+    width = array(typecode).itemsize
+    numerators = array(typecode)
+    denominators = array(typecode)
+    written = 0
+    with open(path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, VERSION, width, personage.encode('ascii'), params[0],
+                                 params[1] if len(params) > 1 else 0, count))
+        # The file gets its final size at once, and the two arrays are then filled in chunks at their own offsets
+        output.truncate(HEADER_SIZE + 2 * width * count)
+        for h, k in __iterators[personage](*params):
+            numerators.append(h)
+            denominators.append(k)
+            if len(numerators) == chunk:
+                __write_chunk(output, numerators, denominators, written, width, count)
+                written += len(numerators)
+                del numerators[:], denominators[:]
+        __write_chunk(output, numerators, denominators, written, width, count)
+        written += len(numerators)
+    if written != count:
+        raise RuntimeError("N/A: " + str(written) + " fractions were written instead of " + str(count))
+    return count
+
+
+def __write_chunk(output, numerators: array, denominators: array, position: int, width: int, count: int) -> None:
+    if sys.byteorder != 'little':
+        numerators.byteswap()
+        denominators.byteswap()
+    output.seek(HEADER_SIZE + width * position)
+    numerators.tofile(output)
+    output.seek(HEADER_SIZE + width * (count + position))
+    denominators.tofile(output)
@@ -0,0 +1,407 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Pre-validated handles of our Dramatis Personae:
+#
+# FareySequence(m)          is a handle of the sequence Fm;
+# FareySubsequenceF(m, l)   is a handle of the subsequence Fml;
+# FareySubsequenceG(m, l)   is a handle of the subsequence Gml;
+# FareySubsequenceFB(n, m)  is a handle of the subsequence FBnm (give the value of (2*m) for the parameter n
+#                           to get a handle of the subsequence FB2mm).
+#
+# The functions of the modules fareysequences.py and fareypairs.py check the parameters of the sequence, and recompute
+# the quantities such as (m - l) and (n - m), at every call. A handle checks the parameters once, in its constructor,
+# that raises a ValueError if they are not valid, and keeps the parameters and the constants derived from them
+# (among them, the neighbors of the special fractions 1/3, 1/2 and 2/3 of the subsequences FBnm and FB2mm)
+# in its slots. As in the module fareypairs.py, every fraction h/k is represented by a pair (h, k) of integers.
+#
+# seed_before(x) and seed_after(x) return the predecessor and the successor of the fraction x of the sequence;
+# as the functions of the form `predecessor_in_personage' and `successor_in_personage' do, they check that x belongs
+# to the sequence, and they report a problem by returning a pair with a NEGATIVE denominator, which is
+# the same as the denominator returned by the corresponding function of the module fareypairs.py.
+#
+# prev_before(successor, right_neighbor_of_successor) and next_after(left_neighbor_of_predecessor, predecessor)
+# are the recurrent steps: they do the same as the functions of the form `predecessor_of_pair_of_neighbors_in_personage'
+# and `successor_of_pair_of_neighbors_in_personage' with check_pair == False, and they check nothing at all,
+# so they should only be given pairs of neighboring fractions of the sequence (and never the pairs ending in 0/1
+# or 1/1, respectively, that have no predecessor or successor).
+#
+# Call for instance:
+#    >>> F6 = FareySequence(6)
+#    >>> a, b = (0, 1), F6.seed_after((0, 1))
+#    >>> for _ in range(4):
+#    ...     a, b = b, F6.next_after(a, b)
+#    >>> b
+# to get the result:
+#    (2, 5)
+
+
+import fareypairs
+from fareypairs import Pair, _predecessor_with_numerator_in, _successor_with_numerator_in
+
+
+class FareySequence:
+    __slots__ = ('__m', '__before_one', '__after_zero')
+
+    def __init__(self, m: int):
+        if m < 1:
+            raise ValueError("N/A: Order m of the sequence should be > 0")
+        self.__m = m
+        self.__before_one = (m - 1, m)
+        self.__after_zero = (1, m)
+
+    @property
+    def m(self) -> int:
+        return self.__m
+
+    def seed_before(self, successor: Pair) -> Pair:
+        # See Lemma 2.9(i) and Table 2.1 of the monograph. Call for instance:
+        #    >>> FareySequence(6).seed_before((2, 3))
+        # to get the result:
+        #    (3, 5)
+        c, d = successor
+        if (c <= 0) or (c > d):
+            # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+            return 1, -2
+        if d > self.__m:
+            # "N/A: Denominator of the successor should not exceed the order m of the sequence"
+            return 1, -3
+        if c == d:
+            return self.__before_one
+        return _predecessor_with_numerator_in(-(-(c * self.__m) // d) - c, c, d)
+
+    def seed_after(self, predecessor: Pair) -> Pair:
+        # See Lemma 2.9(ii) and Table 2.3 of the monograph. Call for instance:
+        #    >>> FareySequence(6).seed_after((1, 3))
+        # to get the result:
+        #    (2, 5)
+        a, b = predecessor
+        if (a < 0) or (a >= b):
+            # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+            return 1, -2
+        if b > self.__m:
+            # "N/A: Denominator of the predecessor should not exceed the order m of the sequence"
+            return 1, -3
+        if a == 0:
+            return self.__after_zero
+        return _successor_with_numerator_in(-(-(a * self.__m + 2) // b) - a, a, b)
+
+    def prev_before(self, successor: Pair, right_neighbor_of_successor: Pair) -> Pair:
+        # See Proposition 1.25 and Table 1.6 of the monograph
+        c, d = successor
+        e, f = right_neighbor_of_successor
+        farey_index = (self.__m + f) // d
+        return farey_index * c - e, farey_index * d - f
+
+    def next_after(self, left_neighbor_of_predecessor: Pair, predecessor: Pair) -> Pair:
+        # See Proposition 1.25 and Table 1.6 of the monograph
+        a, b = left_neighbor_of_predecessor
+        c, d = predecessor
+        farey_index = (self.__m + b) // d
+        return farey_index * c - a, farey_index * d - b
+
+    def __repr__(self) -> str:
+        return 'FareySequence(' + str(self.__m) + ')'
+
+
+class FareySubsequenceF:
+    __slots__ = ('__m', '__l', '__before_one', '__after_zero')
+
+    def __init__(self, m: int, l: int):
+        if m < 2:
+            raise ValueError("N/A: Parameter m of the sequence should be > 1")
+        if (l <= 0) or (l >= m):
+            raise ValueError("N/A: Parameter l should be between 0 (excluded) and m (excluded)")
+        self.__m = m
+        self.__l = l
+        self.__before_one = (l, l + 1)
+        self.__after_zero = (1, m)
+
+    @property
+    def m(self) -> int:
+        return self.__m
+
+    @property
+    def l(self) -> int:
+        return self.__l
+
+    def seed_before(self, successor: Pair) -> Pair:
+        # See Lemma 2.13(i)(a)-(b) and Table 2.1 of the monograph. Call for instance:
+        #    >>> FareySubsequenceF(6, 4).seed_before((1, 1))
+        # to get the result:
+        #    (4, 5)
+        c, d = successor
+        m, l = self.__m, self.__l
+        if (c <= 0) or (c > d):
+            # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+            return 1, -3
+        if d > m:
+            # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+            return 1, -4
+        if l < c:
+            # "N/A: Numerator of the successor should be between 1 (included) and l (included)"
+            return 1, -5
+        if c == d:
+            return self.__before_one
+        if c * m - d * l >= 1:
+            return _predecessor_with_numerator_in(l - c + 1, c, d)
+        return _predecessor_with_numerator_in(-(-(c * m) // d) - c, c, d)
+
+    def seed_after(self, predecessor: Pair) -> Pair:
+        # See Lemma 2.13(ii)(a)-(b) and Table 2.3 of the monograph. Call for instance:
+        #    >>> FareySubsequenceF(6, 4).seed_after((4, 5))
+        # to get the result:
+        #    (1, 1)
+        a, b = predecessor
+        m, l = self.__m, self.__l
+        if (a < 0) or (a >= b):
+            # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+            return 1, -3
+        if b > m:
+            # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+            return 1, -4
+        if l < a:
+            # "N/A: Numerator of the predecessor should be between 1 (included) and l (included)"
+            return 1, -5
+        if a == 0:
+            return self.__after_zero
+        if b * l - a * m >= 1:
+            return _successor_with_numerator_in(-(-(a * m + 2) // b) - a, a, b)
+        return _successor_with_numerator_in(l - a + 1, a, b)
+
+    def prev_before(self, successor: Pair, right_neighbor_of_successor: Pair) -> Pair:
+        # See Proposition 1.26 (ii) (a) and Table 1.6 of the monograph
+        c, d = successor
+        e, f = right_neighbor_of_successor
+        if c * self.__m - d * self.__l >= 1:
+            farey_index = (self.__l + e) // c
+        else:
+            farey_index = (self.__m + f) // d
+        return farey_index * c - e, farey_index * d - f
+
+    def next_after(self, left_neighbor_of_predecessor: Pair, predecessor: Pair) -> Pair:
+        # See Proposition 1.26 (ii) (a) and Table 1.6 of the monograph
+        a, b = left_neighbor_of_predecessor
+        c, d = predecessor
+        if d * self.__l - c * self.__m >= 1:
+            farey_index = (self.__m + b) // d
+        else:
+            farey_index = (self.__l + a) // c
+        return farey_index * c - a, farey_index * d - b
+
+    def __repr__(self) -> str:
+        return 'FareySubsequenceF(' + str(self.__m) + ', ' + str(self.__l) + ')'
+
+
+class FareySubsequenceG:
+    __slots__ = ('__m', '__l', '__m_minus_l', '__before_one', '__after_zero')
+
+    def __init__(self, m: int, l: int):
+        if m < 2:
+            raise ValueError("N/A: Parameter m of the sequence should be > 1")
+        if (l <= 0) or (l >= m):
+            raise ValueError("N/A: Parameter l should be between 0 (excluded) and m (excluded)")
+        self.__m = m
+        self.__l = l
+        self.__m_minus_l = m - l
+        # See Remark 1.13 and Table 1.5 of the monograph
+        self.__before_one = (m - 1, m)
+        self.__after_zero = (1, m - l + 1)
+
+    @property
+    def m(self) -> int:
+        return self.__m
+
+    @property
+    def l(self) -> int:
+        return self.__l
+
+    def seed_before(self, successor: Pair) -> Pair:
+        # See Lemma 2.15(i)(a)-(b) and Table 2.1 of the monograph. Call for instance:
+        #    >>> FareySubsequenceG(6, 4).seed_before((1, 3))
+        # to get the result:
+        #    (0, 1)
+        c, d = successor
+        m, l = self.__m, self.__l
+        if (c <= 0) or (c > d):
+            # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+            return 1, -3
+        if d > m:
+            # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+            return 1, -4
+        if l + d - m > c:
+            # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the successor"
+            return 1, -5
+        if c == d:
+            return self.__before_one
+        if c * m - d * l >= 1:
+            ref_point = -(-(c * m) // d)
+        else:
+            ref_point = -(-(c * self.__m_minus_l) // (d - c))
+        return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+    def seed_after(self, predecessor: Pair) -> Pair:
+        # See Lemma 2.15(ii)(a)-(b) and Table 2.3 of the monograph. Call for instance:
+        #    >>> FareySubsequenceG(6, 4).seed_after((1, 3))
+        # to get the result:
+        #    (1, 2)
+        a, b = predecessor
+        m, l = self.__m, self.__l
+        if (a < 0) or (a >= b):
+            # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+            return 1, -3
+        if b > m:
+            # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+            return 1, -4
+        if l + b - m > a:
+            # "N/A: Denominator of the predecessor minus its numerator should not exceed (m - l)"
+            return 1, -5
+        if a == 0:
+            return self.__after_zero
+        if b * l - a * m >= 1:
+            ref_point = -(-(a * self.__m_minus_l + 2) // (b - a))
+        else:
+            ref_point = -(-(a * m + 2) // b)
+        return _successor_with_numerator_in(ref_point - a, a, b)
+
+    def prev_before(self, successor: Pair, right_neighbor_of_successor: Pair) -> Pair:
+        # See Proposition 1.27 (ii) (a) and Table 1.6 of the monograph
+        c, d = successor
+        e, f = right_neighbor_of_successor
+        if c * self.__m - d * self.__l >= 1:
+            farey_index = (self.__m + f) // d
+        else:
+            farey_index = (self.__m_minus_l + f - e) // (d - c)
+        return farey_index * c - e, farey_index * d - f
+
+    def next_after(self, left_neighbor_of_predecessor: Pair, predecessor: Pair) -> Pair:
+        # See Proposition 1.27 (ii) (b) and Table 1.6 of the monograph
+        a, b = left_neighbor_of_predecessor
+        c, d = predecessor
+        if d * self.__l - c * self.__m >= 1:
+            farey_index = (self.__m_minus_l + b - a) // (d - c)
+        else:
+            farey_index = (self.__m + b) // d
+        return farey_index * c - a, farey_index * d - b
+
+    def __repr__(self) -> str:
+        return 'FareySubsequenceG(' + str(self.__m) + ', ' + str(self.__l) + ')'
+
+
+class FareySubsequenceFB:
+    __slots__ = ('__n', '__m', '__n_minus_m', '__n_below_2m', '__code_shift', '__predecessors_of_specials',
+                 '__successors_of_specials')
+
+    def __init__(self, n: int, m: int):
+        if n < 2:
+            raise ValueError("N/A: Parameter n of the sequence should be > 1")
+        if (m < 1) or (m >= n):
+            raise ValueError("N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)")
+        self.__n = n
+        self.__m = m
+        self.__n_minus_m = n - m
+        self.__n_below_2m = n < 2 * m
+        # The functions for the subsequence FB2mm check one parameter less, so their codes are less by one
+        self.__code_shift = 1 if n == 2 * m else 0
+        # The neighbors of the fractions 0/1, 1/3, 1/2, 2/3 and 1/1, including those of the subsequence FB2mm
+        # (see Remarks 2.17, 2.42, 2.43 and Tables 2.5, 2.7, 2.8 of the monograph), are found once
+        # by the functions of the module fareypairs.py; the special fractions that do not belong
+        # to the subsequence are left out, so that they get the usual membership checks
+        self.__predecessors_of_specials = {}
+        self.__successors_of_specials = {}
+        for special in ((1, 1), (2, 3), (1, 2), (1, 3)):
+            predecessor = fareypairs.predecessor_in_FBnm(n, m, special)
+            if predecessor[1] > 0:
+                self.__predecessors_of_specials[special] = predecessor
+        for special in ((0, 1), (1, 3), (1, 2), (2, 3)):
+            successor = fareypairs.successor_in_FBnm(n, m, special)
+            if successor[1] > 0:
+                self.__successors_of_specials[special] = successor
+
+    @property
+    def n(self) -> int:
+        return self.__n
+
+    @property
+    def m(self) -> int:
+        return self.__m
+
+    def seed_before(self, successor: Pair) -> Pair:
+        # See the function predecessor_in_FBnm of the module fareysequences.py. Call for instance:
+        #    >>> FareySubsequenceFB(6, 4).seed_before((3, 4))
+        # to get the result:
+        #    (2, 3)
+        c, d = successor
+        n, m = self.__n, self.__m
+        if (c <= 0) or (c > d):
+            # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+            return 1, self.__code_shift - 3
+        if d > n:
+            # "N/A: Denominator of the successor should not exceed the parameter n of the sequence"
+            return 1, self.__code_shift - 4
+        if (m + d - n > c) or (c > m):
+            # "N/A: Numerator of the successor should be between (m + denominator - n) (included) and m (included)"
+            return 1, self.__code_shift - 5
+        special = self.__predecessors_of_specials.get(successor)
+        if special is not None:
+            return special
+        # For n == 2 * m, both conditions below reduce to (2 * c > d), as in the function __predecessor_in_FB2mm
+        if self.__n_below_2m:
+            generic = (2 * c > d) and (c * n - d * m >= 1)
+        else:
+            generic = (2 * c > d) or (c * n - d * m >= 1)
+        if generic:
+            return _predecessor_with_numerator_in(m - c + 1, c, d)
+        return _predecessor_with_numerator_in(-(-(c * self.__n_minus_m) // (d - c)) - c, c, d)
+
+    def seed_after(self, predecessor: Pair) -> Pair:
+        # See the function successor_in_FBnm of the module fareysequences.py. Call for instance:
+        #    >>> FareySubsequenceFB(6, 4).seed_after((4, 5))
+        # to get the result:
+        #    (1, 1)
+        a, b = predecessor
+        n, m = self.__n, self.__m
+        if (a < 0) or (a >= b):
+            # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+            return 1, self.__code_shift - 3
+        if b > n:
+            # "N/A: Denominator of the predecessor should not exceed the parameter n of the sequence"
+            return 1, self.__code_shift - 4
+        if (m + b - n > a) or (a > m):
+            # "N/A: Numerator of the predecessor should be between (m + denominator - n) (included) and m (included)"
+            return 1, self.__code_shift - 5
+        special = self.__successors_of_specials.get(predecessor)
+        if special is not None:
+            return special
+        # For n == 2 * m, both conditions below reduce to (2 * a > b), as in the function __successor_in_FB2mm
+        if self.__n_below_2m:
+            generic = (2 * a > b) and (b * m - a * n <= 1)
+        else:
+            generic = (2 * a > b) or (b * m - a * n <= 1)
+        if generic:
+            return _successor_with_numerator_in(m - a + 1, a, b)
+        return _successor_with_numerator_in(-(-(a * self.__n_minus_m + 2) // (b - a)) - a, a, b)
+
+    def prev_before(self, successor: Pair, right_neighbor_of_successor: Pair) -> Pair:
+        # See Proposition 1.28 (ii) (a) and Table 1.6 of the monograph
+        c, d = successor
+        e, f = right_neighbor_of_successor
+        if c * self.__n - d * self.__m >= 1:
+            farey_index = (self.__m + e) // c
+        else:
+            farey_index = (self.__n_minus_m + f - e) // (d - c)
+        return farey_index * c - e, farey_index * d - f
+
+    def next_after(self, left_neighbor_of_predecessor: Pair, predecessor: Pair) -> Pair:
+        # See Proposition 1.28 (ii) (b) and Table 1.6 of the monograph
+        a, b = left_neighbor_of_predecessor
+        c, d = predecessor
+        if d * self.__m - c * self.__n >= 1:
+            farey_index = (self.__n_minus_m + b - a) // (d - c)
+        else:
+            farey_index = (self.__m + a) // c
+        return farey_index * c - a, farey_index * d - b
+
+    def __repr__(self) -> str:
+        return 'FareySubsequenceFB(' + str(self.__n) + ', ' + str(self.__m) + ')'
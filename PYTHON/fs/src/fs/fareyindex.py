@@ -0,0 +1,166 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Indexed lookup of neighbors in materialized Farey (sub)sequences.
+#
+# Once a sequence has been materialized in a FareyArray (see the module fareyarray.py) or memory-mapped by a FareyFile
+# (see the module fareyfile.py), the neighbors of its fractions can be found by a binary search over the array,
+# on cross-multiplied keys, in O(log N) comparisons, without the arithmetic of the lemmas of the monograph.
+#
+# An instance of the class FareyIndex keeps a collection of such arrays, registered by the methods add(personage, params,
+# terms) and add_file(file), and exports the eight functions predecessor_in_Fm, successor_in_Fm, ..., successor_in_FBnm
+# as its methods, with the same signatures as the functions of the modules fareysequences.py and fareypairs.py: if the
+# fraction is an instance of the class Fraction, then the result is an instance of the class Fraction, and if it is
+# a pair (h, k) of integers, then the result is a pair. When the sequence has not been registered, or the fraction is not
+# a member of the registered array (or has no neighbor in it), the call is passed to the corresponding function of the
+# module fareysequences.py or fareypairs.py, so an instance of the class FareyIndex returns exactly what that function
+# would return, including the NEGATIVE fractions that report invalid input.
+# The method bracket(personage, params, x) returns, as the functions of the module fareybracket.py do, the pair
+# (left, right) of the neighboring fractions of a registered array such that left <= x < right (or left < x == right,
+# for x == 1/1), for any fraction x, not necessarily a member of the sequence; a neighbor that lies beyond the registered
+# array is reported as None.
+#
+# engine(name, index) returns an object exporting the eight functions: the module fareysequences.py for the name
+# 'fareysequences', the module fareypairs.py for the name 'fareypairs', and the index for the name 'indexed',
+# so that the engine can be chosen by configuration.
+# Note that the indexed engine is SLOWER than the formulas: the closed formulas of the module fareypairs.py take O(1)
+# arithmetic operations, while the binary search takes O(log N) comparisons of Python integers, so on the sequences Fm
+# of the orders from 10 to 3000 a call of the index is about 4 to 9 times slower than a call of the function of the module
+# fareypairs.py, and the gap grows with the length of the array. The index pays off only when its arrays are needed
+# anyway, say, when they are memory-mapped from the files of the module fareyfile.py.
+#
+# measure_engines(orders, queries) compares the time per call of the formula-based functions of the module fareypairs.py
+# and of an index, on random members of the sequences Fm of the given orders.
+#
+# Call for instance:
+#    >>> index = FareyIndex()
+#    >>> index.add('Fm', (6,), FareyArray.from_Fm(6))
+#    >>> index.predecessor_in_Fm(6, Fraction(2, 3)), index.bracket('Fm', (6,), Fraction(7, 10))
+# to get the result:
+#    (Fraction(3, 5), ((2, 3), (3, 4)))
+
+
+import random
+import time
+from collections.abc import Callable
+from fractions import Fraction
+from types import ModuleType
+
+import fareypairs
+import fareysequences
+from fareyarray import FareyArray
+from fareyfile import FareyFile
+from fareypairs import Pair
+
+
+class FareyIndex:
+    __slots__ = ('__sequences',)
+
+    def __init__(self):
+        self.__sequences = {}
+
+    def add(self, personage: str, params: tuple, terms: FareyArray | FareyFile) -> None:
+        # personage is one of 'Fm', 'Fml', 'Gml', 'FBnm'; the terms should be consecutive fractions of the sequence,
+        # say, the whole sequence or its part between two fractions
+        if personage not in ('Fm', 'Fml', 'Gml', 'FBnm'):
+            raise ValueError("N/A: unknown personage " + repr(personage))
+        self.__sequences[(personage, tuple(params))] = terms
+
+    def add_file(self, file: FareyFile) -> None:
+        self.add(file.personage, file.params, file)
+
+    def remove(self, personage: str, params: tuple) -> None:
+        del self.__sequences[(personage, tuple(params))]
+
+    def predecessor_in_Fm(self, m: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('predecessor_in_Fm', 'Fm', (m,), successor, -1)
+
+    def successor_in_Fm(self, m: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('successor_in_Fm', 'Fm', (m,), predecessor, 1)
+
+    def predecessor_in_Fml(self, m: int, l: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('predecessor_in_Fml', 'Fml', (m, l), successor, -1)
+
+    def successor_in_Fml(self, m: int, l: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('successor_in_Fml', 'Fml', (m, l), predecessor, 1)
+
+    def predecessor_in_Gml(self, m: int, l: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('predecessor_in_Gml', 'Gml', (m, l), successor, -1)
+
+    def successor_in_Gml(self, m: int, l: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('successor_in_Gml', 'Gml', (m, l), predecessor, 1)
+
+    def predecessor_in_FBnm(self, n: int, m: int, successor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('predecessor_in_FBnm', 'FBnm', (n, m), successor, -1)
+
+    def successor_in_FBnm(self, n: int, m: int, predecessor: Fraction | Pair) -> Fraction | Pair:
+        return self.__neighbor('successor_in_FBnm', 'FBnm', (n, m), predecessor, 1)
+
+    def bracket(self, personage: str, params: tuple, x: Fraction | Pair) -> tuple[Pair | None, Pair | None]:
+        # Call for instance:
+        #    >>> index.bracket('Fm', (6,), (1, 3))
+        # to get the result:
+        #    ((1, 3), (2, 5))
+        terms = self.__sequences[(personage, tuple(params))]
+        h, k = (x.numerator, x.denominator) if isinstance(x, Fraction) else x
+        # The first term that is > x, or, for x == 1/1, the first term that is >= x
+        i = terms.bisect_left(x) if h == k else terms.bisect_right(x)
+        return (terms.pair(i - 1) if i > 0 else None), (terms.pair(i) if i < len(terms) else None)
+
+    def __neighbor(self, name: str, personage: str, params: tuple, x: Fraction | Pair, step: int) -> Fraction | Pair:
+        is_fraction = isinstance(x, Fraction)
+        terms = self.__sequences.get((personage, params))
+        if terms is not None:
+            pair = (x.numerator, x.denominator) if is_fraction else x
+            i = terms.bisect_left(pair)
+            if (0 <= i + step < len(terms)) and (i < len(terms)) and (terms.pair(i) == pair):
+                h, k = terms.pair(i + step)
+                return Fraction(h, k) if is_fraction else (h, k)
+        return getattr(fareysequences if is_fraction else fareypairs, name)(*params, x)
+
+    def __repr__(self) -> str:
+        return 'FareyIndex(' + ', '.join(personage + str(params) for personage, params in self.__sequences) + ')'
+
+
+def engine(name: str, index: FareyIndex | None = None) -> ModuleType | FareyIndex:
+    # The engine 'indexed' is slower than the engine 'fareypairs' (see the notes at the top of the module)
+    # Call for instance:
+    #    >>> lookup = engine(config.get('farey_engine', 'fareypairs'), index)
+    #    >>> lookup.successor_in_Fm(6, (1, 3))
+    # to get the result:
+    #    (2, 5)
+    match name:
+        case 'fareysequences':
+            return fareysequences
+        case 'fareypairs':
+            return fareypairs
+        case 'indexed':
+            if index is None:
+                raise ValueError("N/A: the indexed engine needs an instance of the class FareyIndex")
+            return index
+        case _:
+            raise ValueError("N/A: unknown engine " + repr(name))
+
+
+def measure_engines(orders: tuple = (10, 100, 1000, 3000), queries: int = 10000,
+                    seed: int = 0) -> list[tuple[int, float, float]]:
+    # Returns the list of triples (m, seconds per call of fareypairs.successor_in_Fm, seconds per call of the index),
+    # where the same random members of the sequence Fm are given to both engines
+    results = []
+    generator = random.Random(seed)
+    for m in orders:
+        terms = FareyArray.from_Fm(m)
+        index = FareyIndex()
+        index.add('Fm', (m,), terms)
+        sample = [terms.pair(generator.randrange(len(terms) - 1)) for _ in range(queries)]
+        results.append((m, __time_per_call(fareypairs.successor_in_Fm, m, sample),
+                        __time_per_call(index.successor_in_Fm, m, sample)))
+    return results
+
+
+def __time_per_call(function: Callable, m: int, sample: list[Pair]) -> float:
+    started = time.perf_counter()
+    for x in sample:
+        function(m, x)
+    return (time.perf_counter() - started) / len(sample)
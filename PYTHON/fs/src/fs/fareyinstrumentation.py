@@ -0,0 +1,205 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Opt-in instrumentation of the module fareysequences.py.
+#
+# When the instrumentation is enabled, the functions of the module fareysequences.py are replaced, in the namespace
+# of that module, by wrappers that record
+#    the number of calls of every exported function, and a histogram of its latencies (with the buckets
+#    [2^(i-1), 2^i) nanoseconds);
+#    the branch taken by every call: the chain of private functions it went through, for instance
+#    `__predecessor_in_FB2mm > __predecessor_of_two_thirds_in_FB2mm' for the special fraction 2/3 of the subsequence
+#    FB2mm, `__find_numerator_of_predecessor' for the generic branch, `(inline formula)' if the result was computed
+#    in the function itself, and `(invalid input)' if the result was a negative fraction;
+#    for every search of a numerator, the number of candidates inspected (always 1, since the numerator is found
+#    by one modular inversion) and the width of the search interval (the number of candidates a scan of the whole
+#    interval would have inspected).
+# The O(1) checks of the form `are_neighbors_in_personage', that the functions of the form
+# `predecessor_of_pair_of_neighbors_in_personage' and `successor_of_pair_of_neighbors_in_personage' call
+# with check_pair == True, are not wrapped: their time is a part of the latency of the calling function.
+# When the instrumentation is disabled, the original functions are put back, so it costs nothing at all.
+# Note that a name imported by `from fareysequences import ...' refers to the function that was in place
+# at the time of the import.
+#
+# The instrumentation is enabled by enable(), within a `with instrumented():' block, or, for the whole run
+# of a program, by setting the environment variable FAREY_INSTRUMENTATION to a non-empty value (then this module
+# enables it as soon as it is imported, so the program should import it, whether before or after the module
+# fareysequences.py).
+# snapshot() returns the data collected as a dictionary, report() returns them as a text, and reset() forgets them.
+#
+# Call for instance:
+#    >>> with instrumented():
+#    ...     predecessor_in_FBnm(10, 5, Fraction(2, 3))
+#    >>> snapshot()['branches']['predecessor_in_FBnm']
+# to get the result:
+#    {'__predecessor_in_FB2mm > __predecessor_of_two_thirds_in_FB2mm': 1}
+
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import fareysequences
+
+
+def enable() -> None:
+    with __lock:
+        if __originals:
+            return
+        for name, function in list(vars(fareysequences).items()):
+            if not callable(function) or isinstance(function, type):
+                continue
+            if name.startswith(('predecessor_', 'successor_')):
+                __originals[name] = function
+                setattr(fareysequences, name, __exported_wrapper(name, function))
+            elif name.startswith('__find_numerator_of_'):
+                __originals[name] = function
+                setattr(fareysequences, name, __search_wrapper(name, function))
+            elif name.startswith(('__predecessor_', '__successor_')):
+                __originals[name] = function
+                setattr(fareysequences, name, __branch_wrapper(name, function))
+
+
+def disable() -> None:
+    with __lock:
+        for name, function in __originals.items():
+            setattr(fareysequences, name, function)
+        __originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(__originals)
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    # The instrumentation is left enabled on exit if it was enabled on entry
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset() -> None:
+    with __lock:
+        __calls.clear()
+        __total_ns.clear()
+        __latencies.clear()
+        __branches.clear()
+        __searches.clear()
+
+
+def snapshot() -> dict:
+    with __lock:
+        return {'calls': dict(__calls),
+                'latency_ns': {name: {'total': __total_ns[name],
+                                      'histogram': dict(sorted(latencies.items()))}
+                               for name, latencies in __latencies.items()},
+                'branches': {name: dict(branches) for name, branches in __branches.items()},
+                'numerator_searches': {name: dict(searches) for name, searches in __searches.items()}}
+
+
+def report() -> str:
+    data = snapshot()
+    lines = ['Calls (total latency, mean latency, latency histogram in ns):']
+    for name, count in sorted(data['calls'].items()):
+        latency = data['latency_ns'][name]
+        histogram = ', '.join('<' + str(bound) + ': ' + str(n) for bound, n in latency['histogram'].items())
+        lines.append('  ' + name + ': ' + str(count) + ' calls, ' + str(latency['total']) + ' ns, ' +
+                     str(latency['total'] // count) + ' ns per call; ' + histogram)
+    lines.append('Branches:')
+    for name, branches in sorted(data['branches'].items()):
+        for branch, count in sorted(branches.items(), key=lambda item: -item[1]):
+            lines.append('  ' + name + ': ' + branch + ': ' + str(count))
+    lines.append('Numerator searches:')
+    for name, searches in sorted(data['numerator_searches'].items()):
+        lines.append('  ' + name + ': ' + str(searches['searches']) + ' searches, ' +
+                     str(searches['candidates']) + ' candidates inspected, ' +
+                     str(searches['interval_width']) + ' candidates in the search intervals')
+    return '\n'.join(lines)
+
+
+__lock = threading.RLock()
+__originals = {}
+__calls = {}
+__total_ns = {}
+__latencies = {}
+__branches = {}
+__searches = {}
+__frames = threading.local()
+
+
+def __stack() -> list:
+    # The stack of the exported functions being called in the current thread, with the branches they have taken
+    stack = getattr(__frames, 'stack', None)
+    if stack is None:
+        stack = __frames.stack = []
+    return stack
+
+
+def __exported_wrapper(name: str, function: Callable) -> Callable:
+    def wrapper(*args):
+        stack = __stack()
+        frame = [name, []]
+        stack.append(frame)
+        started = time.perf_counter_ns()
+        try:
+            result = function(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            stack.pop()
+        if result < 0:
+            branch = '(invalid input)'
+        elif frame[1]:
+            branch = ' > '.join(frame[1])
+        else:
+            branch = '(inline formula)'
+        with __lock:
+            __calls[name] = __calls.get(name, 0) + 1
+            __total_ns[name] = __total_ns.get(name, 0) + elapsed
+            latencies = __latencies.setdefault(name, {})
+            bound = 1 << elapsed.bit_length()
+            latencies[bound] = latencies.get(bound, 0) + 1
+            branches = __branches.setdefault(name, {})
+            branches[branch] = branches.get(branch, 0) + 1
+        return result
+    wrapper.__name__ = name
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def __branch_wrapper(name: str, function: Callable) -> Callable:
+    def wrapper(*args):
+        stack = __stack()
+        if stack:
+            stack[-1][1].append(name)
+        return function(*args)
+    wrapper.__name__ = name
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def __search_wrapper(name: str, function: Callable) -> Callable:
+    def wrapper(search_interval, fraction):
+        stack = __stack()
+        if stack:
+            stack[-1][1].append(name)
+        with __lock:
+            searches = __searches.setdefault(name, {'searches': 0, 'candidates': 0, 'interval_width': 0})
+            searches['searches'] += 1
+            searches['candidates'] += 1
+            searches['interval_width'] += search_interval[1] - search_interval[0] + 1
+        return function(search_interval, fraction)
+    wrapper.__name__ = name
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+if os.environ.get('FAREY_INSTRUMENTATION'):
+    enable()
@@ -0,0 +1,204 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Generators that lazily yield the fractions of our Dramatis Personae, in ascending or descending order:
+#
+# iter_Fm(m, start, stop, reverse)      yields the fractions of the sequence Fm that lie between start and stop;
+# iter_Fml(m, l, start, stop, reverse)  yields the fractions of the subsequence Fml that lie between start and stop;
+# iter_Gml(m, l, start, stop, reverse)  yields the fractions of the subsequence Gml that lie between start and stop;
+# iter_FBnm(n, m, start, stop, reverse) yields the fractions of the subsequence FBnm that lie between start and stop.
+#
+# Each generator does what you would otherwise do by hand: it makes one-time use of a relatively slow function
+# of the form `successor_in_personage' (or `predecessor_in_personage', if reverse == True) to get the starting pair
+# of neighboring fractions, and then it proceeds by calling, in the recurrent manner, the corresponding relatively fast
+# function of the form `successor_of_pair_of_neighbors_in_personage' (or `predecessor_of_pair_of_neighbors_in_personage').
+# Only the current pair of neighboring fractions is kept in memory.
+#
+# The fraction the enumeration starts from (start, if reverse == False; stop, if reverse == True) should belong
+# to the sequence; otherwise, a ValueError is raised, and its message reports the negative fraction returned
+# by the seed function. The other end of the interval may be an arbitrary fraction.
+#
+# The generators iter_pairs_Fm, iter_pairs_Fml, iter_pairs_Gml and iter_pairs_FBnm do the same, but they take and yield
+# plain pairs (h, k) of integers, as the functions of the module fareypairs.py do; they are the faster ones.
+#
+# The generators iter_checked_pairs_Fm(m, pairs), iter_checked_pairs_Fml(m, l, pairs), iter_checked_pairs_Gml(m, l, pairs)
+# and iter_checked_pairs_FBnm(n, m, pairs) pass through a stream of pairs (h, k) from an untrusted source, and check
+# every two consecutive pairs by the O(1) functions of the form `are_neighbors_in_personage' of the module fareypairs.py;
+# at the first two pairs that are not neighbors in the sequence, a ValueError is raised (before the second of them
+# is yielded).
+#
+# Call for instance:
+#    >>> list(iter_Fm(5, Fraction(1, 3), Fraction(3, 5)))
+# to get the result:
+#    [Fraction(1, 3), Fraction(2, 5), Fraction(1, 2), Fraction(3, 5)]
+
+
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+
+import fareypairs
+from fareypairs import Pair
+
+
+def iter_Fm(m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1),
+            reverse: bool = False) -> Iterator[Fraction]:
+    # Call for instance:
+    #    >>> list(iter_Fm(3, reverse=True))
+    # to get the result:
+    #    [Fraction(1, 1), Fraction(2, 3), Fraction(1, 2), Fraction(1, 3), Fraction(0, 1)]
+    return __fractions(iter_pairs_Fm(m, __pair(start), __pair(stop), reverse))
+
+
+def iter_Fml(m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1),
+             reverse: bool = False) -> Iterator[Fraction]:
+    # Call for instance:
+    #    >>> list(iter_Fml(4, 1))
+    # to get the result:
+    #    [Fraction(0, 1), Fraction(1, 4), Fraction(1, 3), Fraction(1, 2), Fraction(1, 1)]
+    return __fractions(iter_pairs_Fml(m, l, __pair(start), __pair(stop), reverse))
+
+
+def iter_Gml(m: int, l: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1),
+             reverse: bool = False) -> Iterator[Fraction]:
+    # Call for instance:
+    #    >>> list(iter_Gml(4, 3))
+    # to get the result:
+    #    [Fraction(0, 1), Fraction(1, 2), Fraction(2, 3), Fraction(3, 4), Fraction(1, 1)]
+    return __fractions(iter_pairs_Gml(m, l, __pair(start), __pair(stop), reverse))
+
+
+def iter_FBnm(n: int, m: int, start: Fraction = Fraction(0, 1), stop: Fraction = Fraction(1, 1),
+              reverse: bool = False) -> Iterator[Fraction]:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> list(iter_FBnm(4, 2))
+    # to get the result:
+    #    [Fraction(0, 1), Fraction(1, 3), Fraction(1, 2), Fraction(2, 3), Fraction(1, 1)]
+    return __fractions(iter_pairs_FBnm(n, m, __pair(start), __pair(stop), reverse))
+
+
+def iter_pairs_Fm(m: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False) -> Iterator[Pair]:
+    # Call for instance:
+    #    >>> list(iter_pairs_Fm(4, (1, 3), (1, 2)))
+    # to get the result:
+    #    [(1, 3), (1, 2)]
+    return __iterate((m,), fareypairs.successor_in_Fm, fareypairs.successor_of_pair_of_neighbors_in_Fm,
+                     fareypairs.predecessor_in_Fm, fareypairs.predecessor_of_pair_of_neighbors_in_Fm,
+                     start, stop, reverse)
+
+
+def iter_pairs_Fml(m: int, l: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False) -> Iterator[Pair]:
+    return __iterate((m, l), fareypairs.successor_in_Fml, fareypairs.successor_of_pair_of_neighbors_in_Fml,
+                     fareypairs.predecessor_in_Fml, fareypairs.predecessor_of_pair_of_neighbors_in_Fml,
+                     start, stop, reverse)
+
+
+def iter_pairs_Gml(m: int, l: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False) -> Iterator[Pair]:
+    return __iterate((m, l), fareypairs.successor_in_Gml, fareypairs.successor_of_pair_of_neighbors_in_Gml,
+                     fareypairs.predecessor_in_Gml, fareypairs.predecessor_of_pair_of_neighbors_in_Gml,
+                     start, stop, reverse)
+
+
+def iter_pairs_FBnm(n: int, m: int, start: Pair = (0, 1), stop: Pair = (1, 1), reverse: bool = False) -> Iterator[Pair]:
+    return __iterate((n, m), fareypairs.successor_in_FBnm, fareypairs.successor_of_pair_of_neighbors_in_FBnm,
+                     fareypairs.predecessor_in_FBnm, fareypairs.predecessor_of_pair_of_neighbors_in_FBnm,
+                     start, stop, reverse)
+
+
+def iter_checked_pairs_Fm(m: int, pairs: Iterable[Pair]) -> Iterator[Pair]:
+    # Call for instance:
+    #    >>> list(iter_checked_pairs_Fm(4, [(1, 3), (1, 2), (3, 4)]))
+    # to get the error:
+    #    ValueError: N/A: the fractions 1/2 and 3/4 at the positions 1 and 2 are not neighbors in the sequence
+    return __check((m,), fareypairs.are_neighbors_in_Fm, pairs)
+
+
+def iter_checked_pairs_Fml(m: int, l: int, pairs: Iterable[Pair]) -> Iterator[Pair]:
+    return __check((m, l), fareypairs.are_neighbors_in_Fml, pairs)
+
+
+def iter_checked_pairs_Gml(m: int, l: int, pairs: Iterable[Pair]) -> Iterator[Pair]:
+    return __check((m, l), fareypairs.are_neighbors_in_Gml, pairs)
+
+
+def iter_checked_pairs_FBnm(n: int, m: int, pairs: Iterable[Pair]) -> Iterator[Pair]:
+    return __check((n, m), fareypairs.are_neighbors_in_FBnm, pairs)
+
+
+def __pair(fraction: Fraction) -> Pair:
+    return fraction.numerator, fraction.denominator
+
+
+def __fractions(pairs: Iterator[Pair]) -> Iterator[Fraction]:
+    for h, k in pairs:
+        yield Fraction(h, k)
+
+
+def __iterate(params: tuple, successor_in: Callable, successor_of_pair: Callable,
+              predecessor_in: Callable, predecessor_of_pair: Callable,
+              start: Pair, stop: Pair, reverse: bool) -> Iterator[Pair]:
+    # The seed function is called eagerly, so that an invalid request is reported at the call site
+    # and not at the first call of next(); when we start from an endpoint (1/1 or 0/1, respectively),
+    # the seed function of the opposite direction is called just to validate the parameters of the sequence
+    if not reverse:
+        if start == (1, 1):
+            __raise_if_not_applicable(predecessor_in(*params, start), start)
+            second = None
+        else:
+            second = successor_in(*params, start)
+            __raise_if_not_applicable(second, start)
+        return __ascend(params, successor_of_pair, start, second, stop)
+    else:
+        if stop == (0, 1):
+            __raise_if_not_applicable(successor_in(*params, stop), stop)
+            second = None
+        else:
+            second = predecessor_in(*params, stop)
+            __raise_if_not_applicable(second, stop)
+        return __descend(params, predecessor_of_pair, stop, second, start)
+
+
+def __check(params: tuple, are_neighbors: Callable, pairs: Iterable[Pair]) -> Iterator[Pair]:
+    previous = None
+    for position, pair in enumerate(pairs):
+        if (previous is not None) and not are_neighbors(*params, previous, pair):
+            raise ValueError("N/A: the fractions " + str(Fraction(*previous)) + " and " + str(Fraction(*pair)) +
+                             " at the positions " + str(position - 1) + " and " + str(position) +
+                             " are not neighbors in the sequence")
+        yield pair
+        previous = pair
+
+
+def __raise_if_not_applicable(seed: Pair, fraction: Pair) -> None:
+    if seed[1] < 0:
+        raise ValueError("N/A: cannot start the enumeration from " + str(Fraction(*fraction)) +
+                         ", the seed function returned " + str(Fraction(*seed)))
+
+
+def __ascend(params: tuple, successor_of_pair: Callable, a: Pair, b: Pair | None, stop: Pair) -> Iterator[Pair]:
+    p, q = stop
+    if a[0] * q > p * a[1]:
+        return
+    yield a
+    if b is None:
+        return
+    while b[0] * q <= p * b[1]:
+        yield b
+        if b[0] == b[1]:
+            return
+        a, b = b, successor_of_pair(*params, a, b, False)
+
+
+def __descend(params: tuple, predecessor_of_pair: Callable, b: Pair, a: Pair | None, start: Pair) -> Iterator[Pair]:
+    p, q = start
+    if b[0] * q < p * b[1]:
+        return
+    yield b
+    if a is None:
+        return
+    while a[0] * q >= p * a[1]:
+        yield a
+        if a[0] == 0:
+            return
+        a, b = predecessor_of_pair(*params, a, b, False), a
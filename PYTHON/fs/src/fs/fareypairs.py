@@ -0,0 +1,802 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# This module is a parallel version of the module fareysequences.py: it exports the functions with the same names
+# and the same signatures, but every fraction h/k is represented by a plain pair (h, k) of integers
+# instead of an instance of the class Fraction.
+#
+# Neighboring fractions in the Farey (sub)sequences are always reduced, so we never have to normalize the pairs
+# by computing gcd's, and we compare fractions by cross-multiplying their numerators and denominators.
+# This makes the functions of this module several times faster in hot iteration loops.
+#
+# The input pairs (h, k) are supposed to represent REDUCED fractions h/k with k > 0.
+#
+# In healthy situations, all of the exported functions below return pairs (h, k) of relatively prime integers
+# such that 0 <= h <= k.
+# If you get a pair with a NEGATIVE denominator, it means that something went wrong,
+# and the denominator of the resulting pair has no computational meaning,
+# since it just reports a reason of the problem---see the source code of the function you have used.
+# The reasons reported are the same as in the corresponding functions of the module fareysequences.py.
+#
+# The functions are_neighbors_in_Fm, are_neighbors_in_Fml, are_neighbors_in_Gml and are_neighbors_in_FBnm check in O(1)
+# operations whether two fractions a/b < c/d are neighbors in the sequence: both of them should be members,
+# b*c - a*d should be 1 (then every fraction between them is of the form (s*a + t*c)/(s*b + t*d) with s, t >= 1),
+# and the mediant (a + c)/(b + d) should NOT be a member (and then, since the constraints that define our sequences
+# bound the numerators h and the differences k - h from above, no fraction between them is a member). The functions
+# of the form `predecessor_of_pair_of_neighbors_in_personage' and `successor_of_pair_of_neighbors_in_personage'
+# call them when check_pair == True.
+#
+# Call for instance:
+#    >>> successor_of_pair_of_neighbors_in_Fm(6, (3, 5), successor_in_Fm(6, (3, 5)), False)
+# to get the result:
+#    (3, 4)
+
+
+Pair = tuple[int, int]
+
+
+def predecessor_in_Fm(m: int, successor: Pair) -> Pair:
+    # See Lemma 2.9(i) and Table 2.1 of the monograph. Call for instance:
+    #    >>> predecessor_in_Fm(6, (2, 3))
+    # to get the result:
+    #    (3, 5)
+    c, d = successor
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return 1, -1
+    if (c <= 0) or (c > d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+        return 1, -2
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the order m of the sequence"
+        return 1, -3
+    if c == d:
+        return m - 1, m
+    ref_point = -(-(c * m) // d)
+    return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+
+def successor_in_Fm(m: int, predecessor: Pair) -> Pair:
+    # See Lemma 2.9(ii) and Table 2.3 of the monograph. Call for instance:
+    #    >>> successor_in_Fm(6, (1, 3))
+    # to get the result:
+    #    (2, 5)
+    a, b = predecessor
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return 1, -1
+    if (a < 0) or (a >= b):
+        # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+        return 1, -2
+    if b > m:
+        # "N/A: Denominator of the predecessor should not exceed the order m of the sequence"
+        return 1, -3
+    if a == 0:
+        return 1, m
+    ref_point = -(-(a * m + 2) // b)
+    return _successor_with_numerator_in(ref_point - a, a, b)
+
+
+def predecessor_in_Fml(m: int, l: int, successor: Pair) -> Pair:
+    # See Lemma 2.13(i)(a)-(b) and Table 2.1 of the monograph. Call for instance:
+    #    >>> predecessor_in_Fml(6, 4, (1, 1))
+    # to get the result:
+    #    (4, 5)
+    c, d = successor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if (c <= 0) or (c > d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+        return 1, -3
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+        return 1, -4
+    if l < c:
+        # "N/A: Numerator of the successor should be between 1 (included) and l (included)"
+        return 1, -5
+    if c == d:
+        return l, l + 1
+    if c * m - d * l >= 1:
+        return _predecessor_with_numerator_in(l - c + 1, c, d)
+    else:
+        ref_point = -(-(c * m) // d)
+        return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+
+def successor_in_Fml(m: int, l: int, predecessor: Pair) -> Pair:
+    # See Lemma 2.13(ii)(a)-(b) and Table 2.3 of the monograph. Call for instance:
+    #    >>> successor_in_Fml(6, 4, (4, 5))
+    # to get the result:
+    #    (1, 1)
+    a, b = predecessor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if (a < 0) or (a >= b):
+        # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+        return 1, -3
+    if b > m:
+        # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+        return 1, -4
+    if l < a:
+        # "N/A: Numerator of the predecessor should be between 1 (included) and l (included)"
+        return 1, -5
+    if a == 0:
+        return 1, m
+    if b * l - a * m >= 1:
+        ref_point = -(-(a * m + 2) // b)
+        return _successor_with_numerator_in(ref_point - a, a, b)
+    else:
+        return _successor_with_numerator_in(l - a + 1, a, b)
+
+
+def predecessor_in_Gml(m: int, l: int, successor: Pair) -> Pair:
+    # See Lemma 2.15(i)(a)-(b) and Table 2.1 of the monograph. Call for instance:
+    #    >>> predecessor_in_Gml(6, 4, (1, 3))
+    # to get the result:
+    #    (0, 1)
+    c, d = successor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if (c <= 0) or (c > d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+        return 1, -3
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+        return 1, -4
+    if l + d - m > c:
+        # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the successor"
+        return 1, -5
+    if c == d:
+        # See Remark 1.13 and Table 1.5 of the monograph
+        return m - 1, m
+    if c * m - d * l >= 1:
+        ref_point = -(-(c * m) // d)
+    else:
+        ref_point = -(-(c * (m - l)) // (d - c))
+    return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+
+def successor_in_Gml(m: int, l: int, predecessor: Pair) -> Pair:
+    # See Lemma 2.15(ii)(a)-(b) and Table 2.3 of the monograph. Call for instance:
+    #    >>> successor_in_Gml(6, 4, (1, 3))
+    # to get the result:
+    #    (1, 2)
+    a, b = predecessor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if (a < 0) or (a >= b):
+        # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+        return 1, -3
+    if b > m:
+        # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+        return 1, -4
+    if l + b - m > a:
+        # "N/A: Denominator of the predecessor minus its numerator should not exceed (m - l)"
+        return 1, -5
+    if a == 0:
+        return 1, m - l + 1
+    if b * l - a * m >= 1:
+        ref_point = -(-(a * (m - l) + 2) // (b - a))
+    else:
+        ref_point = -(-(a * m + 2) // b)
+    return _successor_with_numerator_in(ref_point - a, a, b)
+
+
+def __predecessor_in_FB2mm(m: int, successor: Pair) -> Pair:
+    # See the function __predecessor_in_FB2mm of the module fareysequences.py
+    c, d = successor
+    if m < 1:
+        # "N/A: Parameter m of the sequence should be > 0"
+        return 1, -1
+    if (c <= 0) or (c > d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+        return 1, -2
+    if d > 2 * m:
+        # "N/A: Denominator of the successor should not exceed (2 * m)"
+        return 1, -3
+    if (d - m > c) or (c > m):
+        # "N/A: Numerator of the successor should be between (denominator - m) (included) and m (included)"
+        return 1, -4
+    match successor:
+        case (1, 1):
+            return m, m + 1
+        case (2, 3):
+            if m % 2 == 0:
+                return m - 1, (3 * m - 2) // 2
+            else:
+                return m, (3 * m + 1) // 2
+        case (1, 2):
+            return m - 1, 2 * m - 1
+        case (1, 3):
+            if m % 2 == 0:
+                return (m - 2) // 2, (3 * m - 4) // 2
+            else:
+                return (m - 1) // 2, (3 * m - 1) // 2
+        case _:
+            if 2 * c > d:
+                return _predecessor_with_numerator_in(m - c + 1, c, d)
+            else:
+                ref_point = -(-(c * m) // (d - c))
+                return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+
+def __successor_in_FB2mm(m: int, predecessor: Pair) -> Pair:
+    # See the function __successor_in_FB2mm of the module fareysequences.py
+    a, b = predecessor
+    if m < 1:
+        # "N/A: Parameter m of the sequence should be > 0"
+        return 1, -1
+    if (a < 0) or (a >= b):
+        # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+        return 1, -2
+    if b > 2 * m:
+        # "N/A: Denominator of the predecessor should not exceed (2 * m)"
+        return 1, -3
+    if (b - m > a) or (a > m):
+        # "N/A: Numerator of the predecessor should be between (denominator - m) (included) and m (included)"
+        return 1, -4
+    match predecessor:
+        case (0, 1):
+            return 1, m + 1
+        case (1, 3):
+            if m % 2 == 0:
+                return m // 2, (3 * m - 2) // 2
+            else:
+                return (m + 1) // 2, (3 * m + 1) // 2
+        case (1, 2):
+            return m, 2 * m - 1
+        case (2, 3):
+            if m % 2 == 0:
+                return m - 1, (3 * m - 4) // 2
+            else:
+                return m, (3 * m - 1) // 2
+        case _:
+            if 2 * a < b:
+                ref_point = -(-(a * m + 2) // (b - a))
+                return _successor_with_numerator_in(ref_point - a, a, b)
+            else:
+                return _successor_with_numerator_in(m - a + 1, a, b)
+
+
+def predecessor_in_FBnm(n: int, m: int, successor: Pair) -> Pair:
+    # See the function predecessor_in_FBnm of the module fareysequences.py. Call for instance:
+    #    >>> predecessor_in_FBnm(6, 4, (3, 4))
+    # to get the result:
+    #    (2, 3)
+    if n == 2 * m:
+        return __predecessor_in_FB2mm(m, successor)
+    c, d = successor
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return 1, -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return 1, -2
+    if (c <= 0) or (c > d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (included)"
+        return 1, -3
+    if d > n:
+        # "N/A: Denominator of the successor should not exceed the parameter n of the sequence"
+        return 1, -4
+    if (m + d - n > c) or (c > m):
+        # "N/A: Numerator of the successor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -5
+    match successor:
+        case (1, 1):
+            return m, m + 1
+        case (2, 3):
+            # See CORRECTED Remark 2.43(i) and Remark 2.43(ii) and CORRECTED Table 2.8 of the monograph
+            if (n < 2 * m) and (2 * n - 3 * m < 1):
+                return 2 * (n - m) - 1, 3 * (n - m) - 1
+            elif m % 2 == 0:
+                return m - 1, (3 * m - 2) // 2
+            else:
+                return m, (3 * m + 1) // 2
+        case (1, 2):
+            # See Remark 2.17 and Table 2.5 of the monograph
+            if n < 2 * m:
+                return n - m - 1, 2 * (n - m) - 1
+            else:
+                return m, 2 * m + 1
+        case (1, 3):
+            # See CORRECTED Remark 2.42 and Table 2.7 of the monograph
+            if (n >= 2 * m) and (n - 3 * m >= 1):
+                return m, 3 * m + 1
+            elif (n - m) % 2 == 0:
+                return (n - m - 2) // 2, (3 * (n - m) - 4) // 2
+            else:
+                return (n - m - 1) // 2, (3 * (n - m) - 1) // 2
+        case _:
+            if n < 2 * m:
+                generic = (2 * c > d) and (c * n - d * m >= 1)
+            else:
+                generic = (2 * c > d) or (c * n - d * m >= 1)
+            if generic:
+                return _predecessor_with_numerator_in(m - c + 1, c, d)
+            else:
+                ref_point = -(-(c * (n - m)) // (d - c))
+                return _predecessor_with_numerator_in(ref_point - c, c, d)
+
+
+def successor_in_FBnm(n: int, m: int, predecessor: Pair) -> Pair:
+    # See the function successor_in_FBnm of the module fareysequences.py. Call for instance:
+    #    >>> successor_in_FBnm(6, 4, (4, 5))
+    # to get the result:
+    #    (1, 1)
+    if n == 2 * m:
+        return __successor_in_FB2mm(m, predecessor)
+    a, b = predecessor
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return 1, -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return 1, -2
+    if (a < 0) or (a >= b):
+        # "N/A: predecessor should be between (0/1) (included) and (1/1) (excluded)"
+        return 1, -3
+    if b > n:
+        # "N/A: Denominator of the predecessor should not exceed the parameter n of the sequence"
+        return 1, -4
+    if (m + b - n > a) or (a > m):
+        # "N/A: Numerator of the predecessor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -5
+    match predecessor:
+        case (0, 1):
+            return 1, n - m + 1
+        case (1, 3):
+            # See CORRECTED Remark 2.42 and Table 2.7 of the monograph
+            if (n >= 2 * m) and (3 * m - n <= 1):
+                return m, 3 * m - 1
+            elif (n - m) % 2 == 0:
+                return (n - m) // 2, (3 * (n - m) - 2) // 2
+            else:
+                return (n - m + 1) // 2, (3 * (n - m) + 1) // 2
+        case (1, 2):
+            # See Remark 2.17 and Table 2.5 of the monograph
+            if n < 2 * m:
+                return n - m + 1, 2 * (n - m) + 1
+            else:
+                return m, 2 * m - 1
+        case (2, 3):
+            # See Remarks 2.43(i)-(ii) and Table 2.8 of the monograph
+            if (n < 2 * m) and (3 * m - 2 * n >= 1):
+                return 2 * (n - m) + 1, 3 * (n - m) + 1
+            elif m % 2 == 0:
+                return m - 1, (3 * m - 4) // 2
+            else:
+                return m, (3 * m - 1) // 2
+        case _:
+            if n < 2 * m:
+                generic = (2 * a > b) and (b * m - a * n <= 1)
+            else:
+                generic = (2 * a > b) or (b * m - a * n <= 1)
+            if generic:
+                return _successor_with_numerator_in(m - a + 1, a, b)
+            else:
+                ref_point = -(-(a * (n - m) + 2) // (b - a))
+                return _successor_with_numerator_in(ref_point - a, a, b)
+
+
+# The two helpers below are shared with the classes of the module fareyhandles.py
+
+def _predecessor_with_numerator_in(lower_bound: int, c: int, d: int) -> Pair:
+    # The numerator x of the predecessor of c/d is the unique element of the interval [lower_bound, lower_bound + c - 1]
+    # such that (d * x + 1) is divisible by c
+    x = lower_bound + (-pow(d, -1, c) - lower_bound) % c
+    return x, (d * x + 1) // c
+
+
+def _successor_with_numerator_in(lower_bound: int, a: int, b: int) -> Pair:
+    # The numerator x of the successor of a/b is the unique element of the interval [lower_bound, lower_bound + a - 1]
+    # such that (b * x - 1) is divisible by a
+    x = lower_bound + (pow(b, -1, a) - lower_bound) % a
+    return x, (b * x - 1) // a
+
+
+def are_neighbors_in_Fm(m: int, left: Pair, right: Pair) -> bool:
+    # Both fractions are members of the sequence, b*c - a*d == 1, and the mediant is not a member. Call for instance:
+    #    >>> are_neighbors_in_Fm(6, (3, 5), (2, 3))
+    # to get the result:
+    #    True
+    a, b = left
+    c, d = right
+    return ((m >= 1) and (a >= 0) and (c <= d) and (b <= m) and (d <= m)
+            and (b * c - a * d == 1) and (b + d > m))
+
+
+def are_neighbors_in_Fml(m: int, l: int, left: Pair, right: Pair) -> bool:
+    # Call for instance:
+    #    >>> are_neighbors_in_Fml(6, 4, (3, 4), (4, 5))
+    # to get the result:
+    #    True
+    a, b = left
+    c, d = right
+    return ((m >= 2) and (0 < l < m) and (a >= 0) and (c <= d) and (b <= m) and (d <= m) and (a <= l) and (c <= l)
+            and (b * c - a * d == 1) and ((b + d > m) or (a + c > l)))
+
+
+def are_neighbors_in_Gml(m: int, l: int, left: Pair, right: Pair) -> bool:
+    # Call for instance:
+    #    >>> are_neighbors_in_Gml(6, 4, (1, 3), (1, 2))
+    # to get the result:
+    #    True
+    a, b = left
+    c, d = right
+    return ((m >= 2) and (0 < l < m) and (a >= 0) and (c <= d) and (b <= m) and (d <= m)
+            and (b - a <= m - l) and (d - c <= m - l)
+            and (b * c - a * d == 1) and ((b + d > m) or (b + d - a - c > m - l)))
+
+
+def are_neighbors_in_FBnm(n: int, m: int, left: Pair, right: Pair) -> bool:
+    # As for the other functions, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> are_neighbors_in_FBnm(6, 4, (1, 3), (1, 2))
+    # to get the result:
+    #    True
+    a, b = left
+    c, d = right
+    return ((0 < m < n) and (a >= 0) and (c <= d) and (a <= m) and (c <= m)
+            and (b - a <= n - m) and (d - c <= n - m)
+            and (b * c - a * d == 1) and ((a + c > m) or (b + d - a - c > n - m)))
+
+
+def predecessor_of_pair_of_neighbors_in_Fm(m: int, successor: Pair, right_neighbor_of_successor: Pair,
+                                           check_pair: bool) -> Pair:
+    # See Proposition 1.25 and Table 1.6 of the monograph. Call for instance:
+    #    >>> predecessor_of_pair_of_neighbors_in_Fm(6, (1, 3), (2, 5), True)
+    # to get the result:
+    #    (1, 4)
+    c, d = successor
+    e, f = right_neighbor_of_successor
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return 1, -1
+    if c * f >= e * d:
+        # "N/A: We should have successor < right_neighbor_of_successor"
+        return 1, -2
+    if (c <= 0) or (c >= d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -3
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the order m of the sequence"
+        return 1, -4
+    if e > f:
+        # "N/A: right_neighbor_of_successor should be between successor (excluded) and (1/1) (included)"
+        return 1, -5
+    if f > m:
+        # "N/A: Denominator of the right_neighbor_of_successor should not exceed the order m of the sequence"
+        return 1, -6
+    if (not check_pair) or are_neighbors_in_Fm(m, successor, right_neighbor_of_successor):
+        farey_index = (m + f) // d
+        return farey_index * c - e, farey_index * d - f
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey sequence"
+        return 1, -7
+
+
+def successor_of_pair_of_neighbors_in_Fm(m: int, left_neighbor_of_predecessor: Pair, predecessor: Pair,
+                                         check_pair: bool) -> Pair:
+    # See Proposition 1.25 and Table 1.6 of the monograph. Call for instance:
+    #    >>> successor_of_pair_of_neighbors_in_Fm(6, (3, 5), (2, 3), True)
+    # to get the result:
+    #    (3, 4)
+    a, b = left_neighbor_of_predecessor
+    c, d = predecessor
+    if m < 1:
+        # "N/A: Order m of the sequence should be > 0"
+        return 1, -1
+    if a * d >= c * b:
+        # "N/A: We should have left_neighbor_of_predecessor < predecessor"
+        return 1, -2
+    if (c <= 0) or (c >= d):
+        # "N/A: predecessor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -3
+    if d > m:
+        # "N/A: Denominator of the predecessor should not exceed the order m of the sequence"
+        return 1, -4
+    if a < 0:
+        # "N/A: left_neighbor_of_predecessor should be between (0/1) (included) and predecessor (excluded)"
+        return 1, -5
+    if b > m:
+        # "N/A: Denominator of the left_neighbor_of_predecessor should not exceed the order m of the sequence"
+        return 1, -6
+    if (not check_pair) or are_neighbors_in_Fm(m, left_neighbor_of_predecessor, predecessor):
+        farey_index = (m + b) // d
+        return farey_index * c - a, farey_index * d - b
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey sequence"
+        return 1, -7
+
+
+def predecessor_of_pair_of_neighbors_in_Fml(m: int, l: int, successor: Pair, right_neighbor_of_successor: Pair,
+                                            check_pair: bool) -> Pair:
+    # See Proposition 1.26 (ii) (a) and Table 1.6 of the monograph. Call for instance:
+    #    >>> predecessor_of_pair_of_neighbors_in_Fml(6, 4, (4, 5), (1, 1), True)
+    # to get the result:
+    #    (3, 4)
+    c, d = successor
+    e, f = right_neighbor_of_successor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if c * f >= e * d:
+        # "N/A: We should have successor < right_neighbor_of_successor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+        return 1, -5
+    if l < c:
+        # "N/A: Numerator of the successor should be between 1 (included) and l (included)"
+        return 1, -6
+    if e > f:
+        # "N/A: right_neighbor_of_successor should be between successor (excluded) and (1/1) (included)"
+        return 1, -7
+    if f > m:
+        # "N/A: Denominator of the right_neighbor_of_successor should not exceed the parameter m of the sequence"
+        return 1, -8
+    if l < e:
+        # "N/A: Numerator of the right_neighbor_of_successor should be between 1 (included) and l (included)"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_Fml(m, l, successor, right_neighbor_of_successor):
+        if c * m - d * l >= 1:
+            farey_index = (l + e) // c
+        else:
+            farey_index = (m + f) // d
+        return farey_index * c - e, farey_index * d - f
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
+
+
+def successor_of_pair_of_neighbors_in_Fml(m: int, l: int, left_neighbor_of_predecessor: Pair, predecessor: Pair,
+                                          check_pair: bool) -> Pair:
+    # See Proposition 1.26 (ii) (a) and Table 1.6 of the monograph. Call for instance:
+    #    >>> successor_of_pair_of_neighbors_in_Fml(6, 4, (3, 4), (4, 5), True)
+    # to get the result:
+    #    (1, 1)
+    a, b = left_neighbor_of_predecessor
+    c, d = predecessor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if a * d >= c * b:
+        # "N/A: We should have left_neighbor_of_predecessor < predecessor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: predecessor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > m:
+        # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+        return 1, -5
+    if l < c:
+        # "N/A: Numerator of the predecessor should be between 1 (included) and l (included)"
+        return 1, -6
+    if a < 0:
+        # "N/A: left_neighbor_of_predecessor should be between (0/1) (included) and predecessor (excluded)"
+        return 1, -7
+    if b > m:
+        # "N/A: Denominator of the left_neighbor_of_predecessor should not exceed the parameter m of the sequence"
+        return 1, -8
+    if l < a:
+        # "N/A: Numerator of the left_neighbor_of_predecessor should be between 1 (included) and l (included)"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_Fml(m, l, left_neighbor_of_predecessor, predecessor):
+        if d * l - c * m >= 1:
+            farey_index = (m + b) // d
+        else:
+            farey_index = (l + a) // c
+        return farey_index * c - a, farey_index * d - b
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
+
+
+def predecessor_of_pair_of_neighbors_in_Gml(m: int, l: int, successor: Pair, right_neighbor_of_successor: Pair,
+                                            check_pair: bool) -> Pair:
+    # See Proposition 1.27 (ii) (a) and Table 1.6 of the monograph. Call for instance:
+    #    >>> predecessor_of_pair_of_neighbors_in_Gml(6, 4, (1, 2), (3, 5), True)
+    # to get the result:
+    #    (1, 3)
+    c, d = successor
+    e, f = right_neighbor_of_successor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if c * f >= e * d:
+        # "N/A: We should have successor < right_neighbor_of_successor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > m:
+        # "N/A: Denominator of the successor should not exceed the parameter m of the sequence"
+        return 1, -5
+    if l + d - m > c:
+        # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the successor"
+        return 1, -6
+    if e > f:
+        # "N/A: right_neighbor_of_successor should be between successor (excluded) and (1/1) (included)"
+        return 1, -7
+    if f > m:
+        # "N/A: Denominator of the right_neighbor_of_successor should not exceed the parameter m of the sequence"
+        return 1, -8
+    if l + f - m > e:
+        # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the right_neighbor_of_successor"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_Gml(m, l, successor, right_neighbor_of_successor):
+        if c * m - d * l >= 1:
+            farey_index = (m + f) // d
+        else:
+            farey_index = (m - l + f - e) // (d - c)
+        return farey_index * c - e, farey_index * d - f
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
+
+
+def successor_of_pair_of_neighbors_in_Gml(m: int, l: int, left_neighbor_of_predecessor: Pair, predecessor: Pair,
+                                          check_pair: bool) -> Pair:
+    # See Proposition 1.27 (ii) (b) and Table 1.6 of the monograph. Call for instance:
+    #    >>> successor_of_pair_of_neighbors_in_Gml(6, 4, (1, 3), (1, 2), True)
+    # to get the result:
+    #    (3, 5)
+    a, b = left_neighbor_of_predecessor
+    c, d = predecessor
+    if m < 2:
+        # "N/A: Parameter m of the sequence should be > 1"
+        return 1, -1
+    if (l <= 0) or (l >= m):
+        # "N/A: Parameter l should be between 0 (excluded) and m (excluded)"
+        return 1, -2
+    if a * d >= c * b:
+        # "N/A: We should have left_neighbor_of_predecessor < predecessor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: predecessor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > m:
+        # "N/A: Denominator of the predecessor should not exceed the parameter m of the sequence"
+        return 1, -5
+    if l + d - m > c:
+        # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the predecessor"
+        return 1, -6
+    if a < 0:
+        # "N/A: left_neighbor_of_predecessor should be between (0/1) (included) and predecessor (excluded)"
+        return 1, -7
+    if b > m:
+        # "N/A: Denominator of the left_neighbor_of_predecessor should not exceed the parameter m of the sequence"
+        return 1, -8
+    if l + b - m > a:
+        # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the left_neighbor_of_predecessor"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_Gml(m, l, left_neighbor_of_predecessor, predecessor):
+        if d * l - c * m >= 1:
+            farey_index = (m - l + b - a) // (d - c)
+        else:
+            farey_index = (m + b) // d
+        return farey_index * c - a, farey_index * d - b
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
+
+
+def predecessor_of_pair_of_neighbors_in_FBnm(n: int, m: int, successor: Pair, right_neighbor_of_successor: Pair,
+                                             check_pair: bool) -> Pair:
+    # See Proposition 1.28 (ii) (a) and Table 1.6 of the monograph. Call for instance:
+    #    >>> predecessor_of_pair_of_neighbors_in_FBnm(6, 4, (4, 5), (1, 1), True)
+    # to get the result:
+    #    (3, 4)
+    c, d = successor
+    e, f = right_neighbor_of_successor
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return 1, -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return 1, -2
+    if c * f >= e * d:
+        # "N/A: We should have successor < right_neighbor_of_successor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: successor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > n:
+        # "N/A: Denominator of the successor should not exceed n"
+        return 1, -5
+    if (m + d - n > c) or (c > m):
+        # "N/A: Numerator of the successor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -6
+    if e > f:
+        # "N/A: right_neighbor_of_successor should be between successor (excluded) and (1/1) (included)"
+        return 1, -7
+    if f > n:
+        # "N/A: Denominator of the right_neighbor_of_successor should not exceed n"
+        return 1, -8
+    if (m + f - n > e) or (e > m):
+        # "N/A: Numerator of the right_neighbor_of_successor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_FBnm(n, m, successor, right_neighbor_of_successor):
+        if c * n - d * m >= 1:
+            farey_index = (m + e) // c
+        else:
+            farey_index = (n - m + f - e) // (d - c)
+        return farey_index * c - e, farey_index * d - f
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
+
+
+def successor_of_pair_of_neighbors_in_FBnm(n: int, m: int, left_neighbor_of_predecessor: Pair, predecessor: Pair,
+                                           check_pair: bool) -> Pair:
+    # See Proposition 1.28 (ii) (b) and Table 1.6 of the monograph. Call for instance:
+    #    >>> successor_of_pair_of_neighbors_in_FBnm(6, 4, (1, 3), (1, 2), True)
+    # to get the result:
+    #    (3, 5)
+    a, b = left_neighbor_of_predecessor
+    c, d = predecessor
+    if n < 2:
+        # "N/A: Parameter n of the sequence should be > 1"
+        return 1, -1
+    if (m < 1) or (m >= n):
+        # "N/A: Parameter m of the sequence should be between 0 (excluded) and n (excluded)"
+        return 1, -2
+    if a * d >= c * b:
+        # "N/A: We should have left_neighbor_of_predecessor < predecessor"
+        return 1, -3
+    if (c <= 0) or (c >= d):
+        # "N/A: predecessor should be between (0/1) (excluded) and (1/1) (excluded)"
+        return 1, -4
+    if d > n:
+        # "N/A: Denominator of the predecessor should not exceed n"
+        return 1, -5
+    if (m + d - n > c) or (c > m):
+        # "N/A: Numerator of the predecessor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -6
+    if a < 0:
+        # "N/A: left_neighbor_of_predecessor should be between (0/1) (included) and predecessor (excluded)"
+        return 1, -7
+    if b > n:
+        # "N/A: Denominator of the left_neighbor_of_predecessor should not exceed n"
+        return 1, -8
+    if (m + b - n > a) or (a > m):
+        # "N/A: Numerator of the left_neighbor_of_predecessor should be between (m + denominator - n) (included) and m (included)"
+        return 1, -9
+    if (not check_pair) or are_neighbors_in_FBnm(n, m, left_neighbor_of_predecessor, predecessor):
+        if d * m - c * n >= 1:
+            farey_index = (n - m + b - a) // (d - c)
+        else:
+            farey_index = (m + a) // c
+        return farey_index * c - a, farey_index * d - b
+    else:
+        # "N/A: The input pair is not a pair of neighboring fractions in this Farey subsequence"
+        return 1, -10
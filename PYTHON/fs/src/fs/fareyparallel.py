@@ -0,0 +1,219 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Sharded enumeration of our Dramatis Personae on several processes.
+#
+# The recurrent functions of the form `successor_of_pair_of_neighbors_in_personage' are strictly sequential, but
+# one call of a function of the form `successor_in_personage' suffices to start the enumeration from any fraction
+# of the sequence. So we split the segment [0/1, 1/1] by boundary fractions b_0 == 0/1 < b_1 < ... < b_K == 1/1
+# that belong to the sequence, and the worker processes of a concurrent.futures.ProcessPoolExecutor independently
+# enumerate the shards [b_0, b_1), [b_1, b_2), ..., [b_{K-1}, b_K] by the generators of the module fareyiterators.py.
+#
+# The boundary fractions are taken from the same personage with all of its parameters divided by a common factor:
+# for instance, F_{m // s} is a subsequence of Fm, and, more generally, if we write the fractions as h/(h + j),
+# then the constraints on h, j and h + j that define our sequences are scaled by s, so the fractions of the small
+# sequence are spread over [0/1, 1/1] in the same proportions as those of the large one. Taking every
+# (|small sequence| / K)-th fraction of the small sequence gives shards of nearly equal lengths.
+#
+# parallel_iter_pairs_Fm(m, workers, shards) (and the generators for Fml, Gml and FBnm) yield the pairs (h, k)
+# in ascending order; at most 2 * workers shards are in flight, so the memory used does not depend on the order
+# of the sequence. parallel_array_Fm(m, workers, shards) (and the functions for Fml, Gml and FBnm) preallocate
+# the buffers of a FareyArray, whose length is given by the functions of the module fareycounting.py,
+# and copy every shard into its place.
+# By default, workers == os.cpu_count() and shards == 4 * workers.
+# Invalid parameters of the sequence raise a ValueError whose message reports the negative integer returned
+# by the corresponding length function.
+#
+# measure_speedup(personage, params, worker_counts) enumerates a sequence with the given numbers of workers,
+# and returns the list of triples (workers, seconds, speedup), where the speedup is relative to the first count.
+#
+# Call for instance:
+#    >>> list(parallel_iter_pairs_Fm(5, workers=2, shards=3))
+# to get the result:
+#    [(0, 1), (1, 5), (1, 4), (1, 3), (2, 5), (1, 2), (3, 5), (2, 3), (3, 4), (4, 5), (1, 1)]
+
+
+import os
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import fareycounting
+import fareyiterators
+from fareyarray import FareyArray, _typecode_for
+from fareypairs import Pair
+
+
+def parallel_iter_pairs_Fm(m: int, workers: int | None = None, shards: int | None = None) -> Iterator[Pair]:
+    return __iterate('Fm', (m,), workers, shards)
+
+
+def parallel_iter_pairs_Fml(m: int, l: int, workers: int | None = None, shards: int | None = None) -> Iterator[Pair]:
+    return __iterate('Fml', (m, l), workers, shards)
+
+
+def parallel_iter_pairs_Gml(m: int, l: int, workers: int | None = None, shards: int | None = None) -> Iterator[Pair]:
+    return __iterate('Gml', (m, l), workers, shards)
+
+
+def parallel_iter_pairs_FBnm(n: int, m: int, workers: int | None = None, shards: int | None = None) -> Iterator[Pair]:
+    # As in the module fareysequences.py, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    return __iterate('FBnm', (n, m), workers, shards)
+
+
+def parallel_array_Fm(m: int, workers: int | None = None, shards: int | None = None) -> FareyArray:
+    # Call for instance:
+    #    >>> parallel_array_Fm(10 ** 4) == FareyArray.from_Fm(10 ** 4)
+    # to get the result:
+    #    True
+    return __materialize('Fm', (m,), workers, shards)
+
+
+def parallel_array_Fml(m: int, l: int, workers: int | None = None, shards: int | None = None) -> FareyArray:
+    return __materialize('Fml', (m, l), workers, shards)
+
+
+def parallel_array_Gml(m: int, l: int, workers: int | None = None, shards: int | None = None) -> FareyArray:
+    return __materialize('Gml', (m, l), workers, shards)
+
+
+def parallel_array_FBnm(n: int, m: int, workers: int | None = None, shards: int | None = None) -> FareyArray:
+    return __materialize('FBnm', (n, m), workers, shards)
+
+
+def measure_speedup(personage: str, params: tuple, worker_counts: tuple = (1, 2, 4, 8, 16, 32, 64),
+                    shards: int | None = None) -> list[tuple[int, float, float]]:
+    # personage is one of 'Fm', 'Fml', 'Gml', 'FBnm'. Call for instance:
+    #    >>> for workers, seconds, speedup in measure_speedup('FBnm', (20000, 10000)):
+    #    ...     print(workers, round(seconds, 2), round(speedup, 2))
+    # to get a table of the speedups on your machine
+    results = []
+    for workers in worker_counts:
+        started = time.perf_counter()
+        __materialize(personage, params, workers, shards)
+        seconds = time.perf_counter() - started
+        results.append((workers, seconds, results[0][1] / seconds if results else 1.0))
+    return results
+
+
+__iterators = {'Fm': fareyiterators.iter_pairs_Fm,
+               'Fml': fareyiterators.iter_pairs_Fml,
+               'Gml': fareyiterators.iter_pairs_Gml,
+               'FBnm': fareyiterators.iter_pairs_FBnm}
+
+__lengths = {'Fm': fareycounting.length_of_Fm,
+             'Fml': fareycounting.length_of_Fml,
+             'Gml': fareycounting.length_of_Gml,
+             'FBnm': fareycounting.length_of_FBnm}
+
+
+def __iterate(personage: str, params: tuple, workers: int | None, shards: int | None) -> Iterator[Pair]:
+    # The parameters are validated eagerly, so that an invalid request is reported at the call site
+    workers, boundaries = __plan(personage, params, workers, shards)
+    return __stream(personage, params, workers, boundaries)
+
+
+def __stream(personage: str, params: tuple, workers: int, boundaries: list[Pair]) -> Iterator[Pair]:
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        next_shard = 0
+        try:
+            while pending or (next_shard < len(boundaries) - 1):
+                while (next_shard < len(boundaries) - 1) and (len(pending) < 2 * workers):
+                    pending.append(__submit(executor, personage, params, boundaries, next_shard))
+                    next_shard += 1
+                numerators, denominators = pending.popleft().result()
+                yield from zip(numerators, denominators)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def __materialize(personage: str, params: tuple, workers: int | None, shards: int | None) -> FareyArray:
+    workers, boundaries = __plan(personage, params, workers, shards)
+    length = __lengths[personage](*params)
+    typecode = _typecode_for(max(params))
+    numerators = array(typecode, bytes(length * array(typecode).itemsize))
+    denominators = array(typecode, bytes(length * array(typecode).itemsize))
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [__submit(executor, personage, params, boundaries, i) for i in range(len(boundaries) - 1)]
+        position = 0
+        for future in futures:
+            shard_numerators, shard_denominators = future.result()
+            numerators[position:position + len(shard_numerators)] = shard_numerators
+            denominators[position:position + len(shard_denominators)] = shard_denominators
+            position += len(shard_numerators)
+    return FareyArray.from_buffers(numerators, denominators)
+
+
+def __plan(personage: str, params: tuple, workers: int | None, shards: int | None) -> tuple[int, list[Pair]]:
+    length = __lengths[personage](*params)
+    if length < 0:
+        raise ValueError("N/A: cannot enumerate the sequence, the length function returned " + str(length))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if shards is None:
+        shards = 4 * workers
+    if (workers < 1) or (shards < 1):
+        raise ValueError("N/A: the numbers of workers and shards should be > 0")
+    return workers, __boundaries(personage, params, shards)
+
+
+def __boundaries(personage: str, params: tuple, shards: int) -> list[Pair]:
+    # We look for a small sequence with about 64 fractions per shard, so that the lengths of the shards differ
+    # by a few percent at most; the divisor is halved at most log2(max(params)) times, and every length is
+    # computed without enumeration
+    divisor = max(params)
+    sample_params = __scaled(personage, params, divisor)
+    while (divisor > 1) and (__lengths[personage](*sample_params) < 64 * shards):
+        divisor //= 2
+        sample_params = __scaled(personage, params, divisor)
+    sample = list(__iterators[personage](*sample_params))
+    indices = sorted({(i * (len(sample) - 1)) // shards for i in range(shards + 1)})
+    return [sample[i] for i in indices]
+
+
+def __scaled(personage: str, params: tuple, divisor: int) -> tuple:
+    # The parameters of a subsequence of the given sequence, of the same personage, with the constraints
+    # on h, j == k - h and k divided by divisor
+    match personage:
+        case 'Fm':
+            m, = params
+            return max(1, m // divisor),
+        case 'Fml':
+            m, l = params
+            l_scaled = max(1, l // divisor)
+            return max(l_scaled + 1, m // divisor), l_scaled
+        case 'Gml':
+            m, l = params
+            l_scaled = max(1, l // divisor)
+            return l_scaled + max(1, (m - l) // divisor), l_scaled
+        case 'FBnm':
+            n, m = params
+            m_scaled = max(1, m // divisor)
+            return m_scaled + max(1, (n - m) // divisor), m_scaled
+
+
+def __submit(executor: Executor, personage: str, params: tuple, boundaries: list[Pair], shard: int):
+    is_last = (shard == len(boundaries) - 2)
+    return executor.submit(__enumerate_shard, personage, params, boundaries[shard], boundaries[shard + 1],
+                           is_last, _typecode_for(max(params)))
+
+
+def __enumerate_shard(personage: str, params: tuple, start: Pair, stop: Pair, is_last: bool,
+                      typecode: str) -> tuple[array, array]:
+    # Runs in a worker process; the shard is [start, stop), or [start, stop] for the last shard
+    numerators = array(typecode)
+    denominators = array(typecode)
+    append_numerator = numerators.append
+    append_denominator = denominators.append
+    for h, k in __iterators[personage](*params, start, stop):
+        append_numerator(h)
+        append_denominator(k)
+    if not is_last:
+        numerators.pop()
+        denominators.pop()
+    return numerators, denominators
@@ -38,11 +38,21 @@
 # __successor_in_FB2mm
 # __predecessor_of_pair_of_neighbors_in_FB2mm
 # __successor_of_pair_of_neighbors_in_FB2mm
+#
+# The functions are_neighbors_in_Fm, are_neighbors_in_Fml, are_neighbors_in_Gml and are_neighbors_in_FBnm check in O(1)
+# operations whether two fractions a/b < c/d are neighbors in the sequence: both of them should be members,
+# b*c - a*d should be 1 (then every fraction between them is of the form (s*a + t*c)/(s*b + t*d) with s, t >= 1),
+# and the mediant (a + c)/(b + d) should NOT be a member (and then, since the constraints that define our sequences
+# bound the numerators h and the differences k - h from above, no fraction between them is a member). The functions
+# of the form `predecessor_of_pair_of_neighbors_in_personage' and `successor_of_pair_of_neighbors_in_personage'
+# call them when check_pair == True.
+#
+# All of the computations below are carried out in exact integer arithmetic (there are no float divisions anywhere),
+# so the functions remain correct for arbitrarily large orders, say, of magnitudes 10^12--10^18 and beyond.
 
 
 from ast import Tuple
 from fractions import Fraction
-from math import ceil, floor
 
 
 def predecessor_in_Fm(m: int, successor: Fraction) -> Fraction:
@@ -61,8 +71,7 @@ def predecessor_in_Fm(m: int, successor: Fraction) -> Fraction:
         return Fraction(1, -3)
     if successor == Fraction(1, 1):
         return __predecessor_of_one_first_in_Fm(m)
-    ref_point = ceil((successor.numerator * m) /
-                     successor.denominator)
+    ref_point = __ceil_div(successor.numerator * m, successor.denominator)
     return __get_numerator_and_return_predecessor(
         __find_numerator_of_predecessor((ref_point - successor.numerator, ref_point - 1),
                                         successor), successor)
@@ -84,8 +93,7 @@ def successor_in_Fm(m: int, predecessor: Fraction) -> Fraction:
         return Fraction(1, -3)
     if predecessor == Fraction(0, 1):
         return __successor_of_zero_first_in_Fm(m)
-    ref_point = ceil((predecessor.numerator * m + 2) /
-                     predecessor.denominator)
+    ref_point = __ceil_div(predecessor.numerator * m + 2, predecessor.denominator)
     return __get_numerator_and_return_successor(
         __find_numerator_of_successor(
             (ref_point - predecessor.numerator, ref_point - 1), predecessor),
@@ -118,7 +126,7 @@ def predecessor_in_Fml(m: int, l: int, successor: Fraction) -> Fraction:
         return __get_numerator_and_return_predecessor(
             __find_numerator_of_predecessor((l - successor.numerator + 1, l), successor), successor)
     else:
-        ref_point = ceil((successor.numerator * m) / successor.denominator)
+        ref_point = __ceil_div(successor.numerator * m, successor.denominator)
         return __get_numerator_and_return_predecessor(
             __find_numerator_of_predecessor((ref_point - successor.numerator, ref_point - 1),
                                             successor), successor)
@@ -147,8 +155,7 @@ def successor_in_Fml(m: int, l: int, predecessor: Fraction) -> Fraction:
     if predecessor == Fraction(0, 1):
         return __successor_of_zero_first_in_Fml(m)
     if predecessor.denominator * l - predecessor.numerator * m >= 1:
-        ref_point = ceil((predecessor.numerator * m + 2) /
-                         predecessor.denominator)
+        ref_point = __ceil_div(predecessor.numerator * m + 2, predecessor.denominator)
         return __get_numerator_and_return_successor(
             __find_numerator_of_successor(
                 (ref_point - predecessor.numerator, ref_point - 1), predecessor),
@@ -180,17 +187,17 @@ def predecessor_in_Gml(m: int, l: int, successor: Fraction) -> Fraction:
         # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the successor"
         return Fraction(1, -5)
     if successor == Fraction(1, 1):
-        return __predecessor_of_one_first_in_Gml(l)
+        # The predecessor of 1/1 in Gml is (m - 1)/m, whatever l is (the versions in Clojure and Haskell agree);
+        # the order m, and not the parameter l, goes to the helper
+        return __predecessor_of_one_first_in_Gml(m)
     if successor.numerator * m - successor.denominator * l >= 1:
-        ref_point = ceil((successor.numerator * m) /
-                         successor.denominator)
+        ref_point = __ceil_div(successor.numerator * m, successor.denominator)
         return __get_numerator_and_return_predecessor(
             __find_numerator_of_predecessor(
                 (ref_point - successor.numerator, ref_point - 1), successor),
             successor)
     else:
-        ref_point = ceil(
-            (successor.numerator * (m - l)) / (successor.denominator - successor.numerator))
+        ref_point = __ceil_div(successor.numerator * (m - l), successor.denominator - successor.numerator)
         return __get_numerator_and_return_predecessor(
             __find_numerator_of_predecessor(
                 (ref_point - successor.numerator, ref_point - 1), successor),
@@ -220,15 +227,13 @@ def successor_in_Gml(m: int, l: int, predecessor: Fraction) -> Fraction:
     if predecessor == Fraction(0, 1):
         return __successor_of_zero_first_in_Gml(m, l)
     if predecessor.denominator * l - predecessor.numerator * m >= 1:
-        ref_point = ceil((predecessor.numerator * (m - l) + 2) /
-                         (predecessor.denominator - predecessor.numerator))
+        ref_point = __ceil_div(predecessor.numerator * (m - l) + 2, predecessor.denominator - predecessor.numerator)
         return __get_numerator_and_return_successor(
             __find_numerator_of_successor(
                 (ref_point - predecessor.numerator, ref_point - 1), predecessor),
             predecessor)
     else:
-        ref_point = ceil((predecessor.numerator * m + 2) /
-                         predecessor.denominator)
+        ref_point = __ceil_div(predecessor.numerator * m + 2, predecessor.denominator)
         return __get_numerator_and_return_successor(
             __find_numerator_of_successor(
                 (ref_point - predecessor.numerator, ref_point - 1), predecessor),
@@ -271,8 +276,7 @@ def __predecessor_in_FB2mm(m: int, successor: Fraction) -> Fraction:
                     __find_numerator_of_predecessor((m - successor.numerator + 1, m),
                                                     successor), successor)
             else:
-                ref_point = ceil((successor.numerator * m) /
-                                 (successor.denominator - successor.numerator))
+                ref_point = __ceil_div(successor.numerator * m, successor.denominator - successor.numerator)
                 return __get_numerator_and_return_predecessor(
                     __find_numerator_of_predecessor(
                         (ref_point - successor.numerator, ref_point - 1), successor),
@@ -311,8 +315,7 @@ def __successor_in_FB2mm(m: int, predecessor: Fraction) -> Fraction:
             return __successor_of_two_thirds_in_FB2mm(m)
         case _:
             if predecessor < Fraction(1, 2):
-                ref_point = ceil((predecessor.numerator * m + 2) /
-                                 (predecessor.denominator - predecessor.numerator))
+                ref_point = __ceil_div(predecessor.numerator * m + 2, predecessor.denominator - predecessor.numerator)
                 return __get_numerator_and_return_successor(
                     __find_numerator_of_successor(
                         (ref_point - predecessor.numerator, ref_point - 1), predecessor),
@@ -365,8 +368,7 @@ def predecessor_in_FBnm(n: int, m: int, successor: Fraction) -> Fraction:
                     return __get_numerator_and_return_predecessor(
                         __find_numerator_of_predecessor((m - successor.numerator + 1, m), successor), successor)
                 else:
-                    ref_point = ceil(
-                        successor.numerator * (n - m) / (successor.denominator - successor.numerator))
+                    ref_point = __ceil_div(successor.numerator * (n - m), successor.denominator - successor.numerator)
                     return __get_numerator_and_return_predecessor(
                         __find_numerator_of_predecessor((ref_point - successor.numerator, ref_point - 1),
                                                         successor), successor)
@@ -375,8 +377,7 @@ def predecessor_in_FBnm(n: int, m: int, successor: Fraction) -> Fraction:
                     return __get_numerator_and_return_predecessor(
                         __find_numerator_of_predecessor((m - successor.numerator + 1, m), successor), successor)
                 else:
-                    ref_point = ceil(
-                        successor.numerator * (n - m) / (successor.denominator - successor.numerator))
+                    ref_point = __ceil_div(successor.numerator * (n - m), successor.denominator - successor.numerator)
                     return __get_numerator_and_return_predecessor(
                         __find_numerator_of_predecessor((ref_point - successor.numerator, ref_point - 1),
                                                         successor), successor)
@@ -425,8 +426,8 @@ def successor_in_FBnm(n: int, m: int, predecessor: Fraction) -> Fraction:
                     return __get_numerator_and_return_successor(
                         __find_numerator_of_successor((m - predecessor.numerator + 1, m), predecessor), predecessor)
                 else:
-                    ref_point = ceil((predecessor.numerator * (n - m) + 2) /
-                                     (predecessor.denominator - predecessor.numerator))
+                    ref_point = __ceil_div(predecessor.numerator * (n - m) + 2,
+                                           predecessor.denominator - predecessor.numerator)
                     return __get_numerator_and_return_successor(
                         __find_numerator_of_successor((ref_point - predecessor.numerator, ref_point - 1),
                                                       predecessor), predecessor)
@@ -435,13 +436,19 @@ def successor_in_FBnm(n: int, m: int, predecessor: Fraction) -> Fraction:
                     return __get_numerator_and_return_successor(
                         __find_numerator_of_successor((m - predecessor.numerator + 1, m), predecessor), predecessor)
                 else:
-                    ref_point = ceil((predecessor.numerator * (n - m) + 2) /
-                                     (predecessor.denominator - predecessor.numerator))
+                    ref_point = __ceil_div(predecessor.numerator * (n - m) + 2,
+                                           predecessor.denominator - predecessor.numerator)
                     return __get_numerator_and_return_successor(
                         __find_numerator_of_successor((ref_point - predecessor.numerator, ref_point - 1),
                                                       predecessor), predecessor)
 
 
+def __ceil_div(a: int, b: int) -> int:
+    # The ceiling of (a / b) for b > 0, computed in integer arithmetic only: going through a float quotient
+    # would silently lose precision as soon as the products in the formulas pass 2^53
+    return -(-a // b)
+
+
 def __get_numerator_and_return_predecessor(a: int, successor: Fraction) -> Fraction:
     return Fraction(a, (successor.denominator * a + 1) // successor.numerator)
 
@@ -451,15 +458,20 @@ def __get_numerator_and_return_successor(a: int, predecessor: Fraction) -> Fract
 
 
 def __find_numerator_of_predecessor(search_interval: Tuple(int, int), successor: Fraction) -> int:
-    # Here we follow a suggestion found at https://code-maven.com/python-find-first-element-in-list-matching-condition
-    return next(filter(lambda x: (successor.denominator * x + 1) % successor.numerator == 0,
-                       range(search_interval[0], search_interval[1] + 1)))
+    # The search interval always consists of successor.numerator consecutive integers, and we need its unique
+    # element x such that (successor.denominator * x + 1) is divisible by successor.numerator, that is,
+    # x == -(successor.denominator)^(-1) (mod successor.numerator). One modular inversion gives the residue class,
+    # and we then pick its representative inside the interval, instead of scanning the whole range
+    residue = -pow(successor.denominator, -1, successor.numerator)
+    return search_interval[0] + (residue - search_interval[0]) % successor.numerator
 
 
 def __find_numerator_of_successor(search_interval: Tuple(int, int), predecessor: Fraction) -> int:
-    # Here we follow a suggestion found at https://code-maven.com/python-find-first-element-in-list-matching-condition
-    return next(filter(lambda x: (predecessor.denominator * x - 1) % predecessor.numerator == 0,
-                       range(search_interval[0], search_interval[1] + 1)))
+    # The search interval always consists of predecessor.numerator consecutive integers, and we need its unique
+    # element x such that (predecessor.denominator * x - 1) is divisible by predecessor.numerator, that is,
+    # x == (predecessor.denominator)^(-1) (mod predecessor.numerator)
+    residue = pow(predecessor.denominator, -1, predecessor.numerator)
+    return search_interval[0] + (residue - search_interval[0]) % predecessor.numerator
 
 
 def __predecessor_of_one_first_in_Fm(m: int) -> Fraction:
@@ -632,6 +644,53 @@ def __successor_of_two_thirds_in_FBnm(n: int, m: int) -> Fraction:
         return Fraction(m, (3 * m - 1) // 2)
 
 
+def are_neighbors_in_Fm(m: int, left: Fraction, right: Fraction) -> bool:
+    # Both fractions are members of the sequence, b*c - a*d == 1, and the mediant is not a member. Call for instance:
+    #    >>> are_neighbors_in_Fm(6, Fraction(3, 5), Fraction(2, 3))
+    # to get the result:
+    #    True
+    a, b = left.numerator, left.denominator
+    c, d = right.numerator, right.denominator
+    return ((m >= 1) and (a >= 0) and (c <= d) and (b <= m) and (d <= m)
+            and (b * c - a * d == 1) and (b + d > m))
+
+
+def are_neighbors_in_Fml(m: int, l: int, left: Fraction, right: Fraction) -> bool:
+    # Call for instance:
+    #    >>> are_neighbors_in_Fml(6, 4, Fraction(3, 4), Fraction(4, 5))
+    # to get the result:
+    #    True
+    a, b = left.numerator, left.denominator
+    c, d = right.numerator, right.denominator
+    return ((m >= 2) and (0 < l < m) and (a >= 0) and (c <= d) and (b <= m) and (d <= m) and (a <= l) and (c <= l)
+            and (b * c - a * d == 1) and ((b + d > m) or (a + c > l)))
+
+
+def are_neighbors_in_Gml(m: int, l: int, left: Fraction, right: Fraction) -> bool:
+    # Call for instance:
+    #    >>> are_neighbors_in_Gml(6, 4, Fraction(1, 3), Fraction(1, 2))
+    # to get the result:
+    #    True
+    a, b = left.numerator, left.denominator
+    c, d = right.numerator, right.denominator
+    return ((m >= 2) and (0 < l < m) and (a >= 0) and (c <= d) and (b <= m) and (d <= m)
+            and (b - a <= m - l) and (d - c <= m - l)
+            and (b * c - a * d == 1) and ((b + d > m) or (b + d - a - c > m - l)))
+
+
+def are_neighbors_in_FBnm(n: int, m: int, left: Fraction, right: Fraction) -> bool:
+    # As for the other functions, for the subsequence FB2mm give the value of (2*m) for the parameter n.
+    # Call for instance:
+    #    >>> are_neighbors_in_FBnm(6, 4, Fraction(1, 3), Fraction(1, 2))
+    # to get the result:
+    #    True
+    a, b = left.numerator, left.denominator
+    c, d = right.numerator, right.denominator
+    return ((0 < m < n) and (a >= 0) and (c <= d) and (a <= m) and (c <= m)
+            and (b - a <= n - m) and (d - c <= n - m)
+            and (b * c - a * d == 1) and ((a + c > m) or (b + d - a - c > n - m)))
+
+
 def predecessor_of_pair_of_neighbors_in_Fm(m: int, successor: Fraction, right_neighbor_of_successor: Fraction,
                                            check_pair: bool) -> Fraction:
     # If check_pair == True, then to check whether the input pair is indeed a pair of neighboring fractions in the sequence Fm
@@ -661,9 +720,8 @@ def predecessor_of_pair_of_neighbors_in_Fm(m: int, successor: Fraction, right_ne
     if right_neighbor_of_successor.denominator > m:
         # "N/A: Denominator of the right_neighbor_of_successor should not exceed the order m of the sequence"
         return Fraction(1, -6)
-    if (not check_pair) or (check_pair and (successor == predecessor_in_Fm(m, right_neighbor_of_successor))):
-        farey_index = floor(
-            (m + right_neighbor_of_successor.denominator) / successor.denominator)
+    if (not check_pair) or are_neighbors_in_Fm(m, successor, right_neighbor_of_successor):
+        farey_index = (m + right_neighbor_of_successor.denominator) // successor.denominator
         return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                         farey_index * successor.denominator - right_neighbor_of_successor.denominator)
     else:
@@ -700,9 +758,8 @@ def successor_of_pair_of_neighbors_in_Fm(m: int, left_neighbor_of_predecessor: F
     if left_neighbor_of_predecessor.denominator > m:
         # "N/A: Denominator of the left_neighbor_of_predecessor should not exceed the order m of the sequence"
         return Fraction(1, -6)
-    if (not check_pair) or (check_pair and (predecessor == successor_in_Fm(m, left_neighbor_of_predecessor))):
-        farey_index = floor(
-            (m + left_neighbor_of_predecessor.denominator) / predecessor.denominator)
+    if (not check_pair) or are_neighbors_in_Fm(m, left_neighbor_of_predecessor, predecessor):
+        farey_index = (m + left_neighbor_of_predecessor.denominator) // predecessor.denominator
         return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                         farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
     else:
@@ -748,15 +805,13 @@ def predecessor_of_pair_of_neighbors_in_Fml(m: int, l: int, successor: Fraction,
     if l < right_neighbor_of_successor.numerator:
         # "N/A: Numerator of the right_neighbor_of_successor should be between 1 (included) and l (included)"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (successor == predecessor_in_Fml(m, l, right_neighbor_of_successor))):
+    if (not check_pair) or are_neighbors_in_Fml(m, l, successor, right_neighbor_of_successor):
         if successor.numerator * m - successor.denominator * l >= 1:
-            farey_index = floor(
-                (l + right_neighbor_of_successor.numerator) / successor.numerator)
+            farey_index = (l + right_neighbor_of_successor.numerator) // successor.numerator
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
         else:
-            farey_index = floor(
-                (m + right_neighbor_of_successor.denominator) / successor.denominator)
+            farey_index = (m + right_neighbor_of_successor.denominator) // successor.denominator
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
     else:
@@ -802,15 +857,13 @@ def successor_of_pair_of_neighbors_in_Fml(m: int, l: int, left_neighbor_of_prede
     if l < left_neighbor_of_predecessor.numerator:
         # "N/A: Numerator of the left_neighbor_of_predecessor should be between 1 (included) and l (included)"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (predecessor == successor_in_Fml(m, l, left_neighbor_of_predecessor))):
+    if (not check_pair) or are_neighbors_in_Fml(m, l, left_neighbor_of_predecessor, predecessor):
         if predecessor.denominator * l - predecessor.numerator * m >= 1:
-            farey_index = floor(
-                (m + left_neighbor_of_predecessor.denominator) / predecessor.denominator)
+            farey_index = (m + left_neighbor_of_predecessor.denominator) // predecessor.denominator
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
         else:
-            farey_index = floor(
-                (l + left_neighbor_of_predecessor.numerator) / predecessor.numerator)
+            farey_index = (l + left_neighbor_of_predecessor.numerator) // predecessor.numerator
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
     else:
@@ -856,16 +909,14 @@ def predecessor_of_pair_of_neighbors_in_Gml(m: int, l: int, successor: Fraction,
     if l + right_neighbor_of_successor.denominator - m > right_neighbor_of_successor.numerator:
         # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the right_neighbor_of_successor"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (successor == predecessor_in_Gml(m, l, right_neighbor_of_successor))):
+    if (not check_pair) or are_neighbors_in_Gml(m, l, successor, right_neighbor_of_successor):
         if successor.numerator * m - successor.denominator * l >= 1:
-            farey_index = floor(
-                (m + right_neighbor_of_successor.denominator) / successor.denominator)
+            farey_index = (m + right_neighbor_of_successor.denominator) // successor.denominator
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
         else:
-            farey_index = floor((m - l + right_neighbor_of_successor.denominator -
-                                 right_neighbor_of_successor.numerator) / (
-                successor.denominator - successor.numerator))
+            farey_index = (m - l + right_neighbor_of_successor.denominator - right_neighbor_of_successor.numerator) // (
+                successor.denominator - successor.numerator)
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
     else:
@@ -911,16 +962,14 @@ def successor_of_pair_of_neighbors_in_Gml(m: int, l: int, left_neighbor_of_prede
     if l + left_neighbor_of_predecessor.denominator - m > left_neighbor_of_predecessor.numerator:
         # "N/A: The quantity (l + denominator - m) should not exceed the numerator of the left_neighbor_of_predecessor"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (predecessor == successor_in_Gml(m, l, left_neighbor_of_predecessor))):
+    if (not check_pair) or are_neighbors_in_Gml(m, l, left_neighbor_of_predecessor, predecessor):
         if predecessor.denominator * l - predecessor.numerator * m >= 1:
-            farey_index = floor(
-                (m - l + left_neighbor_of_predecessor.denominator - left_neighbor_of_predecessor.numerator) / (
-                    predecessor.denominator - predecessor.numerator))
+            farey_index = (m - l + left_neighbor_of_predecessor.denominator - left_neighbor_of_predecessor.numerator) // (
+                predecessor.denominator - predecessor.numerator)
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
         else:
-            farey_index = floor(
-                (m + left_neighbor_of_predecessor.denominator) / predecessor.denominator)
+            farey_index = (m + left_neighbor_of_predecessor.denominator) // predecessor.denominator
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
     else:
@@ -967,16 +1016,14 @@ def predecessor_of_pair_of_neighbors_in_FBnm(n: int, m: int, successor: Fraction
             right_neighbor_of_successor.numerator > m):
         # "N/A: Numerator of the right_neighbor_of_successor should be between (m + denominator - n) (included) and m (included)"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (successor == predecessor_in_FBnm(n, m, right_neighbor_of_successor))):
+    if (not check_pair) or are_neighbors_in_FBnm(n, m, successor, right_neighbor_of_successor):
         if successor.numerator * n - successor.denominator * m >= 1:
-            farey_index = floor(
-                (m + right_neighbor_of_successor.numerator) / successor.numerator)
+            farey_index = (m + right_neighbor_of_successor.numerator) // successor.numerator
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
         else:
-            farey_index = floor((n - m + right_neighbor_of_successor.denominator -
-                                 right_neighbor_of_successor.numerator) / (
-                successor.denominator - successor.numerator))
+            farey_index = (n - m + right_neighbor_of_successor.denominator - right_neighbor_of_successor.numerator) // (
+                successor.denominator - successor.numerator)
             return Fraction(farey_index * successor.numerator - right_neighbor_of_successor.numerator,
                             farey_index * successor.denominator - right_neighbor_of_successor.denominator)
     else:
@@ -1028,16 +1075,14 @@ def successor_of_pair_of_neighbors_in_FBnm(n: int, m: int, left_neighbor_of_pred
             left_neighbor_of_predecessor.numerator > m):
         # "N/A: Numerator of the left_neighbor_of_predecessor should be between (m + denominator - n) (included) and m (included)"
         return Fraction(1, -9)
-    if (not check_pair) or (check_pair and (predecessor == successor_in_FBnm(n, m, left_neighbor_of_predecessor))):
+    if (not check_pair) or are_neighbors_in_FBnm(n, m, left_neighbor_of_predecessor, predecessor):
         if predecessor.denominator * m - predecessor.numerator * n >= 1:
-            farey_index = floor(
-                (n - m + left_neighbor_of_predecessor.denominator - left_neighbor_of_predecessor.numerator) / (
-                    predecessor.denominator - predecessor.numerator))
+            farey_index = (n - m + left_neighbor_of_predecessor.denominator - left_neighbor_of_predecessor.numerator) // (
+                predecessor.denominator - predecessor.numerator)
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
         else:
-            farey_index = floor(
-                (m + left_neighbor_of_predecessor.numerator) / predecessor.numerator)
+            farey_index = (m + left_neighbor_of_predecessor.numerator) // predecessor.numerator
             return Fraction(farey_index * predecessor.numerator - left_neighbor_of_predecessor.numerator,
                             farey_index * predecessor.denominator - left_neighbor_of_predecessor.denominator)
     else:
@@ -0,0 +1,169 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Lazy set operations on our Dramatis Personae.
+#
+# A sequence is given by a pair (personage, params), where personage is one of 'Fm', 'Fml', 'Gml', 'FBnm', say,
+# ('Fml', (10, 4)) or ('FBnm', (12, 5)) (as in the module fareysequences.py, the subsequence FB2mm is ('FBnm', (2*m, m))).
+#
+# iter_pairs_intersection(*sequences, start, stop) yields the pairs (h, k) of the fractions that belong to all of the sequences;
+# iter_pairs_union(*sequences, start, stop)        yields the pairs of the fractions that belong to at least one of them;
+# iter_pairs_difference(first, *others, start, stop) yields the pairs of the fractions of the first sequence that belong
+#                                                  to none of the others.
+# The generators iter_intersection, iter_union and iter_difference do the same, but they yield instances of the class Fraction.
+# The fractions lie between start and stop (arbitrary fractions, not necessarily members of the sequences), and they are
+# yielded in ascending order.
+#
+# Every one of our sequences is the set of the reduced fractions h/k whose numerators and denominators satisfy a few
+# linear constraints, so the membership of a fraction in a sequence is checked in O(1) operations, and the intersection
+# and the difference do not have to walk the other sequences in lock-step with the first one: the intersection enumerates
+# the shortest of the sequences on the segment (the lengths are counted by the function count_in_interval of the module
+# fareycounting.py, without enumeration), and the difference enumerates the first sequence, and the fractions are filtered
+# by the constraints of the other sequences. Only the union merges the generators of all of the sequences, by comparing
+# their current fractions by cross-multiplying, and every sequence is read once.
+# The enumerations start from the first member of the sequence that is >= start, that is found by the functions
+# of the module fareybracket.py, and then they proceed by the generators of the module fareyiterators.py, so the memory
+# used does not depend on the lengths of the sequences.
+#
+# Call for instance:
+#    >>> list(iter_pairs_intersection(('Fml', (6, 2)), ('Gml', (6, 3))))
+# to get the result:
+#    [(0, 1), (1, 4), (1, 3), (2, 5), (1, 2), (2, 3), (1, 1)]
+# and call:
+#    >>> list(iter_difference(('FBnm', (6, 3)), ('Fm', (4,))))
+# to get the result:
+#    [Fraction(2, 5), Fraction(3, 5)]
+
+
+from collections.abc import Iterator
+from fractions import Fraction
+
+import fareybracket
+import fareycounting
+import fareyiterators
+from fareypairs import Pair
+
+
+Sequence = tuple[str, tuple]
+
+
+def iter_intersection(*sequences: Sequence, start: Fraction = Fraction(0, 1),
+                      stop: Fraction = Fraction(1, 1)) -> Iterator[Fraction]:
+    return __fractions(iter_pairs_intersection(*sequences, start=__pair(start), stop=__pair(stop)))
+
+
+def iter_union(*sequences: Sequence, start: Fraction = Fraction(0, 1),
+               stop: Fraction = Fraction(1, 1)) -> Iterator[Fraction]:
+    return __fractions(iter_pairs_union(*sequences, start=__pair(start), stop=__pair(stop)))
+
+
+def iter_difference(first: Sequence, *others: Sequence, start: Fraction = Fraction(0, 1),
+                    stop: Fraction = Fraction(1, 1)) -> Iterator[Fraction]:
+    return __fractions(iter_pairs_difference(first, *others, start=__pair(start), stop=__pair(stop)))
+
+
+def iter_pairs_intersection(*sequences: Sequence, start: Pair = (0, 1), stop: Pair = (1, 1)) -> Iterator[Pair]:
+    if not sequences:
+        raise ValueError("N/A: the intersection needs at least one sequence")
+    for personage, params in sequences:
+        __validate(personage, params)
+    # The shortest sequence on the segment is enumerated, and the others only filter its fractions
+    counts = [fareycounting.count_in_interval(personage, params, Fraction(*start), Fraction(*stop))
+              for personage, params in sequences]
+    if min(counts) < 0:
+        raise ValueError("N/A: cannot count the fractions of the sequences, the counting function returned " +
+                         str(min(counts)))
+    shortest = counts.index(min(counts))
+    others = sequences[:shortest] + sequences[shortest + 1:]
+    return __filter(__enumerate(sequences[shortest], start, stop), others, True)
+
+
+def iter_pairs_union(*sequences: Sequence, start: Pair = (0, 1), stop: Pair = (1, 1)) -> Iterator[Pair]:
+    if not sequences:
+        raise ValueError("N/A: the union needs at least one sequence")
+    return __merge([__enumerate(sequence, start, stop) for sequence in sequences])
+
+
+def iter_pairs_difference(first: Sequence, *others: Sequence, start: Pair = (0, 1), stop: Pair = (1, 1)) -> Iterator[Pair]:
+    for personage, params in others:
+        __validate(personage, params)
+    return __filter(__enumerate(first, start, stop), others, False)
+
+
+__brackets = {'Fm': fareybracket.bracket_pairs_in_Fm,
+              'Fml': fareybracket.bracket_pairs_in_Fml,
+              'Gml': fareybracket.bracket_pairs_in_Gml,
+              'FBnm': fareybracket.bracket_pairs_in_FBnm}
+
+__iterators = {'Fm': fareyiterators.iter_pairs_Fm,
+               'Fml': fareyiterators.iter_pairs_Fml,
+               'Gml': fareyiterators.iter_pairs_Gml,
+               'FBnm': fareyiterators.iter_pairs_FBnm}
+
+
+def __pair(fraction: Fraction) -> Pair:
+    return fraction.numerator, fraction.denominator
+
+
+def __fractions(pairs: Iterator[Pair]) -> Iterator[Fraction]:
+    for h, k in pairs:
+        yield Fraction(h, k)
+
+
+def __validate(personage: str, params: tuple) -> None:
+    # The bracketing functions report invalid parameters by negative denominators
+    if personage not in __brackets:
+        raise ValueError("N/A: unknown personage " + repr(personage))
+    (_, k), _ = __brackets[personage](*params, (0, 1))
+    if k < 0:
+        raise ValueError("N/A: invalid parameters of " + personage + str(tuple(params)) +
+                         ", the bracketing function returned " + str(Fraction(1, k)))
+
+
+def __enumerate(sequence: Sequence, start: Pair, stop: Pair) -> Iterator[Pair]:
+    # The generator is created eagerly, so that an invalid request is reported at the call site
+    personage, params = sequence
+    __validate(personage, params)
+    left, right = __brackets[personage](*params, start)
+    if left[1] < 0:
+        raise ValueError("N/A: cannot start the enumeration from " + str(Fraction(*start)) +
+                         ", the bracketing function returned " + str(Fraction(*left)))
+    # The first member of the sequence that is >= start
+    first = left if left[0] * start[1] == start[0] * left[1] else right
+    return __iterators[personage](*params, first, stop)
+
+
+def __filter(pairs: Iterator[Pair], others: tuple, keep_members: bool) -> Iterator[Pair]:
+    # Keeps the fractions that belong to all of the other sequences (if keep_members == True),
+    # or to none of them (if keep_members == False)
+    tests = [(fareycounting.IS_MEMBER[personage], tuple(params)) for personage, params in others]
+    for h, k in pairs:
+        if keep_members:
+            if all(is_member(h, k, *params) for is_member, params in tests):
+                yield h, k
+        elif not any(is_member(h, k, *params) for is_member, params in tests):
+            yield h, k
+
+
+def __merge(iterators: list[Iterator[Pair]]) -> Iterator[Pair]:
+    # The current fractions of the sequences, as the lists [h, k, iterator]; exhausted sequences are dropped
+    heads = []
+    for iterator in iterators:
+        pair = next(iterator, None)
+        if pair is not None:
+            heads.append([pair[0], pair[1], iterator])
+    while heads:
+        h, k = heads[0][0], heads[0][1]
+        for head in heads:
+            if head[0] * k < h * head[1]:
+                h, k = head[0], head[1]
+        yield h, k
+        for head in heads:
+            if head[0] * k == h * head[1]:
+                pair = next(head[2], None)
+                if pair is None:
+                    head[2] = None
+                else:
+                    head[0], head[1] = pair
+        heads = [head for head in heads if head[2] is not None]
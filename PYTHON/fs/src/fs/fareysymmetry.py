@@ -0,0 +1,149 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Enumeration by symmetry, and reuse of the dual subsequences.
+#
+# The map h/k |-> (k - h)/k reverses the order of the fractions, and
+#    it sends the sequence Fm onto itself, and the subsequence FB2mm onto itself;
+#    it sends the subsequence Fml onto the subsequence G_m^{m-l}, and vice versa;
+#    it sends the subsequence FBnm onto the subsequence FB(n, n - m).
+#
+# iter_pairs_Fm_by_symmetry(m) and iter_pairs_FB2mm_by_symmetry(m) enumerate the fractions of Fm and FB2mm between 0/1
+# and 1/2 by the generators of the module fareyiterators.py, and they yield the fractions between 1/2 and 1/1 as the images
+# of the first half in the reverse order, so they call the recurrent functions for a half of the sequence only (and keep
+# that half in a FareyArray, at 8 or 16 bytes per fraction). array_Fm_by_symmetry(m) and array_FB2mm_by_symmetry(m) return
+# the whole sequence as a FareyArray, and reflection(terms) returns the image of a FareyArray under the map.
+#
+# An instance of the class DualCache keeps up to maxsize materialized sequences (the least recently used one is evicted),
+# and its methods Fm(m), Fml(m, l), Gml(m, l) and FBnm(n, m) return the FareyArray of the sequence. Only one sequence
+# of every dual pair is kept: a request for the subsequence Gml is served by the reflection of the cached subsequence
+# F_m^{m-l}, and a request for the subsequence FBnm with 2 * m > n is served by the reflection of the cached subsequence
+# FB(n, n - m). The sequences Fm and FB2mm are built by the symmetry.
+#
+# Call for instance:
+#    >>> list(iter_pairs_Fm_by_symmetry(4))
+# to get the result:
+#    [(0, 1), (1, 4), (1, 3), (1, 2), (2, 3), (3, 4), (1, 1)]
+# and call:
+#    >>> cache = DualCache()
+#    >>> cache.Gml(6, 4) == reflection(cache.Fml(6, 2))
+# to get the result:
+#    True
+
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
+from operator import sub
+from threading import Lock
+
+import fareyiterators
+from fareyarray import FareyArray, _typecode_for
+from fareypairs import Pair
+
+
+def iter_pairs_Fm_by_symmetry(m: int) -> Iterator[Pair]:
+    return __mirror(fareyiterators.iter_pairs_Fm(m, (0, 1), (1, 2)), _typecode_for(m))
+
+
+def iter_pairs_FB2mm_by_symmetry(m: int) -> Iterator[Pair]:
+    return __mirror(fareyiterators.iter_pairs_FBnm(2 * m, m, (0, 1), (1, 2)), _typecode_for(2 * m))
+
+
+def array_Fm_by_symmetry(m: int) -> FareyArray:
+    return __mirrored_array(fareyiterators.iter_pairs_Fm(m, (0, 1), (1, 2)), _typecode_for(m))
+
+
+def array_FB2mm_by_symmetry(m: int) -> FareyArray:
+    return __mirrored_array(fareyiterators.iter_pairs_FBnm(2 * m, m, (0, 1), (1, 2)), _typecode_for(2 * m))
+
+
+def reflection(terms: FareyArray) -> FareyArray:
+    # The images of the fractions under the map h/k |-> (k - h)/k, in ascending order
+    numerators, denominators = terms.numerators, terms.denominators
+    return FareyArray.from_buffers(array(terms.typecode, map(sub, reversed(denominators), reversed(numerators))),
+                                   array(terms.typecode, reversed(denominators)))
+
+
+class DualCache:
+    __slots__ = ('__maxsize', '__arrays', '__lock')
+
+    def __init__(self, maxsize: int = 16):
+        if maxsize < 1:
+            raise ValueError("N/A: maxsize should be > 0")
+        self.__maxsize = maxsize
+        self.__arrays = OrderedDict()
+        self.__lock = Lock()
+
+    def Fm(self, m: int) -> FareyArray:
+        return self.__get(('Fm', m), array_Fm_by_symmetry, (m,))
+
+    def Fml(self, m: int, l: int) -> FareyArray:
+        return self.__get(('Fml', m, l), FareyArray.from_Fml, (m, l))
+
+    def Gml(self, m: int, l: int) -> FareyArray:
+        # The subsequence F_m^{m-l} is validated (and its parameters are reported) by the generators
+        # of the module fareyiterators.py, so we check the parameters of Gml first
+        if (m < 2) or (l <= 0) or (l >= m):
+            raise ValueError("N/A: Parameters of the subsequence Gml should satisfy m > 1 and 0 < l < m")
+        return reflection(self.Fml(m, m - l))
+
+    def FBnm(self, n: int, m: int) -> FareyArray:
+        if n == 2 * m:
+            return self.__get(('FB2mm', m), array_FB2mm_by_symmetry, (m,))
+        if (n > 1) and (n < 2 * m < 2 * n):
+            return reflection(self.FBnm(n, n - m))
+        return self.__get(('FBnm', n, m), FareyArray.from_FBnm, (n, m))
+
+    def __len__(self) -> int:
+        return len(self.__arrays)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(terms.nbytes for terms in self.__arrays.values())
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__arrays.clear()
+
+    def __get(self, key: tuple, build, params: tuple) -> FareyArray:
+        with self.__lock:
+            terms = self.__arrays.get(key)
+            if terms is not None:
+                self.__arrays.move_to_end(key)
+                return terms
+        terms = build(*params)
+        with self.__lock:
+            self.__arrays[key] = terms
+            self.__arrays.move_to_end(key)
+            if len(self.__arrays) > self.__maxsize:
+                self.__arrays.popitem(last=False)
+        return terms
+
+
+def __mirror(half: Iterator[Pair], typecode: str) -> Iterator[Pair]:
+    numerators = array(typecode)
+    denominators = array(typecode)
+    for h, k in half:
+        yield h, k
+        numerators.append(h)
+        denominators.append(k)
+    if (numerators[-1], denominators[-1]) == (1, 2):
+        # The fraction 1/2 is its own image
+        numerators.pop()
+        denominators.pop()
+    for i in range(len(numerators) - 1, -1, -1):
+        k = denominators[i]
+        yield k - numerators[i], k
+
+
+def __mirrored_array(half: Iterator[Pair], typecode: str) -> FareyArray:
+    first_half = FareyArray(half, typecode)
+    numerators = array(typecode, first_half.numerators)
+    denominators = array(typecode, first_half.denominators)
+    # The fraction 1/2 (it belongs to Fm for m > 1, and to FB2mm) is its own image
+    count = len(first_half) - 1 if first_half.pair(-1) == (1, 2) else len(first_half)
+    numerators.extend(map(sub, reversed(denominators[:count]), reversed(numerators[:count])))
+    denominators.extend(reversed(denominators[:count]))
+    return FareyArray.from_buffers(numerators, denominators)
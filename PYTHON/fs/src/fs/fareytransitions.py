@@ -0,0 +1,115 @@
+# Andrey O. Matveev
+# After several selected formulas from the monograph A.O. Matveev, Farey Sequences: Duality and Maps Between Subsequences,
+# Berlin: De Gruyter, 2017, https://doi.org/10.1515/9783110547665 .
+#
+# Incremental transitions between neighboring members of the families of sequences Fm and Fml.
+#
+# The sequence F_{m+1} is obtained from Fm by inserting, between every two neighboring fractions a/b < c/d of Fm
+# such that b + d == m + 1, their mediant (a + c)/(m + 1), and nothing else. The subsequence F_m^{l+1} is obtained
+# from Fml by adding the fractions (l + 1)/k with l + 1 < k <= m and gcd(l + 1, k) == 1, that lie in ascending order
+# when k decreases.
+#
+# iter_pairs_Fm_next(previous, m) yields the pairs (h, k) of the sequence F_{m+1}, and iter_pairs_Fml_next(previous, m, l)
+# yields the pairs of the subsequence F_m^{l+1}, in ascending order, in a single pass over the previous sequence given
+# by an iterator of pairs (h, k) (say, a generator of the module fareyiterators.py or of this module) or by a FareyArray
+# or a FareyFile; only a pair of fractions is kept in memory. Every fraction costs one addition and one comparison
+# (a mediant) or one cross-multiplication (a merge), instead of a call of a recurrent function of the form
+# `successor_of_pair_of_neighbors_in_personage'.
+#
+# sweep_Fm(max_order) yields the pairs (m, FareyArray of Fm) for m == 1, 2, ..., max_order, and sweep_Fml(m) yields
+# the pairs (l, FareyArray of Fml) for l == 1, 2, ..., m - 1, each array being derived from the previous one.
+#
+# Call for instance:
+#    >>> list(iter_pairs_Fm_next(fareyiterators.iter_pairs_Fm(3), 3))
+# to get the result:
+#    [(0, 1), (1, 4), (1, 3), (1, 2), (2, 3), (3, 4), (1, 1)]
+# and call:
+#    >>> list(iter_pairs_Fml_next(fareyiterators.iter_pairs_Fml(5, 1), 5, 1))
+# to get the result:
+#    [(0, 1), (1, 5), (1, 4), (1, 3), (2, 5), (1, 2), (2, 3), (1, 1)]
+
+
+from collections.abc import Iterable, Iterator
+from math import gcd
+
+from fareyarray import FareyArray, _typecode_for
+from fareyfile import FareyFile
+from fareypairs import Pair
+
+
+def iter_pairs_Fm_next(previous: Iterable[Pair] | FareyArray | FareyFile, m: int) -> Iterator[Pair]:
+    if m < 1:
+        raise ValueError("N/A: Order m of the sequence should be > 0")
+    return __insert_mediants(__pairs_of(previous), m + 1)
+
+
+def iter_pairs_Fml_next(previous: Iterable[Pair] | FareyArray | FareyFile, m: int, l: int) -> Iterator[Pair]:
+    # The next subsequence F_m^{l+1} exists for l + 1 < m
+    if m < 2:
+        raise ValueError("N/A: Parameter m of the sequence should be > 1")
+    if (l <= 0) or (l >= m - 1):
+        raise ValueError("N/A: Parameter l should be between 0 (excluded) and (m - 1) (excluded)")
+    numerator = l + 1
+    added = ((numerator, k) for k in range(m, numerator, -1) if gcd(numerator, k) == 1)
+    return __merge(__pairs_of(previous), added)
+
+
+def sweep_Fm(max_order: int) -> Iterator[tuple[int, FareyArray]]:
+    # Call for instance:
+    #    >>> [(m, len(terms)) for m, terms in sweep_Fm(5)]
+    # to get the result:
+    #    [(1, 2), (2, 3), (3, 5), (4, 7), (5, 11)]
+    if max_order < 1:
+        raise ValueError("N/A: Order m of the sequence should be > 0")
+    typecode = _typecode_for(max_order)
+    terms = FareyArray([(0, 1), (1, 1)], typecode)
+    yield 1, terms
+    for m in range(1, max_order):
+        terms = FareyArray(__insert_mediants(terms.pairs(), m + 1), typecode)
+        yield m + 1, terms
+
+
+def sweep_Fml(m: int) -> Iterator[tuple[int, FareyArray]]:
+    # Call for instance:
+    #    >>> [(l, len(terms)) for l, terms in sweep_Fml(5)]
+    # to get the result:
+    #    [(1, 6), (2, 8), (3, 10), (4, 11)]
+    if m < 2:
+        raise ValueError("N/A: Parameter m of the sequence should be > 1")
+    typecode = _typecode_for(m)
+    terms = FareyArray([(0, 1)] + [(1, k) for k in range(m, 0, -1)], typecode)
+    yield 1, terms
+    for l in range(1, m - 1):
+        terms = FareyArray(iter_pairs_Fml_next(terms, m, l), typecode)
+        yield l + 1, terms
+
+
+def __pairs_of(previous: Iterable[Pair] | FareyArray | FareyFile) -> Iterator[Pair]:
+    if isinstance(previous, (FareyArray, FareyFile)):
+        return previous.pairs()
+    return iter(previous)
+
+
+def __insert_mediants(pairs: Iterator[Pair], order: int) -> Iterator[Pair]:
+    # The fractions of F_{m+1} that are not in Fm are the mediants
+    # of the neighboring fractions of Fm whose denominators sum up to (m + 1)
+    a, b = next(pairs)
+    yield a, b
+    for c, d in pairs:
+        if b + d == order:
+            yield a + c, order
+        yield c, d
+        a, b = c, d
+
+
+def __merge(pairs: Iterator[Pair], added: Iterator[Pair]) -> Iterator[Pair]:
+    # Merges two ascending streams of distinct fractions
+    p, q = next(added, (None, None))
+    for c, d in pairs:
+        while (p is not None) and (p * d < c * q):
+            yield p, q
+            p, q = next(added, (None, None))
+        yield c, d
+    while p is not None:
+        yield p, q
+        p, q = next(added, (None, None))
@@ -0,0 +1,7 @@
+# The modules import each other by their flat names (as `python -m fs' does from the directory src),
+# so the directory src/fs goes to the front of the module search path
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'fs'))
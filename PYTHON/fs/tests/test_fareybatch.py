@@ -0,0 +1,80 @@
+# The batch functions of the module fareybatch.py against the scalar functions of the module fareypairs.py,
+# element by element, including the codes of the invalid inputs, and around the bound of the int64 arithmetic
+
+from math import gcd
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import fareybatch
+import fareypairs
+
+
+SEED_FUNCTIONS = ['predecessor_in_Fm', 'successor_in_Fm', 'predecessor_in_Fml', 'successor_in_Fml',
+                  'predecessor_in_Gml', 'successor_in_Gml', 'predecessor_in_FBnm', 'successor_in_FBnm']
+
+# Reduced fractions with positive denominators, some of them greater than 1/1 or with too large denominators
+INPUTS = [(h, k) for k in range(1, 13) for h in range(0, k + 2) if gcd(h, k) == 1]
+
+
+def parameters(personage: str) -> list[tuple]:
+    if personage == 'Fm':
+        return [(m,) for m in range(0, 10)]
+    if personage in ('Fml', 'Gml'):
+        return [(m, l) for m in range(0, 10) for l in range(-1, m + 2)]
+    return [(n, m) for n in range(0, 11) for m in range(-1, n + 2)]
+
+
+def check_batch(name: str, params: tuple, inputs: list[tuple]) -> None:
+    numerators, denominators, status = getattr(fareybatch, name)(*params, [h for h, _ in inputs],
+                                                                 [k for _, k in inputs])
+    for i, fraction in enumerate(inputs):
+        x, y = getattr(fareypairs, name)(*params, fraction)
+        if y < 0:
+            assert (numerators[i], denominators[i], status[i]) == (0, 0, -y), (name, params, fraction)
+        else:
+            assert (numerators[i], denominators[i], status[i]) == (x, y, 0), (name, params, fraction)
+
+
+@pytest.mark.parametrize('name', SEED_FUNCTIONS)
+def test_seed_functions_agree_with_fareypairs(name):
+    for params in parameters(name.split('_in_')[1]):
+        check_batch(name, params, INPUTS)
+
+
+@pytest.mark.parametrize('personage', ['Fm', 'Fml', 'Gml', 'FBnm'])
+def test_are_neighbors_agrees_with_fareypairs(personage):
+    lefts = [left for left in INPUTS for _ in INPUTS]
+    rights = [right for _ in INPUTS for right in INPUTS]
+    arrays = ([h for h, _ in lefts], [k for _, k in lefts], [h for h, _ in rights], [k for _, k in rights])
+    for params in parameters(personage):
+        result = getattr(fareybatch, 'are_neighbors_in_' + personage)(*params, *arrays)
+        check = getattr(fareypairs, 'are_neighbors_in_' + personage)
+        assert result.tolist() == [check(*params, left, right) for left, right in zip(lefts, rights)], params
+
+
+def test_large_order_does_not_overflow():
+    # The int64 arithmetic used to overflow here, and returned a wrong successor with the status 0
+    m = 2 ** 40 + 1
+    numerators, denominators, status = fareybatch.successor_in_Fm(m, [123456789], [2 ** 40 - 3])
+    assert (numerators[0], denominators[0], status[0]) == (*fareypairs.successor_in_Fm(m, (123456789, 2 ** 40 - 3)), 0)
+
+
+@pytest.mark.parametrize('m', [fareybatch.BOUND - 1, fareybatch.BOUND])
+def test_orders_around_the_bound(m):
+    # The fractions near 0/1, 1/2 and 1/1 with the largest denominators, and a few invalid inputs
+    inputs = [(0, 1), (1, m), (1, m - 1), (m // 2, m - 1 if m % 2 else m + 1), (1, 2), (m - 1, m), (m - 2, m - 1),
+              (1, 1), (1, m + 1), (3, 2)]
+    inputs = [(h, k) for h, k in inputs if gcd(h, k) == 1]
+    for name in SEED_FUNCTIONS:
+        personage = name.split('_in_')[1]
+        params = (m,) if personage == 'Fm' else (m, m // 2) if personage in ('Fml', 'Gml') else (m, m // 3)
+        check_batch(name, params, inputs)
+
+
+def test_inputs_beyond_int64():
+    inputs = [(1, 2 ** 70), (2 ** 69, 2 ** 70 + 1)]
+    for name in ('predecessor_in_Fm', 'successor_in_Fm'):
+        check_batch(name, (2 ** 71,), inputs)
+        check_batch(name, (6,), inputs)
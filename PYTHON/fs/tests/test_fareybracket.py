@@ -0,0 +1,115 @@
+# Brute-force checks of the module fareybracket.py: the sequences are listed from their definitions for small parameters,
+# and the brackets of all of the fractions with small denominators are compared with the positions of the fractions
+# in the lists
+
+from bisect import bisect_right
+from fractions import Fraction
+from math import gcd
+
+import pytest
+
+import fareybracket
+
+
+def members(personage: str, params: tuple) -> list[Fraction]:
+    # The reduced fractions h/k, 0 <= h <= k, that satisfy the constraints of the personage, in ascending order
+    if personage == 'Fm':
+        (m,) = params
+        test = lambda h, k: k <= m
+    elif personage == 'Fml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (h <= l)
+    elif personage == 'Gml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (k - h <= m - l)
+    else:
+        n, m = params
+        test = lambda h, k: (h <= m) and (k - h <= n - m)
+    bound = params[0]
+    return sorted(Fraction(h, k) for k in range(1, bound + 1) for h in range(0, k + 1)
+                  if gcd(h, k) == 1 and test(h, k))
+
+
+def sequences(bound: int) -> list[tuple[str, tuple]]:
+    # All of the personages with the parameters below bound; FBnm with n == 2 * m is the subsequence FB2mm
+    result = []
+    for m in range(1, bound):
+        result.append(('Fm', (m,)))
+        for l in range(1, m):
+            result.append(('Fml', (m, l)))
+            result.append(('Gml', (m, l)))
+    for n in range(2, bound):
+        for m in range(1, n):
+            result.append(('FBnm', (n, m)))
+    return result
+
+
+SEQUENCES = sequences(12)
+
+# The points x == a/q with q < 30
+POINTS = sorted({Fraction(a, q) for q in range(1, 30) for a in range(0, q + 1)})
+
+FLOATS = [0.0, 0.1, 0.25, 0.3, 1 / 3, 0.5, 2 / 3, 0.7, 0.999, 1.0]
+
+
+def ids(sequence: tuple[str, tuple]) -> str:
+    return sequence[0] + str(sequence[1])
+
+
+def expected_bracket(terms: list[Fraction], x: Fraction) -> tuple[Fraction, Fraction]:
+    # left <= x < right, or left < x == right for x == 1/1
+    if x == 1:
+        return terms[-2], terms[-1]
+    i = bisect_right(terms, x)
+    return terms[i - 1], terms[i]
+
+
+def test_the_fb2mm_subsequences_are_covered():
+    assert {('FBnm', (2 * m, m)) for m in range(1, 6)} <= set(SEQUENCES)
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+def test_bracket(sequence):
+    personage, params = sequence
+    terms = members(personage, params)
+    bracket_in = getattr(fareybracket, 'bracket_in_' + personage)
+    bracket_pairs_in = getattr(fareybracket, 'bracket_pairs_in_' + personage)
+    for x in POINTS:
+        left, right = expected_bracket(terms, x)
+        assert bracket_in(*params, x) == (left, right), x
+        assert bracket_pairs_in(*params, (x.numerator, x.denominator)) == \
+            ((left.numerator, left.denominator), (right.numerator, right.denominator)), x
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+def test_bracket_of_floats(sequence):
+    # A float is taken with its exact binary value
+    personage, params = sequence
+    terms = members(personage, params)
+    bracket_in = getattr(fareybracket, 'bracket_in_' + personage)
+    for x in FLOATS:
+        assert bracket_in(*params, x) == expected_bracket(terms, Fraction(x)), x
+
+
+def test_invalid_inputs():
+    outside = [(-1, 3), (4, 3)]
+    assert fareybracket.bracket_pairs_in_Fm(0, (1, 2)) == ((1, -1), (1, -1))
+    for x in outside:
+        assert fareybracket.bracket_pairs_in_Fm(6, x) == ((1, -2), (1, -2))
+        assert fareybracket.bracket_in_Fm(6, Fraction(*x)) == (Fraction(1, -2), Fraction(1, -2))
+    for personage in ('Fml', 'Gml'):
+        bracket_pairs_in = getattr(fareybracket, 'bracket_pairs_in_' + personage)
+        assert bracket_pairs_in(1, 1, (1, 2)) == ((1, -1), (1, -1))
+        assert bracket_pairs_in(6, 0, (1, 2)) == ((1, -2), (1, -2))
+        assert bracket_pairs_in(6, 6, (1, 2)) == ((1, -2), (1, -2))
+        for x in outside:
+            assert bracket_pairs_in(6, 3, x) == ((1, -3), (1, -3))
+    assert fareybracket.bracket_pairs_in_FBnm(1, 0, (1, 2)) == ((1, -1), (1, -1))
+    assert fareybracket.bracket_pairs_in_FBnm(6, 0, (1, 2)) == ((1, -2), (1, -2))
+    assert fareybracket.bracket_pairs_in_FBnm(6, 7, (1, 2)) == ((1, -2), (1, -2))
+    for x in outside:
+        assert fareybracket.bracket_pairs_in_FBnm(6, 2, x) == ((1, -3), (1, -3))
+    # FB2mm reports its problems by its own codes
+    assert fareybracket.bracket_pairs_in_FBnm(0, 0, (1, 2)) == ((1, -1), (1, -1))
+    for x in outside:
+        assert fareybracket.bracket_pairs_in_FBnm(6, 3, x) == ((1, -2), (1, -2))
@@ -0,0 +1,47 @@
+# An enumeration of the module fareycheckpoint.py that is interrupted at any position, saved, loaded and resumed
+# yields the same fractions as the generators of the module fareyiterators.py, without losing any of them
+
+from itertools import islice
+
+import pytest
+
+import fareyiterators
+from fareycheckpoint import Cursor, iter_pairs_with_checkpoints
+
+
+SEQUENCES = [('Fm', (6,)), ('Fml', (6, 4)), ('Gml', (6, 4)), ('FBnm', (7, 3)), ('FBnm', (6, 3))]
+
+SEGMENTS = [((0, 1), (1, 1)), ((1, 3), (2, 3))]
+
+
+def ids(value) -> str:
+    return str(value)
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+@pytest.mark.parametrize('segment', SEGMENTS, ids=ids)
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('every', [1, 3, 1 << 20])
+def test_resume_after_interruption(tmp_path, sequence, segment, reverse, every):
+    personage, params = sequence
+    start, stop = segment
+    expected = list(getattr(fareyiterators, 'iter_pairs_' + personage)(*params, start, stop, reverse))
+    path = str(tmp_path / 'cursor')
+    for cut in range(len(expected) + 1):
+        cursor = Cursor(personage, params, start, stop, reverse)
+        # A generator closed before its first next() does not save the cursor, so the initial state is saved here
+        cursor.save(path)
+        enumeration = iter_pairs_with_checkpoints(cursor, path, every)
+        consumed = list(islice(enumeration, cut))
+        enumeration.close()
+        resumed = Cursor.load(path)
+        # The last fraction consumed is not counted, since the consumer has not asked for the next one
+        assert resumed.count == max(cut - 1, 0)
+        assert consumed[:resumed.count] + list(iter_pairs_with_checkpoints(resumed, path, every)) == expected, cut
+        assert Cursor.load(path).current is None
+
+
+def test_generator_closed_before_the_first_fraction_does_not_save(tmp_path):
+    path = tmp_path / 'cursor'
+    iter_pairs_with_checkpoints(Cursor('Fm', (6,)), str(path)).close()
+    assert not path.exists()
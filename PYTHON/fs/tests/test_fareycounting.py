@@ -0,0 +1,132 @@
+# Brute-force checks of the module fareycounting.py: the sequences are listed from their definitions for small parameters,
+# and the counts are compared with the positions of the fractions in the lists
+
+from bisect import bisect_right
+from fractions import Fraction
+from math import gcd
+
+import pytest
+
+import fareycounting
+
+
+def members(personage: str, params: tuple) -> list[Fraction]:
+    # The reduced fractions h/k, 0 <= h <= k, that satisfy the constraints of the personage, in ascending order
+    if personage == 'Fm':
+        (m,) = params
+        test = lambda h, k: k <= m
+    elif personage == 'Fml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (h <= l)
+    elif personage == 'Gml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (k - h <= m - l)
+    else:
+        n, m = params
+        test = lambda h, k: (h <= m) and (k - h <= n - m)
+    bound = params[0]
+    return sorted(Fraction(h, k) for k in range(1, bound + 1) for h in range(0, k + 1)
+                  if gcd(h, k) == 1 and test(h, k))
+
+
+def sequences(bound: int) -> list[tuple[str, tuple]]:
+    # All of the personages with the parameters up to bound; FBnm with n == 2 * m is the subsequence FB2mm
+    result = []
+    for m in range(1, bound + 1):
+        result.append(('Fm', (m,)))
+        for l in range(1, m):
+            result.append(('Fml', (m, l)))
+            result.append(('Gml', (m, l)))
+    for n in range(2, bound + 1):
+        for m in range(1, n):
+            result.append(('FBnm', (n, m)))
+    return result
+
+
+SEQUENCES = sequences(12)
+
+# The points x: all of the fractions with denominators up to 13, so that both members and non-members are probed
+POINTS = sorted({Fraction(h, k) for k in range(1, 14) for h in range(0, k + 1)})
+
+
+def ids(sequence: tuple[str, tuple]) -> str:
+    return sequence[0] + str(sequence[1])
+
+
+def test_the_fb2mm_subsequences_are_covered():
+    assert {('FBnm', (2 * m, m)) for m in range(1, 7)} <= set(SEQUENCES)
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+def test_rank(sequence):
+    personage, params = sequence
+    terms = members(personage, params)
+    rank = getattr(fareycounting, 'rank_in_' + personage)
+    for x in POINTS:
+        assert rank(*params, x) == bisect_right(terms, x)
+
+
+def test_rank_reports_invalid_requests():
+    assert fareycounting.rank_in_Fm(0, Fraction(1, 2)) < 0
+    assert fareycounting.rank_in_Fml(5, 5, Fraction(1, 2)) < 0
+    assert fareycounting.rank_in_Gml(5, 0, Fraction(1, 2)) < 0
+    assert fareycounting.rank_in_FBnm(5, 5, Fraction(1, 2)) < 0
+    assert fareycounting.rank_in_Fm(5, Fraction(3, 2)) < 0
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+def test_select(sequence):
+    personage, params = sequence
+    terms = members(personage, params)
+    select = getattr(fareycounting, 'select_in_' + personage)
+    assert [select(*params, k) for k in range(1, len(terms) + 1)] == terms
+    assert select(*params, 0) < 0
+    assert select(*params, len(terms) + 1) < 0
+
+
+def test_select_reports_invalid_parameters():
+    assert fareycounting.select_in_Fm(0, 1) < 0
+    assert fareycounting.select_in_Fml(5, 5, 1) < 0
+    assert fareycounting.select_in_Gml(5, 0, 1) < 0
+    assert fareycounting.select_in_FBnm(5, 5, 1) < 0
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES + [('Fm', (97,)), ('Fml', (100, 37)), ('Gml', (100, 37)),
+                                                  ('FBnm', (100, 41)), ('FBnm', (100, 50))], ids=ids)
+def test_length(sequence):
+    personage, params = sequence
+    assert getattr(fareycounting, 'length_of_' + personage)(*params) == len(members(personage, params))
+
+
+def test_length_of_Fm_at_larger_orders():
+    # The memoized values of the summatory functions are kept between calls, so the orders go down as well as up
+    assert fareycounting.length_of_Fm(1000) == 304193
+    assert fareycounting.length_of_Fm(10 ** 6) == 1 + 303963552392  # 1 + Phi(10^6), OEIS A002088
+    assert fareycounting.length_of_Fm(999) == 304193 - 400
+
+
+def test_length_reports_invalid_parameters():
+    assert fareycounting.length_of_Fm(0) == -1
+    assert fareycounting.length_of_Fml(1, 1) == -1
+    assert fareycounting.length_of_Fml(5, 5) == -2
+    assert fareycounting.length_of_Gml(5, 0) == -2
+    assert fareycounting.length_of_FBnm(1, 1) == -1
+    assert fareycounting.length_of_FBnm(5, 5) == -2
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES, ids=ids)
+def test_count_in_interval(sequence):
+    personage, params = sequence
+    terms = members(personage, params)
+    ends = POINTS[::4] + [Fraction(1, 1)]
+    for a in ends:
+        for b in ends:
+            expected = sum(1 for x in terms if a <= x <= b)
+            assert fareycounting.count_in_interval(personage, params, a, b) == expected
+
+
+def test_count_in_interval_reports_invalid_requests():
+    assert fareycounting.count_in_interval('Fm', (0,), Fraction(0, 1), Fraction(1, 1)) < 0
+    assert fareycounting.count_in_interval('FBnm', (6, 3), Fraction(0, 1), Fraction(3, 2)) < 0
+    with pytest.raises(ValueError):
+        fareycounting.count_in_interval('Hm', (6,), Fraction(0, 1), Fraction(1, 1))
@@ -0,0 +1,30 @@
+# The method bracket of the class FareyIndex gives left <= x < right (or left < x == right, for x == 1/1),
+# as the functions of the module fareybracket.py do
+
+from fractions import Fraction
+
+import pytest
+
+import fareybracket
+from fareyarray import FareyArray
+from fareyindex import FareyIndex
+
+
+@pytest.mark.parametrize('m', range(1, 12))
+def test_bracket_agrees_with_fareybracket(m):
+    index = FareyIndex()
+    index.add('Fm', (m,), FareyArray.from_Fm(m))
+    for q in range(1, 2 * m + 2):
+        for p in range(0, q + 1):
+            expected = fareybracket.bracket_pairs_in_Fm(m, (p, q))
+            assert index.bracket('Fm', (m,), (p, q)) == expected
+            assert index.bracket('Fm', (m,), Fraction(p, q)) == expected
+
+
+def test_bracket_beyond_a_partial_array():
+    terms = FareyArray.from_Fm(6)
+    index = FareyIndex()
+    index.add('Fm', (6,), terms[3:7])
+    first, last = terms.pair(3), terms.pair(6)
+    assert index.bracket('Fm', (6,), (0, 1)) == (None, first)
+    assert index.bracket('Fm', (6,), last) == (last, None)
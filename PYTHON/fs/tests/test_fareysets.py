@@ -0,0 +1,84 @@
+# Brute-force checks of the module fareysets.py: the intersections, unions and differences of the sequences are compared
+# with the set operations on the sequences listed from their definitions
+
+from fractions import Fraction
+from itertools import permutations
+from math import gcd
+
+import pytest
+
+import fareysets
+
+
+def members(personage: str, params: tuple) -> set[Fraction]:
+    # The reduced fractions h/k, 0 <= h <= k, that satisfy the constraints of the personage
+    if personage == 'Fm':
+        (m,) = params
+        test = lambda h, k: k <= m
+    elif personage == 'Fml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (h <= l)
+    elif personage == 'Gml':
+        m, l = params
+        test = lambda h, k: (k <= m) and (k - h <= m - l)
+    else:
+        n, m = params
+        test = lambda h, k: (h <= m) and (k - h <= n - m)
+    bound = params[0]
+    return {Fraction(h, k) for k in range(1, bound + 1) for h in range(0, k + 1) if gcd(h, k) == 1 and test(h, k)}
+
+
+# The five personages; FBnm with n == 2 * m is the subsequence FB2mm
+SEQUENCES = [('Fm', (7,)), ('Fml', (8, 3)), ('Gml', (8, 5)), ('FBnm', (9, 4)), ('FBnm', (8, 4))]
+
+# The segments [start, stop]; their endpoints are not necessarily members of the sequences
+SEGMENTS = [(Fraction(0, 1), Fraction(1, 1)), (Fraction(1, 3), Fraction(2, 3)), (Fraction(2, 7), Fraction(5, 9))]
+
+
+def ids(value) -> str:
+    return str(value)
+
+
+def segment_of(fractions: set[Fraction], start: Fraction, stop: Fraction) -> list[Fraction]:
+    return sorted(x for x in fractions if start <= x <= stop)
+
+
+def pairs(fractions: list[Fraction]) -> list[tuple[int, int]]:
+    return [(x.numerator, x.denominator) for x in fractions]
+
+
+@pytest.mark.parametrize('segment', SEGMENTS, ids=ids)
+@pytest.mark.parametrize('first, second', list(permutations(SEQUENCES, 2)), ids=ids)
+def test_set_operations(first, second, segment):
+    start, stop = segment
+    a, b = members(*first), members(*second)
+    bounds = {'start': (start.numerator, start.denominator), 'stop': (stop.numerator, stop.denominator)}
+    assert list(fareysets.iter_intersection(first, second, start=start, stop=stop)) == segment_of(a & b, start, stop)
+    assert list(fareysets.iter_union(first, second, start=start, stop=stop)) == segment_of(a | b, start, stop)
+    assert list(fareysets.iter_difference(first, second, start=start, stop=stop)) == segment_of(a - b, start, stop)
+    assert list(fareysets.iter_pairs_intersection(first, second, **bounds)) == pairs(segment_of(a & b, start, stop))
+    assert list(fareysets.iter_pairs_union(first, second, **bounds)) == pairs(segment_of(a | b, start, stop))
+    assert list(fareysets.iter_pairs_difference(first, second, **bounds)) == pairs(segment_of(a - b, start, stop))
+
+
+@pytest.mark.parametrize('segment', SEGMENTS, ids=ids)
+def test_operations_on_all_of_the_sequences(segment):
+    start, stop = segment
+    sets = [members(*sequence) for sequence in SEQUENCES]
+    first, others = sets[0], sets[1:]
+    assert list(fareysets.iter_intersection(*SEQUENCES, start=start, stop=stop)) == \
+        segment_of(set.intersection(*sets), start, stop)
+    assert list(fareysets.iter_union(*SEQUENCES, start=start, stop=stop)) == segment_of(set.union(*sets), start, stop)
+    assert list(fareysets.iter_difference(*SEQUENCES, start=start, stop=stop)) == \
+        segment_of(first - set.union(*others), start, stop)
+
+
+def test_invalid_requests():
+    with pytest.raises(ValueError):
+        fareysets.iter_pairs_intersection()
+    with pytest.raises(ValueError):
+        fareysets.iter_pairs_union()
+    with pytest.raises(ValueError):
+        fareysets.iter_pairs_intersection(('Fm', (6,)), ('Fq', (6,)))
+    with pytest.raises(ValueError):
+        fareysets.iter_pairs_difference(('Fm', (6,)), ('Fml', (6, 7)))
@@ -0,0 +1,65 @@
+# The sequences built by the symmetry h/k |-> (k - h)/k in the module fareysymmetry.py are compared term by term
+# with the generators of the module fareyiterators.py
+
+import pytest
+
+import fareyiterators
+import fareysymmetry
+from fareyarray import FareyArray
+
+
+@pytest.mark.parametrize('m', range(1, 16))
+def test_Fm_by_symmetry(m):
+    # The fraction 1/2 is its own image for m > 1, and F1 has no fraction between its endpoints
+    expected = list(fareyiterators.iter_pairs_Fm(m))
+    assert list(fareysymmetry.iter_pairs_Fm_by_symmetry(m)) == expected
+    assert list(fareysymmetry.array_Fm_by_symmetry(m).pairs()) == expected
+
+
+@pytest.mark.parametrize('m', range(1, 10))
+def test_FB2mm_by_symmetry(m):
+    expected = list(fareyiterators.iter_pairs_FBnm(2 * m, m))
+    assert list(fareysymmetry.iter_pairs_FB2mm_by_symmetry(m)) == expected
+    assert list(fareysymmetry.array_FB2mm_by_symmetry(m).pairs()) == expected
+
+
+@pytest.mark.parametrize('m', range(2, 12))
+def test_reflection(m):
+    for l in range(1, m):
+        assert fareysymmetry.reflection(FareyArray.from_Fml(m, l)) == FareyArray.from_Gml(m, m - l)
+        assert fareysymmetry.reflection(FareyArray.from_Gml(m, l)) == FareyArray.from_Fml(m, m - l)
+
+
+def test_dual_cache():
+    cache = fareysymmetry.DualCache(maxsize=4)
+    for m in range(2, 10):
+        assert list(cache.Fm(m).pairs()) == list(fareyiterators.iter_pairs_Fm(m))
+        for l in range(1, m):
+            assert list(cache.Fml(m, l).pairs()) == list(fareyiterators.iter_pairs_Fml(m, l))
+            # Served by the reflection of F_m^{m-l}
+            assert list(cache.Gml(m, l).pairs()) == list(fareyiterators.iter_pairs_Gml(m, l))
+    for n in range(2, 12):
+        for m in range(1, n):
+            # FB2mm is built by the symmetry, and FBnm with 2 * m > n is served by the reflection of FB(n, n - m)
+            assert list(cache.FBnm(n, m).pairs()) == list(fareyiterators.iter_pairs_FBnm(n, m))
+    assert len(cache) <= 4
+
+
+def test_dual_cache_keeps_one_of_the_dual_pair():
+    cache = fareysymmetry.DualCache()
+    cache.Gml(8, 3)
+    cache.FBnm(9, 6)
+    assert len(cache) == 2
+    cache.Fml(8, 5)
+    cache.FBnm(9, 3)
+    assert len(cache) == 2
+
+
+def test_invalid_parameters():
+    cache = fareysymmetry.DualCache()
+    with pytest.raises(ValueError):
+        fareysymmetry.DualCache(maxsize=0)
+    with pytest.raises(ValueError):
+        cache.Gml(6, 6)
+    with pytest.raises(ValueError):
+        cache.Gml(1, 1)
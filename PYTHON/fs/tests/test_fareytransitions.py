@@ -0,0 +1,53 @@
+# The sequences derived by the module fareytransitions.py from their predecessors are compared term by term
+# with the generators of the module fareyiterators.py
+
+import pytest
+
+import fareyiterators
+import fareytransitions
+from fareyarray import FareyArray
+
+
+@pytest.mark.parametrize('m', range(1, 16))
+def test_Fm_next(m):
+    expected = list(fareyiterators.iter_pairs_Fm(m + 1))
+    assert list(fareytransitions.iter_pairs_Fm_next(fareyiterators.iter_pairs_Fm(m), m)) == expected
+    assert list(fareytransitions.iter_pairs_Fm_next(FareyArray.from_Fm(m), m)) == expected
+
+
+@pytest.mark.parametrize('m', range(3, 16))
+def test_Fml_next(m):
+    for l in range(1, m - 1):
+        expected = list(fareyiterators.iter_pairs_Fml(m, l + 1))
+        assert list(fareytransitions.iter_pairs_Fml_next(fareyiterators.iter_pairs_Fml(m, l), m, l)) == expected
+        assert list(fareytransitions.iter_pairs_Fml_next(FareyArray.from_Fml(m, l), m, l)) == expected
+
+
+def test_sweep_Fm():
+    orders = []
+    for m, terms in fareytransitions.sweep_Fm(20):
+        orders.append(m)
+        assert list(terms.pairs()) == list(fareyiterators.iter_pairs_Fm(m))
+    assert orders == list(range(1, 21))
+
+
+@pytest.mark.parametrize('m', range(2, 16))
+def test_sweep_Fml(m):
+    parameters = []
+    for l, terms in fareytransitions.sweep_Fml(m):
+        parameters.append(l)
+        assert list(terms.pairs()) == list(fareyiterators.iter_pairs_Fml(m, l))
+    assert parameters == list(range(1, m))
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        fareytransitions.iter_pairs_Fm_next(iter([]), 0)
+    with pytest.raises(ValueError):
+        fareytransitions.iter_pairs_Fml_next(iter([]), 1, 1)
+    with pytest.raises(ValueError):
+        fareytransitions.iter_pairs_Fml_next(iter([]), 5, 4)
+    with pytest.raises(ValueError):
+        next(fareytransitions.sweep_Fm(0))
+    with pytest.raises(ValueError):
+        next(fareytransitions.sweep_Fml(1))
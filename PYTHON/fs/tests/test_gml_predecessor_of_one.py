@@ -0,0 +1,23 @@
+# The predecessor of 1/1 in the subsequence Gml is (m - 1)/m; the function predecessor_in_Gml used to give (l - 1)/l
+
+from fractions import Fraction
+from math import gcd
+
+import pytest
+
+import fareypairs
+import fareysequences
+
+
+def brute_force_Gml(m: int, l: int) -> list[Fraction]:
+    return sorted({Fraction(h, k) for k in range(1, m + 1) for h in range(0, k + 1)
+                   if gcd(h, k) == 1 and k - h <= m - l})
+
+
+@pytest.mark.parametrize('m', range(2, 12))
+def test_predecessor_of_one_in_Gml(m):
+    for l in range(1, m):
+        expected = brute_force_Gml(m, l)[-2]
+        assert expected == Fraction(m - 1, m)
+        assert fareysequences.predecessor_in_Gml(m, l, Fraction(1, 1)) == expected
+        assert fareypairs.predecessor_in_Gml(m, l, (1, 1)) == (m - 1, m)
@@ -0,0 +1,39 @@
+# With the environment variable FAREY_INSTRUMENTATION set, importing the module fareyinstrumentation.py enables
+# the instrumentation, whichever of the modules fareyinstrumentation.py and fareysequences.py is imported first
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'fs')
+
+CHECK = """
+from fractions import Fraction
+import fareyinstrumentation
+import fareysequences
+assert fareyinstrumentation.is_enabled()
+fareysequences.successor_in_Fm(6, Fraction(1, 3))
+assert fareyinstrumentation.snapshot()['calls'] == {'successor_in_Fm': 1}
+"""
+
+
+def run(code: str, variable: str | None) -> subprocess.CompletedProcess:
+    environment = dict(os.environ)
+    environment.pop('FAREY_INSTRUMENTATION', None)
+    if variable is not None:
+        environment['FAREY_INSTRUMENTATION'] = variable
+    return subprocess.run([sys.executable, '-c', code], cwd=SOURCE, env=environment, capture_output=True, text=True)
+
+
+@pytest.mark.parametrize('first', ['fareyinstrumentation', 'fareysequences'])
+def test_variable_enables_the_instrumentation(first):
+    result = run('import ' + first + '\n' + CHECK, '1')
+    assert result.returncode == 0, result.stderr
+
+
+def test_instrumentation_is_off_without_the_variable():
+    result = run('import fareyinstrumentation\nassert not fareyinstrumentation.is_enabled()', None)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,111 @@
+# Stress tests of the exact integer arithmetic at the orders 10^12--10^18: the neighbors computed by the modules
+# fareysequences.py and fareypairs.py are checked against the definition, in the arithmetic of the class Fraction
+
+import math
+import random
+from fractions import Fraction
+from math import gcd
+
+import pytest
+
+import fareypairs
+import fareysequences
+
+
+PERSONAGES = ('Fm', 'Fml', 'Gml', 'FBnm', 'FB2mm')
+
+
+def is_member(personage: str, params: tuple, x: Fraction) -> bool:
+    h, k = x.numerator, x.denominator
+    if not 0 <= h <= k:
+        return False
+    if personage == 'Fm':
+        return k <= params[0]
+    if personage == 'Fml':
+        return (k <= params[0]) and (h <= params[1])
+    if personage == 'Gml':
+        return (k <= params[0]) and (k - h <= params[0] - params[1])
+    return (h <= params[1]) and (k - h <= params[0] - params[1])
+
+
+def random_params(personage: str, rng: random.Random) -> tuple:
+    m = rng.randint(10 ** 12, 10 ** 18)
+    if personage == 'Fm':
+        return (m,)
+    if personage == 'FB2mm':
+        return 2 * m, m
+    return m, rng.randint(1, m - 1)
+
+
+def random_member(personage: str, params: tuple, rng: random.Random) -> Fraction:
+    # A random fraction h/k between 0/1 and 1/1 (both excluded) that satisfies the constraints; reducing it
+    # decreases both h and k - h, so it stays a member
+    while True:
+        if personage in ('FBnm', 'FB2mm'):
+            h, j = rng.randint(1, params[1]), rng.randint(1, params[0] - params[1])
+        else:
+            m = params[0]
+            k = rng.randint(2, m)
+            if personage == 'Fml':
+                h = rng.randint(1, min(k - 1, params[1]))
+            elif personage == 'Gml':
+                h = k - rng.randint(1, min(k - 1, m - params[1]))
+            else:
+                h = rng.randint(1, k - 1)
+            j = k - h
+        g = gcd(h, j)
+        x = Fraction(h // g, (h + j) // g)
+        if is_member(personage, params, x):
+            return x
+
+
+def are_neighbors(personage: str, params: tuple, left: Fraction, right: Fraction) -> bool:
+    # Both fractions are members, left < right, and no member lies strictly between them: every fraction
+    # between two unimodular fractions has the form (s*a + t*c)/(s*b + t*d) with s, t >= 1, and the constraints
+    # bound h and k - h from above, so it is enough to check the mediant
+    a, b, c, d = left.numerator, left.denominator, right.numerator, right.denominator
+    return (is_member(personage, params, left) and is_member(personage, params, right)
+            and b * c - a * d == 1 and not is_member(personage, params, Fraction(a + c, b + d)))
+
+
+def call(module, name: str, personage: str, params: tuple, *fractions):
+    suffix, params = ('FBnm', params) if personage == 'FB2mm' else (personage, params)
+    function = getattr(module, name + '_' + suffix)
+    if module is fareypairs:
+        result = function(*params, *((x.numerator, x.denominator) for x in fractions[:2]), *fractions[2:])
+        return Fraction(*result)
+    return function(*params, *fractions)
+
+
+@pytest.mark.parametrize('personage', PERSONAGES)
+def test_neighbors_at_large_orders(personage):
+    rng = random.Random(personage)
+    for _ in range(200):
+        params = random_params(personage, rng)
+        x = random_member(personage, params, rng)
+        predecessor = call(fareysequences, 'predecessor_in', personage, params, x)
+        successor = call(fareysequences, 'successor_in', personage, params, x)
+        assert are_neighbors(personage, params, predecessor, x)
+        assert are_neighbors(personage, params, x, successor)
+        assert call(fareypairs, 'predecessor_in', personage, params, x) == predecessor
+        assert call(fareypairs, 'successor_in', personage, params, x) == successor
+        # The recurrences continue from the pairs of neighbors, with and without the check of the pair
+        for module in (fareysequences, fareypairs):
+            for check_pair in (True, False):
+                assert call(module, 'successor_of_pair_of_neighbors_in', personage, params,
+                            predecessor, x, check_pair) == successor
+                assert call(module, 'predecessor_of_pair_of_neighbors_in', personage, params,
+                            x, successor, check_pair) == predecessor
+
+
+def test_ceil_div_is_exact():
+    ceil_div = getattr(fareysequences, '__ceil_div')
+    rng = random.Random(2)
+    float_errors = 0
+    for _ in range(10000):
+        a = rng.randint(-10 ** 36, 10 ** 36)
+        b = rng.randint(1, 10 ** 18)
+        assert ceil_div(a, b) == math.ceil(Fraction(a, b))
+        float_errors += ceil_div(a, b) != math.ceil(a / b)
+    # The float quotient, that the module used to take, is wrong at these magnitudes
+    assert float_errors > 0